@@ -9,18 +9,82 @@ function getSearchTerm() {
     }
 }
 
+var topPaddingFrame = null;
+var topPadding = null;
+
 function applyTopPadding() {
     // Update various absolute positions to match where the main container
     // starts. This is necessary for handling multi-line nav headers, since
     // that pushes the main container down.
-    var offset = $('body > .container').offset();
-    $('html').css('scroll-padding-top', offset.top + 'px');
-    $('.bs-sidebar.affix').css('top', offset.top + 'px');
+    var container = document.querySelector('body > .container');
+    if (!container) {
+        return;
+    }
+    // read layout once, then only write when the offset actually changed
+    var top = container.getBoundingClientRect().top + window.pageYOffset;
+    if (top === topPadding) {
+        return;
+    }
+    topPadding = top;
+    document.documentElement.style.scrollPaddingTop = top + 'px';
+    $('.bs-sidebar.affix').css('top', top + 'px');
+}
+
+function scheduleTopPadding() {
+    if (topPaddingFrame !== null) {
+        return;
+    }
+    topPaddingFrame = window.requestAnimationFrame(function() {
+        topPaddingFrame = null;
+        applyTopPadding();
+    });
+}
+
+function observeTopPadding() {
+    if (window.ResizeObserver) {
+        // resize observer callbacks run after layout, so reading the offset here does not force a reflow.
+        // the first callback is delivered as soon as the body is observed.
+        new ResizeObserver(applyTopPadding).observe(document.body);
+    } else {
+        $(window).on('resize', scheduleTopPadding);
+        scheduleTopPadding();
+    }
+}
+
+function styleTables() {
+    // tables in page content are styled at build time, this only covers tables added by other scripts
+    $('table:not(.table)').addClass('table table-striped table-hover');
+}
+
+function setupSideToc() {
+    // Improve the scrollspy behaviour when users click on a TOC item.
+    // safe to call again after the TOC is replaced: the click handler is namespaced and rebound.
+    $('.bs-sidenav a').off('click.terminal').on('click.terminal', function() {
+        var clicked = this;
+        setTimeout(function() {
+            var active = $('.nav li.active a');
+            active = active[active.length - 1];
+            if (clicked !== active) {
+                $(active).parent().removeClass("active");
+                $(clicked).parent().addClass("active");
+            }
+        }, 50);
+    });
+
+    var $body = $('body');
+    if ($body.data('bs.scrollspy')) {
+        $body.scrollspy('refresh');
+    } else {
+        $body.scrollspy({
+            target: '.bs-sidebar',
+            offset: 100
+        });
+    }
 }
 
 $(document).ready(function() {
 
-    applyTopPadding();
+    observeTopPadding();
 
     var search_term = getSearchTerm(),
         // $keyboard_modal = $('#mkdocs_keyboard_modal'),
@@ -80,25 +144,16 @@ $(document).ready(function() {
         }
     });
 
-    $('table').addClass('table table-striped table-hover');
-
-    // Improve the scrollspy behaviour when users click on a TOC item.
-    $(".bs-sidenav a").on("click", function() {
-        var clicked = this;
-        setTimeout(function() {
-            var active = $('.nav li.active a');
-            active = active[active.length - 1];
-            if (clicked !== active) {
-                $(active).parent().removeClass("active");
-                $(clicked).parent().addClass("active");
-            }
-        }, 50);
+    styleTables();
+    setupSideToc();
+    // content and TOC of pages loaded by navigation.instant
+    $(document).on('terminal:page-loaded', function() {
+        styleTables();
+        setupSideToc();
     });
 
     function showInnerDropdown(item) {
         var popup = $(item).next('.dropdown-menu');
-        popup.addClass('show');
-        $(item).addClass('open');
 
         // First, close any sibling dropdowns.
         var container = $(item).parent().parent();
@@ -108,19 +163,26 @@ $(document).ready(function() {
             }
         });
 
+        popup.addClass('show');
+        $(item).addClass('open');
+
+        // read every measurement in one batch (a single layout), then write the position in one call
         var popupMargin = 10;
-        var maxBottom = $(window).height() - popupMargin;
+        var windowHeight = document.documentElement.clientHeight;
         var bounds = item.getBoundingClientRect();
+        var popupHeight = popup.height();
+        var maxBottom = windowHeight - popupMargin;
 
-        popup.css('left', bounds.right + 'px');
-        if (bounds.top + popup.height() > maxBottom &&
-            bounds.top > $(window).height() / 2) {
+        if (bounds.top + popupHeight > maxBottom &&
+            bounds.top > windowHeight / 2) {
             popup.css({
-                'top': (bounds.bottom - popup.height()) + 'px',
+                'left': bounds.right + 'px',
+                'top': (bounds.bottom - popupHeight) + 'px',
                 'max-height': (bounds.bottom - popupMargin) + 'px',
             });
         } else {
             popup.css({
+                'left': bounds.right + 'px',
                 'top': bounds.top + 'px',
                 'max-height': (maxBottom - bounds.top) + 'px',
             });
@@ -155,13 +217,6 @@ $(document).ready(function() {
     });
 });
 
-$(window).on('resize', applyTopPadding);
-
-$('body').scrollspy({
-    target: '.bs-sidebar',
-    offset: 100
-});
-
 /* Prevent disabled links from causing a page reload */
 $("li.disabled a").click(function() {
     event.preventDefault();
@@ -0,0 +1,238 @@
+/*
+ * navigation.instant: load same-origin pages without a full page reload.
+ * The next page is fetched and only the main content, the side table of
+ * contents and the footer are swapped in.  The top and side navigation,
+ * stylesheets, fonts, scripts and the search index stay in place; only the
+ * nav items whose active state changed are replaced.
+ */
+(function (window, document) {
+    "use strict";
+
+    var MAIN_CONTENT_ID = "terminal-mkdocs-main-content";
+    var SIDE_PANEL_ID = "terminal-mkdocs-side-panel";
+    var SIDE_NAV_SELECTOR = "#" + SIDE_PANEL_ID + " > nav:first-child";
+    var SIDE_NAV_ITEM_SELECTOR = "a, span";
+    var TOP_MENU_ITEM_SELECTOR = ".terminal-menu a.menu-item";
+    var PERSISTENT_LINK_SELECTOR = [
+        ".terminal-nav a[href]",
+        "#" + SIDE_PANEL_ID + " > nav:first-child a[href]"
+    ].join(",");
+    var PAGE_LOADED_EVENT = "terminal:page-loaded";
+    var ASSET_SELECTOR = 'link[rel="stylesheet"][href], script[src]';
+
+    if (!window.fetch || !window.DOMParser || !window.history.pushState || !document.getElementById(MAIN_CONTENT_ID)) {
+        return;
+    }
+
+    var navigationCount = 0;
+    var currentPageUrl = getPageUrl(window.location.href);
+    /* recorded once: after pushState the head's relative urls no longer resolve against the page url */
+    var loadedAssetUrls = getLoadedAssetUrls();
+
+    function getPageUrl(url) {
+        return url.split("#")[0];
+    }
+
+    /* make hrefs absolute so that they keep working after the page url changes */
+    function absolutizeLinks(root, selector, baseUrl) {
+        var links = root.querySelectorAll(selector);
+        for (var i = 0; i < links.length; i++) {
+            links[i].setAttribute("href", new URL(links[i].getAttribute("href"), baseUrl).href);
+        }
+    }
+
+    function getLoadedAssetUrls() {
+        var assets = document.head.querySelectorAll(ASSET_SELECTOR);
+        var urls = [];
+        for (var i = 0; i < assets.length; i++) {
+            if (!assets[i].closest("noscript")) {
+                urls.push(assets[i].href || assets[i].src);
+            }
+        }
+        return urls;
+    }
+
+    function getAssetUrls(doc, baseUrl) {
+        var assets = doc.head.querySelectorAll(ASSET_SELECTOR);
+        var urls = [];
+        for (var i = 0; i < assets.length; i++) {
+            if (!assets[i].closest("noscript")) {
+                urls.push(new URL(assets[i].getAttribute("href") || assets[i].getAttribute("src"), baseUrl).href);
+            }
+        }
+        return urls;
+    }
+
+    /* pages are only swapped when they share the current page's layout and every asset they need is already loaded */
+    function canSwap(doc, pageUrl) {
+        var main = doc.getElementById(MAIN_CONTENT_ID);
+        return !!main &&
+            !main.querySelector("script") &&
+            !doc.querySelector(SIDE_NAV_SELECTOR) === !document.querySelector(SIDE_NAV_SELECTOR) &&
+            getAssetUrls(doc, pageUrl).every(function (url) {
+                return loadedAssetUrls.indexOf(url) !== -1;
+            });
+    }
+
+    function isInstantLink(link, event) {
+        if (event.defaultPrevented || event.button !== 0 || event.metaKey || event.ctrlKey || event.shiftKey || event.altKey) {
+            return false;
+        }
+        if ((link.target && link.target !== "_self") || link.hasAttribute("download")) {
+            return false;
+        }
+        var url = new URL(link.href, window.location.href);
+        if (url.origin !== window.location.origin || !/(\/|\.html)$/.test(url.pathname)) {
+            return false;
+        }
+        /* links to an anchor on the current page keep the default behavior */
+        return getPageUrl(url.href) !== getPageUrl(window.location.href);
+    }
+
+    /* replace the side nav items whose markup changed (the active item is rendered differently) */
+    function updateSideNav(doc, pageUrl) {
+        var currentNav = document.querySelector(SIDE_NAV_SELECTOR);
+        var nextNav = doc.querySelector(SIDE_NAV_SELECTOR);
+        if (!currentNav || !nextNav) {
+            return true;
+        }
+        absolutizeLinks(nextNav, "a[href]", pageUrl);
+        var currentItems = currentNav.querySelectorAll(SIDE_NAV_ITEM_SELECTOR);
+        var nextItems = nextNav.querySelectorAll(SIDE_NAV_ITEM_SELECTOR);
+        if (currentItems.length !== nextItems.length) {
+            return false;
+        }
+        for (var i = 0; i < currentItems.length; i++) {
+            if (currentItems[i].outerHTML !== nextItems[i].outerHTML) {
+                currentItems[i].replaceWith(document.importNode(nextItems[i], true));
+            }
+        }
+        return true;
+    }
+
+    function updateTopMenu(doc) {
+        var currentItems = document.querySelectorAll(TOP_MENU_ITEM_SELECTOR);
+        var nextItems = doc.querySelectorAll(TOP_MENU_ITEM_SELECTOR);
+        for (var i = 0; i < currentItems.length && i < nextItems.length; i++) {
+            currentItems[i].classList.toggle("active", nextItems[i].classList.contains("active"));
+        }
+    }
+
+    /* the side table of contents is everything in the side panel after the side nav */
+    function updateSideToc(doc) {
+        var currentPanel = document.getElementById(SIDE_PANEL_ID);
+        var nextPanel = doc.getElementById(SIDE_PANEL_ID);
+        if (!currentPanel || !nextPanel) {
+            return;
+        }
+        var currentNav = currentPanel.querySelector(SIDE_NAV_SELECTOR);
+        while (currentNav && currentNav.nextSibling) {
+            currentPanel.removeChild(currentNav.nextSibling);
+        }
+        var nextNav = nextPanel.querySelector(SIDE_NAV_SELECTOR);
+        var node = nextNav ? nextNav.nextSibling : nextPanel.firstChild;
+        while (node) {
+            currentPanel.appendChild(document.importNode(node, true));
+            node = node.nextSibling;
+        }
+    }
+
+    function replaceElement(doc, selector) {
+        var current = document.querySelector(selector);
+        var next = doc.querySelector(selector);
+        if (current && next) {
+            current.replaceWith(document.importNode(next, true));
+        }
+    }
+
+    function scrollToPosition(url, scrollY) {
+        var hash = url.split("#")[1];
+        var target = hash && document.getElementById(decodeURIComponent(hash));
+        if (typeof scrollY === "number") {
+            window.scrollTo(0, scrollY);
+        } else if (target) {
+            target.scrollIntoView();
+        } else {
+            window.scrollTo(0, 0);
+        }
+    }
+
+    function swapPage(doc, url, pageUrl) {
+        if (!updateSideNav(doc, pageUrl)) {
+            return false;
+        }
+        updateTopMenu(doc);
+        updateSideToc(doc);
+        replaceElement(doc, "#" + MAIN_CONTENT_ID);
+        replaceElement(doc, "footer");
+        document.title = doc.title;
+        var canonical = document.querySelector('link[rel="canonical"]');
+        var nextCanonical = doc.querySelector('link[rel="canonical"]');
+        if (canonical && nextCanonical) {
+            canonical.href = nextCanonical.href;
+        }
+        currentPageUrl = pageUrl;
+        return true;
+    }
+
+    function navigate(url, options) {
+        var navigation = ++navigationCount;
+        var pageUrl = getPageUrl(url);
+        window.fetch(pageUrl, {credentials: "same-origin", headers: {"Accept": "text/html"}}).then(function (response) {
+            var contentType = response.headers.get("content-type") || "";
+            if (!response.ok || contentType.indexOf("text/html") === -1) {
+                throw new Error("unexpected response");
+            }
+            return response.text();
+        }).then(function (html) {
+            if (navigation !== navigationCount) {
+                return;
+            }
+            var doc = new DOMParser().parseFromString(html, "text/html");
+            if (!canSwap(doc, pageUrl)) {
+                throw new Error("incompatible page");
+            }
+            if (options.push) {
+                window.history.replaceState({terminalInstant: true, scrollY: window.scrollY}, "", window.location.href);
+                window.history.pushState({terminalInstant: true}, "", url);
+            }
+            if (!swapPage(doc, url, pageUrl)) {
+                throw new Error("incompatible navigation");
+            }
+            scrollToPosition(url, options.scrollY);
+            document.dispatchEvent(new CustomEvent(PAGE_LOADED_EVENT, {detail: {url: url}}));
+        }).catch(function () {
+            if (navigation === navigationCount) {
+                window.location.assign(url);
+            }
+        });
+    }
+
+    document.addEventListener("click", function (event) {
+        var link = event.target.closest && event.target.closest("a[href]");
+        if (!link || !isInstantLink(link, event)) {
+            return;
+        }
+        event.preventDefault();
+        navigate(link.href, {push: true});
+    });
+
+    window.addEventListener("popstate", function (event) {
+        var state = event.state || {};
+        if (getPageUrl(window.location.href) === currentPageUrl) {
+            scrollToPosition(window.location.href, state.scrollY);
+        } else {
+            navigate(window.location.href, {push: false, scrollY: state.scrollY});
+        }
+    });
+
+    if ("scrollRestoration" in window.history) {
+        window.history.scrollRestoration = "manual";
+    }
+    window.history.replaceState({terminalInstant: true}, "", window.location.href);
+    absolutizeLinks(document, PERSISTENT_LINK_SELECTOR, window.location.href);
+    /* the search plugin builds result urls from base_url, which is relative to the first page */
+    if (typeof window.base_url === "string") {
+        window.base_url = new URL(window.base_url + "/", window.location.href).href;
+    }
+})(window, document);
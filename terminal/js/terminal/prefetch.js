@@ -0,0 +1,132 @@
+/*
+ * navigation.prefetch: prefetch the same-origin pages linked from the side
+ * navigation, the top navigation menu and the footer previous / next links
+ * when a link scrolls into view or is hovered, so the next page is already
+ * in the browser cache when it is clicked.
+ */
+(function (window, document) {
+    "use strict";
+
+    var MAX_CONCURRENT_PREFETCHES = 2;
+    var LINK_SELECTOR = [
+        "#terminal-mkdocs-side-panel nav a[href]",
+        ".terminal-menu a.menu-item[href]",
+        "#terminal-mkdocs-footer-prev-next a[href]"
+    ].join(",");
+
+    function isConstrainedClient() {
+        var connection = navigator.connection || navigator.mozConnection || navigator.webkitConnection;
+        if (window.terminal_adaptive && window.terminal_adaptive.lite) {
+            return true;
+        }
+        return !!(connection && (connection.saveData || /(^|slow-)2g$/.test(connection.effectiveType || "")));
+    }
+
+    if (isConstrainedClient() || !window.URL) {
+        return;
+    }
+
+    var prefetched = {};
+    var queue = [];
+    var active = 0;
+    var supportsLinkPrefetch = (function () {
+        var link = document.createElement("link");
+        return !!(link.relList && link.relList.supports && link.relList.supports("prefetch"));
+    })();
+
+    /* return the absolute url to prefetch for link, or null when it should be skipped */
+    function getPrefetchUrl(link) {
+        if (link.hasAttribute("download")) {
+            return null;
+        }
+        var url = new URL(link.href, window.location.href);
+        if (url.origin !== window.location.origin || !/^https?:$/.test(url.protocol)) {
+            return null;
+        }
+        url.hash = "";
+        if (url.href === window.location.href.split("#")[0]) {
+            return null;
+        }
+        return url.href;
+    }
+
+    function prefetch(url, done) {
+        if (supportsLinkPrefetch) {
+            var link = document.createElement("link");
+            link.rel = "prefetch";
+            link.href = url;
+            link.onload = link.onerror = done;
+            document.head.appendChild(link);
+        } else if (window.fetch) {
+            window.fetch(url, {credentials: "same-origin"}).then(done, done);
+        } else {
+            done();
+        }
+    }
+
+    function processQueue() {
+        while (active < MAX_CONCURRENT_PREFETCHES && queue.length) {
+            active++;
+            prefetch(queue.shift(), function () {
+                active--;
+                processQueue();
+            });
+        }
+    }
+
+    /* hovered links jump the queue of links which are only visible */
+    function enqueue(link, urgent) {
+        var url = getPrefetchUrl(link);
+        if (!url || prefetched[url]) {
+            return;
+        }
+        prefetched[url] = true;
+        if (urgent) {
+            queue.unshift(url);
+        } else {
+            queue.push(url);
+        }
+        processQueue();
+    }
+
+    function onHover(event) {
+        var link = event.target.closest && event.target.closest(LINK_SELECTOR);
+        if (link) {
+            enqueue(link, true);
+        }
+    }
+
+    function observeLinks() {
+        var links = document.querySelectorAll(LINK_SELECTOR);
+        if (!("IntersectionObserver" in window)) {
+            return;
+        }
+        var observer = new IntersectionObserver(function (entries) {
+            entries.forEach(function (entry) {
+                if (entry.isIntersecting) {
+                    observer.unobserve(entry.target);
+                    enqueue(entry.target, false);
+                }
+            });
+        });
+        for (var i = 0; i < links.length; i++) {
+            observer.observe(links[i]);
+        }
+    }
+
+    document.addEventListener("mouseover", onHover, {passive: true});
+    document.addEventListener("focusin", onHover, {passive: true});
+    document.addEventListener("touchstart", onHover, {passive: true});
+
+    /* observe the links of pages loaded by navigation.instant */
+    document.addEventListener("terminal:page-loaded", observeLinks);
+
+    /* wait until the page has loaded so prefetches never compete with the current page */
+    window.addEventListener("load", function () {
+        if (window.requestIdleCallback) {
+            window.requestIdleCallback(observeLinks, {timeout: 2000});
+        } else {
+            window.setTimeout(observeLinks, 1);
+        }
+    });
+})(window, document);
@@ -0,0 +1,102 @@
+from mkdocs.plugins import BasePlugin
+from mkdocs.config import base, config_options as c
+from mkdocs.commands.build import DuplicateFilter
+from jinja2 import pass_context
+from fnmatch import fnmatch
+from pathlib import Path
+from urllib.parse import quote
+import posixpath
+import os
+import hashlib
+import json
+import logging
+DEFAULT_MANIFEST_FILE_NAME = "assets-manifest.json"
+DEFAULT_HASH_LENGTH = 8
+DEFAULT_ASSET_PATTERNS = [
+    "css/*.css",
+    "css/fontawesome/css/*.css",
+    "css/palettes/*.css",
+    "css/search/*.css",
+    "js/*/*.js",
+    "img/*"
+]
+
+
+class FingerprintPluginConfig(base.Config):
+    patterns = c.ListOfItems(c.Type(str), default=DEFAULT_ASSET_PATTERNS)
+    hash_length = c.Type(int, default=DEFAULT_HASH_LENGTH)
+    manifest = c.Type(str, default=DEFAULT_MANIFEST_FILE_NAME)
+
+
+class FingerprintPlugin(BasePlugin[FingerprintPluginConfig]):
+
+    def __init__(self):
+        self.manifest = {}
+
+    def on_files(self, files, config, **kwargs):
+        self.manifest = {}
+        theme_dirs = [Path(theme_dir).resolve() for theme_dir in config.theme.dirs]
+        for file in files:
+            if file.is_documentation_page() or not is_theme_file(file, theme_dirs) or not self.is_fingerprinted(file.src_uri):
+                continue
+            fingerprinted_uri = make_fingerprinted_uri(file.dest_uri, get_file_content(file), self.config.hash_length)
+            self.manifest[file.dest_uri] = fingerprinted_uri
+            set_dest_uri(file, fingerprinted_uri)
+        logger.debug("FingerprintPlugin::on_files::fingerprinted %d assets", len(self.manifest))
+        return files
+
+    def on_env(self, env, config, files, **kwargs):
+        env.filters["url"] = self.create_url_filter(env.filters["url"])
+        return env
+
+    def on_post_build(self, config, **kwargs):
+        manifest_path = Path(config.site_dir) / self.config.manifest
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(json.dumps(self.manifest, indent=2, sort_keys=True), encoding="utf-8")
+        logger.debug("FingerprintPlugin::on_post_build::wrote manifest: %s", manifest_path)
+        return
+
+    def is_fingerprinted(self, src_uri):
+        return any(fnmatch(src_uri, pattern) for pattern in self.config.patterns)
+
+    def create_url_filter(self, url_filter):
+        """returns a url filter which maps asset paths to their fingerprinted path before calling url_filter"""
+        manifest = self.manifest
+
+        @pass_context
+        def fingerprinted_url_filter(context, value):
+            return url_filter(context, manifest.get(str(value), value))
+        return fingerprinted_url_filter
+
+
+def is_theme_file(file, theme_dirs):
+    """returns True when file comes from one of theme_dirs.  files from docs_dir (ex: tile images) keep their names."""
+    if file.abs_src_path is None:
+        return False
+    path = Path(file.abs_src_path).resolve()
+    return any(theme_dir == path or theme_dir in path.parents for theme_dir in theme_dirs)
+
+
+def get_file_content(file):
+    if file.abs_src_path is not None:
+        return Path(file.abs_src_path).read_bytes()
+    return file.content_bytes
+
+
+def make_fingerprinted_uri(uri, content, hash_length=DEFAULT_HASH_LENGTH):
+    """returns uri with a content hash inserted before the file extension.  ex: css/terminal.css -> css/terminal.1a2b3c4d.css"""
+    digest = hashlib.sha256(content).hexdigest()[:hash_length]
+    stem, extension = posixpath.splitext(uri)
+    return "%s.%s%s" % (stem, digest, extension)
+
+
+def set_dest_uri(file, dest_uri):
+    """updates the destination of file along with the attributes MkDocs derives from it"""
+    file.dest_uri = dest_uri
+    file.url = quote(dest_uri)
+    file.abs_dest_path = os.path.normpath(os.path.join(file.dest_dir, dest_uri))
+
+
+# Set up logging
+logger = logging.getLogger("mkdocs.terminal.fingerprint")
+logger.addFilter(DuplicateFilter())
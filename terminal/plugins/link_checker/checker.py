@@ -0,0 +1,275 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from html.parser import HTMLParser
+from pathlib import Path
+from queue import Queue, Empty
+from threading import Lock
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urldefrag, urljoin, urlsplit
+import http.client
+import json
+import time
+EXTERNAL_SCHEMES = ("http", "https")
+URL_ATTRIBUTES = ("href", "src")
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 4
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+# failures are often temporary, so they are checked again sooner than successes
+DEFAULT_FAILURE_CACHE_TTL = 60 * 60
+DEFAULT_USER_AGENT = "mkdocs-terminal-link-checker"
+MAX_REDIRECTS = 5
+# servers which reject HEAD requests are retried with GET
+RETRY_WITH_GET_STATUSES = (403, 405, 501)
+# raised when a pooled keep-alive connection was closed by the server since its last response
+STALE_CONNECTION_ERRORS = (http.client.BadStatusLine, ConnectionResetError, BrokenPipeError)
+
+
+@dataclass
+class LinkResult:
+    url: str
+    status: Optional[int]
+    error: Optional[str]
+    checked_at: float
+
+    @property
+    def ok(self):
+        return self.error is None and self.status is not None and self.status < 400
+
+
+class ExternalUrlParser(HTMLParser):
+    """collects absolute http(s) urls from href and src attributes"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.urls = []
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if name in URL_ATTRIBUTES and value and is_external_url(value):
+                self.urls.append(normalize_url(value))
+
+
+def is_external_url(url):
+    return urlsplit(str(url).strip()).scheme.lower() in EXTERNAL_SCHEMES
+
+
+def normalize_url(url):
+    """returns url without surrounding whitespace or a #fragment"""
+    return urldefrag(str(url).strip())[0]
+
+
+def extract_external_urls(html):
+    parser = ExternalUrlParser()
+    parser.feed(html)
+    parser.close()
+    return parser.urls
+
+
+def extract_tile_urls(page_meta):
+    """returns external link_href / img_src values from the tiles in a page's meta"""
+    urls = []
+    if not isinstance(page_meta, dict):
+        return urls
+    tiles = page_meta.get("tiles") or []
+    if not isinstance(tiles, list):
+        return urls
+    for tile in tiles:
+        if not isinstance(tile, dict):
+            continue
+        for key in ("link_href", "img_src"):
+            value = tile.get(key)
+            if value and is_external_url(value):
+                urls.append(normalize_url(value))
+    return urls
+
+
+class LinkCache:
+    """json file backed cache of link results.  successes expire after ttl seconds and failures after failure_ttl seconds"""
+
+    def __init__(self, path, ttl=DEFAULT_CACHE_TTL, failure_ttl=DEFAULT_FAILURE_CACHE_TTL):
+        self.path = Path(path) if path else None
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.results: Dict[str, LinkResult] = {}
+
+    def load(self):
+        if self.path is None or not self.path.exists():
+            return self
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self
+        self.results = {url: LinkResult(**result) for url, result in data.items()}
+        return self
+
+    def save(self):
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {url: asdict(result) for url, result in sorted(self.results.items())}
+        self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    def get(self, url, now=None):
+        """returns the cached result for url unless it has expired"""
+        result = self.results.get(url)
+        now = time.time() if now is None else now
+        if result is None:
+            return None
+        ttl = self.ttl if result.ok else self.failure_ttl
+        if now - result.checked_at > ttl:
+            return None
+        return result
+
+    def put(self, result):
+        self.results[result.url] = result
+
+
+class HostConnectionPool:
+    """pool of keep-alive connections to a single host with a request rate limit"""
+
+    def __init__(self, scheme, netloc, max_connections, requests_per_second, timeout):
+        self.scheme = scheme
+        self.netloc = netloc
+        self.timeout = timeout
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self.idle = Queue()
+        self.slots = Queue()
+        for _ in range(max_connections):
+            self.slots.put(None)
+        self.lock = Lock()
+        self.next_request_time = 0.0
+        self.connections_created = 0
+
+    def create_connection(self):
+        self.connections_created += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(self.netloc, timeout=self.timeout)
+
+    def acquire(self, fresh=False):
+        self.slots.get()
+        if fresh:
+            return self.create_connection()
+        try:
+            return self.idle.get_nowait()
+        except Empty:
+            return self.create_connection()
+
+    def release(self, connection, reusable):
+        if reusable:
+            self.idle.put(connection)
+        else:
+            connection.close()
+        self.slots.put(None)
+
+    def wait_for_turn(self):
+        with self.lock:
+            now = time.monotonic()
+            request_time = max(now, self.next_request_time)
+            self.next_request_time = request_time + self.interval
+        if request_time > now:
+            time.sleep(request_time - now)
+
+    def request(self, method, path, headers):
+        """returns (status, location header) for a request made on a pooled connection.
+
+        a request which fails because the server closed the connection is retried once on a fresh connection.
+        """
+        self.wait_for_turn()
+        try:
+            return self.send(self.acquire(), method, path, headers)
+        except STALE_CONNECTION_ERRORS:
+            return self.send(self.acquire(fresh=True), method, path, headers)
+
+    def send(self, connection, method, path, headers):
+        reusable = False
+        try:
+            connection.request(method, path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            reusable = not response.will_close
+            return response.status, response.getheader("Location")
+        finally:
+            self.release(connection, reusable)
+
+    def close(self):
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except Empty:
+                return
+
+
+class LinkChecker:
+    """checks external urls concurrently using one connection pool per host"""
+
+    def __init__(self, cache=None, timeout=DEFAULT_TIMEOUT, max_workers=DEFAULT_MAX_WORKERS,
+                 max_connections_per_host=DEFAULT_MAX_CONNECTIONS_PER_HOST,
+                 requests_per_second=DEFAULT_REQUESTS_PER_SECOND, user_agent=DEFAULT_USER_AGENT):
+        self.cache = cache if cache is not None else LinkCache(None)
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.max_connections_per_host = max_connections_per_host
+        self.requests_per_second = requests_per_second
+        self.headers = {"User-Agent": user_agent}
+        self.pools: Dict[tuple, HostConnectionPool] = {}
+        self.pools_lock = Lock()
+
+    def get_pool(self, scheme, netloc):
+        key = (scheme, netloc)
+        with self.pools_lock:
+            if key not in self.pools:
+                self.pools[key] = HostConnectionPool(scheme, netloc, self.max_connections_per_host, self.requests_per_second, self.timeout)
+            return self.pools[key]
+
+    def check(self, urls: Iterable[str]) -> List[LinkResult]:
+        """returns a result for every url.  unexpired cached results are reused without a request."""
+        unique_urls = sorted(set(urls))
+        results = {}
+        pending = []
+        for url in unique_urls:
+            cached = self.cache.get(url)
+            if cached is not None:
+                results[url] = cached
+            else:
+                pending.append(url)
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for result in executor.map(self.check_url, pending):
+                    self.cache.put(result)
+                    results[result.url] = result
+        self.close()
+        return [results[url] for url in unique_urls]
+
+    def check_url(self, url):
+        target = url
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                status, location = self.request("HEAD", target)
+                if status in RETRY_WITH_GET_STATUSES:
+                    status, location = self.request("GET", target)
+                if 300 <= status < 400 and location:
+                    target = resolve_redirect(target, location)
+                    continue
+                return LinkResult(url=url, status=status, error=None, checked_at=time.time())
+            return LinkResult(url=url, status=status, error="too many redirects", checked_at=time.time())
+        except (OSError, http.client.HTTPException, ValueError) as error:
+            return LinkResult(url=url, status=None, error=str(error) or error.__class__.__name__, checked_at=time.time())
+
+    def request(self, method, url):
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        return self.get_pool(parts.scheme.lower(), parts.netloc).request(method, path, self.headers)
+
+    def close(self):
+        with self.pools_lock:
+            for pool in self.pools.values():
+                pool.close()
+
+
+def resolve_redirect(url, location):
+    return urljoin(url, location)
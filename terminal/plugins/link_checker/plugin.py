@@ -0,0 +1,88 @@
+from mkdocs.plugins import BasePlugin
+from mkdocs.config import base, config_options as c
+from mkdocs.commands.build import DuplicateFilter
+from mkdocs.exceptions import PluginError
+from terminal.plugins.link_checker.checker import (
+    LinkCache, LinkChecker, extract_external_urls, extract_tile_urls,
+    DEFAULT_CACHE_TTL, DEFAULT_FAILURE_CACHE_TTL, DEFAULT_TIMEOUT, DEFAULT_MAX_WORKERS, DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_REQUESTS_PER_SECOND, DEFAULT_USER_AGENT
+)
+from collections import defaultdict
+from fnmatch import fnmatch
+from pathlib import Path
+import os
+import logging
+DEFAULT_CACHE_FILE = ".cache/terminal/link-checker.json"
+
+
+class LinkCheckerPluginConfig(base.Config):
+    enabled = c.Type(bool, default=True)
+    strict = c.Type(bool, default=False)
+    exclude = c.ListOfItems(c.Type(str), default=[])
+    cache_file = c.Type(str, default=DEFAULT_CACHE_FILE)
+    cache_ttl = c.Type(int, default=DEFAULT_CACHE_TTL)
+    failure_cache_ttl = c.Type(int, default=DEFAULT_FAILURE_CACHE_TTL)
+    timeout = c.Type((int, float), default=DEFAULT_TIMEOUT)
+    max_workers = c.Type(int, default=DEFAULT_MAX_WORKERS)
+    max_connections_per_host = c.Type(int, default=DEFAULT_MAX_CONNECTIONS_PER_HOST)
+    requests_per_second = c.Type((int, float), default=DEFAULT_REQUESTS_PER_SECOND)
+    user_agent = c.Type(str, default=DEFAULT_USER_AGENT)
+
+
+class LinkCheckerPlugin(BasePlugin[LinkCheckerPluginConfig]):
+
+    def __init__(self):
+        self.pages_by_url = defaultdict(set)
+        self.results = []
+
+    def on_pre_build(self, config, **kwargs):
+        self.pages_by_url = defaultdict(set)
+        self.results = []
+
+    def on_post_page(self, output, page, config, **kwargs):
+        if not self.config.enabled:
+            return output
+        urls = extract_external_urls(output) + extract_tile_urls(page.meta)
+        for url in urls:
+            if not self.is_excluded(url):
+                self.pages_by_url[url].add(page.file.src_uri)
+        return output
+
+    def on_post_build(self, config, **kwargs):
+        if not self.config.enabled or not self.pages_by_url:
+            return
+        cache = LinkCache(self.get_cache_file(config), ttl=self.config.cache_ttl, failure_ttl=self.config.failure_cache_ttl).load()
+        checker = LinkChecker(
+            cache=cache,
+            timeout=self.config.timeout,
+            max_workers=self.config.max_workers,
+            max_connections_per_host=self.config.max_connections_per_host,
+            requests_per_second=self.config.requests_per_second,
+            user_agent=self.config.user_agent
+        )
+        self.results = checker.check(self.pages_by_url)
+        cache.save()
+
+        broken = [result for result in self.results if not result.ok]
+        for result in broken:
+            reason = result.error if result.error else "HTTP %d" % result.status
+            pages = ", ".join(sorted(self.pages_by_url[result.url]))
+            logger.warning("broken external link %s (%s) on: %s" % (result.url, reason, pages))
+        logger.info("checked %d external links (%d broken)" % (len(self.results), len(broken)))
+        if broken and self.config.strict:
+            raise PluginError("link checker found %d broken external links" % len(broken))
+        return
+
+    def is_excluded(self, url):
+        return any(fnmatch(url, pattern) for pattern in self.config.exclude)
+
+    def get_cache_file(self, config):
+        cache_file = Path(self.config.cache_file)
+        if not cache_file.is_absolute() and config.config_file_path:
+            cache_file = Path(os.path.dirname(config.config_file_path)) / cache_file
+        return cache_file.resolve()
+
+
+# Set up logging
+logger = logging.getLogger("mkdocs.terminal.link_checker")
+logger.addFilter(DuplicateFilter())
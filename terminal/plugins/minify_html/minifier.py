@@ -0,0 +1,99 @@
+import re
+TOKEN_PATTERN = re.compile(
+    r"(?P<comment><!--.*?-->)"
+    r"|(?P<tag></?(?P<name>[A-Za-z][A-Za-z0-9:-]*)(?:[^>\"']|\"[^\"]*\"|'[^']*')*>)"
+    r"|(?P<declaration><![^>]*>)"
+    r"|(?P<text>[^<]+|<)",
+    re.DOTALL
+)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+# elements whose content is emitted exactly as written
+RAW_TEXT_ELEMENTS = frozenset(["script", "style"])
+PRESERVED_ELEMENTS = frozenset(["pre", "code", "textarea"])
+# whitespace next to these elements does not affect rendering
+BLOCK_ELEMENTS = frozenset([
+    "address", "article", "aside", "blockquote", "body", "br", "dd", "details", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "head", "header", "hr", "html", "li", "link", "main", "meta", "nav", "ol", "p", "section",
+    "summary", "table", "tbody", "td", "tfoot", "th", "thead", "title", "tr", "ul", "script",
+    "style", "noscript", "!doctype"
+])
+
+
+def collapse_whitespace(text):
+    """collapses each whitespace run to a single newline (if the run spans lines) or space"""
+    return WHITESPACE_PATTERN.sub(lambda match: "\n" if "\n" in match.group(0) else " ", text)
+
+
+def get_tag_name(token):
+    return token.lstrip("</!").split(None, 1)[0].rstrip("/>").lower()
+
+
+def is_block_boundary(token):
+    return token is not None and token.startswith("<") and get_tag_name(token) in BLOCK_ELEMENTS
+
+
+def minify_html(html, remove_comments=True):
+    """returns html with insignificant whitespace and comments removed.
+
+    html is processed as a single pass over a stream of tokens.  content inside
+    <pre>, <code>, <textarea>, <script> and <style> is emitted unchanged.
+    conditional comments (<!--[if ...]>) are always kept.
+    """
+    output = []
+    pending_whitespace = None
+    preserve_depth = 0
+    position = 0
+    length = len(html)
+    lowered_html = None
+
+    while position < length:
+        match = TOKEN_PATTERN.match(html, position)
+        position = match.end()
+        token = match.group(0)
+
+        if preserve_depth:
+            output.append(token)
+            if match.group("tag"):
+                name = match.group("name").lower()
+                if name in PRESERVED_ELEMENTS and not token.endswith("/>"):
+                    preserve_depth += -1 if token.startswith("</") else 1
+            continue
+
+        if match.group("text") is not None:
+            if token.strip():
+                if pending_whitespace is not None:
+                    output.append(pending_whitespace)
+                    pending_whitespace = None
+                output.append(collapse_whitespace(token))
+            else:
+                previous = output[-1] if output else None
+                pending_whitespace = None if is_block_boundary(previous) else collapse_whitespace(token)
+            continue
+
+        if match.group("comment"):
+            if remove_comments and not token.startswith("<!--[if"):
+                continue
+        elif pending_whitespace is not None and is_block_boundary(token):
+            pending_whitespace = None
+
+        if pending_whitespace is not None:
+            output.append(pending_whitespace)
+            pending_whitespace = None
+        output.append(token)
+
+        if match.group("tag") and not token.startswith("</"):
+            name = match.group("name").lower()
+            if name in RAW_TEXT_ELEMENTS:
+                if lowered_html is None:
+                    lowered_html = html.lower()
+                end = lowered_html.find("</%s" % name, position)
+                end = length if end == -1 else end
+                output.append(html[position:end])
+                position = end
+            elif name in PRESERVED_ELEMENTS and not token.endswith("/>"):
+                preserve_depth = 1
+
+    if pending_whitespace is not None:
+        output.append(pending_whitespace)
+    return "".join(output)
@@ -0,0 +1,30 @@
+from mkdocs.plugins import BasePlugin
+from mkdocs.config import base, config_options as c
+from mkdocs.commands.build import DuplicateFilter
+from terminal.plugins.minify_html.minifier import minify_html
+import logging
+
+
+class MinifyHtmlPluginConfig(base.Config):
+    remove_comments = c.Type(bool, default=True)
+
+
+class MinifyHtmlPlugin(BasePlugin[MinifyHtmlPluginConfig]):
+
+    def minify(self, output):
+        return minify_html(output, remove_comments=self.config.remove_comments)
+
+    def on_post_page(self, output, page, config, **kwargs):
+        minified = self.minify(output)
+        logger.debug("MinifyHtmlPlugin::on_post_page::%s: %d -> %d bytes", page.file.src_uri, len(output), len(minified))
+        return minified
+
+    def on_post_template(self, output_content, template_name, config, **kwargs):
+        if not template_name.endswith(".html"):
+            return output_content
+        return self.minify(output_content)
+
+
+# Set up logging
+logger = logging.getLogger("mkdocs.terminal.minify_html")
+logger.addFilter(DuplicateFilter())
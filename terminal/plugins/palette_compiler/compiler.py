@@ -0,0 +1,136 @@
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+LICENSE_COMMENT_PATTERN = re.compile(r"/\*!.*?\*/", re.DOTALL)
+COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+ROOT_BLOCK_PATTERN = re.compile(r":root\s*\{([^{}]*)\}", re.DOTALL)
+DECLARATION_PATTERN = re.compile(r"(--[A-Za-z0-9_-]+)\s*:\s*([^;]+);?")
+VAR_REFERENCE_PATTERN = re.compile(r"var\(\s*(--[A-Za-z0-9_-]+)\s*(?:,\s*([^()]*(?:\([^()]*\)[^()]*)*))?\)")
+MAX_RESOLVE_DEPTH = 16
+DEFAULT_INDENT = "    "
+
+
+@dataclass
+class CompiledPalette:
+    """result of flattening a single palette stylesheet"""
+    name: str
+    css: str
+    variables: Dict[str, str] = field(default_factory=OrderedDict)
+    dropped: List[str] = field(default_factory=list)
+    undefined: List[str] = field(default_factory=list)
+
+
+def strip_comments(css_text):
+    """returns css_text without any /* ... */ comments"""
+    return COMMENT_PATTERN.sub("", css_text)
+
+
+def parse_root_variables(css_text):
+    """returns OrderedDict of custom properties declared in :root blocks.  later declarations win."""
+    variables = OrderedDict()
+    for root_match in ROOT_BLOCK_PATTERN.finditer(strip_comments(css_text)):
+        for declaration in DECLARATION_PATTERN.finditer(root_match.group(1)):
+            name = declaration.group(1)
+            # re-insert so that the surviving declaration keeps its final position
+            variables.pop(name, None)
+            variables[name] = declaration.group(2).strip()
+    return variables
+
+
+def find_variable_references(css_texts: Iterable[str]) -> Set[str]:
+    """returns the set of custom property names read via var() in any of css_texts"""
+    references = set()
+    for css_text in css_texts:
+        for match in VAR_REFERENCE_PATTERN.finditer(strip_comments(css_text)):
+            references.add(match.group(1))
+            if match.group(2):
+                references.update(find_variable_references([match.group(2)]))
+    return references
+
+
+def resolve_value(value, palette_variables, known_variables, undefined, depth=0):
+    """inlines var() references to palette variables.
+
+    references to variables the palette does not define are left in place so that they keep
+    resolving at runtime.  references which are not defined anywhere (and have no fallback)
+    are recorded in `undefined`.
+    """
+    if depth > MAX_RESOLVE_DEPTH:
+        return value
+
+    def substitute(match):
+        name = match.group(1)
+        fallback = match.group(2)
+        if name in palette_variables:
+            return resolve_value(palette_variables[name], palette_variables, known_variables, undefined, depth + 1)
+        if name not in known_variables:
+            if fallback is not None:
+                return resolve_value(fallback.strip(), palette_variables, known_variables, undefined, depth + 1)
+            if name not in undefined:
+                undefined.append(name)
+        return match.group(0)
+
+    return VAR_REFERENCE_PATTERN.sub(substitute, value)
+
+
+def normalize_whitespace(value):
+    return " ".join(value.split())
+
+
+def get_license_comments(css_text):
+    """returns the /*! ... */ comments which must be preserved in the compiled output"""
+    return LICENSE_COMMENT_PATTERN.findall(css_text)
+
+
+def get_non_root_css(css_text):
+    """returns any rules in css_text other than the :root blocks and comments"""
+    return ROOT_BLOCK_PATTERN.sub("", strip_comments(css_text)).strip()
+
+
+def render_palette(license_comments, variables, extra_css="", indent=DEFAULT_INDENT):
+    """renders compiled palette css text"""
+    lines = list(license_comments)
+    if lines:
+        lines.append("")
+    if variables:
+        lines.append(":root {")
+        for name, value in variables.items():
+            lines.append("%s%s: %s;" % (indent, name, value))
+        lines.append("}")
+    if extra_css:
+        lines.append(extra_css)
+    return "\n".join(lines) + "\n"
+
+
+def compile_palette(name, palette_css, theme_css_texts, keep: Optional[Iterable[str]] = None):
+    """flattens palette_css into a single :root block.
+
+    - var() chains between the palette's own variables are resolved to literal values
+    - palette variables which are not read by any of theme_css_texts (and are not listed in keep) are dropped
+    - palette variables which redeclare the theme's :root value unchanged are dropped
+    - references to variables which are not defined by the palette or the theme are reported as undefined
+    """
+    keep = set(keep or [])
+    palette_variables = parse_root_variables(palette_css)
+    theme_variables: Dict[str, str] = OrderedDict()
+    for css_text in theme_css_texts:
+        theme_variables.update(parse_root_variables(css_text))
+    known_variables = set(palette_variables) | set(theme_variables)
+    used_variables = find_variable_references(theme_css_texts) | keep
+
+    undefined: List[str] = []
+    compiled = OrderedDict()
+    dropped = []
+    for variable_name, value in palette_variables.items():
+        resolved = resolve_value(value, palette_variables, known_variables, undefined)
+        is_used = variable_name in used_variables
+        is_redundant = variable_name not in keep and normalize_whitespace(theme_variables.get(variable_name, "")) == normalize_whitespace(resolved)
+        if is_used and not is_redundant:
+            compiled[variable_name] = resolved
+        else:
+            dropped.append(variable_name)
+
+    css = render_palette(get_license_comments(palette_css), compiled, get_non_root_css(palette_css))
+    return CompiledPalette(name=name, css=css, variables=compiled, dropped=dropped, undefined=undefined)
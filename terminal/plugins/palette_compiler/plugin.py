@@ -0,0 +1,52 @@
+from mkdocs.plugins import BasePlugin
+from mkdocs.config import base, config_options as c
+from mkdocs.commands.build import DuplicateFilter
+from terminal.plugins.palette_compiler.compiler import compile_palette
+from pathlib import Path
+import posixpath
+import logging
+PALETTES_URI_PREFIX = "css/palettes/"
+
+
+class PaletteCompilerPluginConfig(base.Config):
+    keep = c.ListOfItems(c.Type(str), default=[])
+
+
+class PaletteCompilerPlugin(BasePlugin[PaletteCompilerPluginConfig]):
+
+    def __init__(self):
+        self.palette_files = []
+        self.stylesheet_files = []
+
+    def on_files(self, files, config, **kwargs):
+        self.palette_files = []
+        self.stylesheet_files = []
+        for file in files:
+            if not file.src_uri.endswith(".css") or file.abs_src_path is None:
+                continue
+            if file.src_uri.startswith(PALETTES_URI_PREFIX):
+                self.palette_files.append(file)
+            else:
+                self.stylesheet_files.append(file)
+        logger.debug("PaletteCompilerPlugin::on_files::palettes: %s", [file.src_uri for file in self.palette_files])
+        return files
+
+    def on_post_build(self, config, **kwargs):
+        theme_css_texts = [read_text(file.abs_src_path) for file in self.stylesheet_files]
+        for file in self.palette_files:
+            name = posixpath.splitext(posixpath.basename(file.src_uri))[0]
+            compiled = compile_palette(name, read_text(file.abs_src_path), theme_css_texts, keep=self.config.keep)
+            for variable_name in compiled.undefined:
+                logger.warning("palette '%s' references undefined CSS variable '%s'" % (name, variable_name))
+            logger.debug("PaletteCompilerPlugin::on_post_build::%s dropped: %s", name, compiled.dropped)
+            Path(file.abs_dest_path).write_text(compiled.css, encoding="utf-8")
+        return
+
+
+def read_text(path):
+    return Path(path).read_text(encoding="utf-8")
+
+
+# Set up logging
+logger = logging.getLogger("mkdocs.terminal.palette_compiler")
+logger.addFilter(DuplicateFilter())
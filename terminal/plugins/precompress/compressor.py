@@ -0,0 +1,92 @@
+from pathlib import Path
+import hashlib
+import shutil
+import gzip
+import io
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is an optional dependency
+    brotli = None
+GZIP = "gzip"
+BROTLI = "brotli"
+FORMAT_EXTENSIONS = {
+    GZIP: ".gz",
+    BROTLI: ".br"
+}
+
+
+def is_format_available(compression_format):
+    if compression_format == BROTLI:
+        return brotli is not None
+    return compression_format in FORMAT_EXTENSIONS
+
+
+def compress(content, compression_format):
+    if compression_format == GZIP:
+        return gzip_compress(content)
+    if compression_format == BROTLI:
+        return brotli.compress(content, quality=11)
+    raise ValueError("unsupported compression format: %s" % compression_format)
+
+
+def gzip_compress(content):
+    """gzip content with a fixed mtime, which keeps the output stable for identical input.
+
+    gzip.compress only accepts mtime on Python 3.8+, so GzipFile is used directly.
+    """
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=9, mtime=0) as gzip_file:
+        gzip_file.write(content)
+    return buffer.getvalue()
+
+
+def get_content_hash(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+def precompress_file(path, formats, cache_dir, previous_hash=None):
+    """writes a compressed sibling of path for each of formats.
+
+    compressed output is stored in cache_dir keyed by the content hash of path so that unchanged
+    files are copied from the cache instead of being compressed again.  when previous_hash matches
+    the current content hash and every sibling already exists, nothing is written.
+
+    returns (path, content_hash, number of files compressed)
+    """
+    path = Path(path)
+    content = path.read_bytes()
+    content_hash = get_content_hash(content)
+    siblings = {compression_format: Path(str(path) + FORMAT_EXTENSIONS[compression_format]) for compression_format in formats}
+    if content_hash == previous_hash and all(sibling.exists() for sibling in siblings.values()):
+        return str(path), content_hash, 0
+
+    compressed_count = 0
+    for compression_format, sibling in siblings.items():
+        cached_path = Path(cache_dir) / (content_hash + FORMAT_EXTENSIONS[compression_format])
+        if not cached_path.exists():
+            compressed_content = compress(content, compression_format)
+            # write then rename so concurrent builds never read a partial cache entry
+            temp_path = cached_path.with_name(cached_path.name + ".%s.tmp" % hashlib.md5(str(path).encode("utf-8")).hexdigest())
+            temp_path.write_bytes(compressed_content)
+            temp_path.replace(cached_path)
+            compressed_count += 1
+        shutil.copyfile(cached_path, sibling)
+    return str(path), content_hash, compressed_count
+
+
+def prune_cache(cache_dir, content_hashes, keep=()):
+    """deletes the compressed files in cache_dir whose content hash is not in content_hashes.
+
+    files named in keep (ex: the cache index) and in-progress temporary files are never deleted.
+
+    returns the number of files deleted
+    """
+    content_hashes = set(content_hashes)
+    pruned_count = 0
+    for path in Path(cache_dir).iterdir():
+        if not path.is_file() or path.name in keep or path.name.endswith(".tmp"):
+            continue
+        if path.name.split(".", 1)[0] not in content_hashes:
+            path.unlink()
+            pruned_count += 1
+    return pruned_count
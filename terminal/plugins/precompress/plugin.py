@@ -0,0 +1,87 @@
+from mkdocs.plugins import BasePlugin, event_priority
+from mkdocs.config import base, config_options as c
+from mkdocs.commands.build import DuplicateFilter
+from terminal.plugins.precompress.compressor import precompress_file, prune_cache, is_format_available, GZIP, BROTLI
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import json
+import os
+import logging
+DEFAULT_CACHE_DIR = ".cache/terminal/precompress"
+CACHE_INDEX_FILE_NAME = "index.json"
+DEFAULT_EXTENSIONS = [".html", ".css", ".js", ".json", ".svg", ".xml", ".txt"]
+DEFAULT_MIN_SIZE = 256
+
+
+class PrecompressPluginConfig(base.Config):
+    formats = c.ListOfItems(c.Choice([GZIP, BROTLI]), default=[GZIP, BROTLI])
+    extensions = c.ListOfItems(c.Type(str), default=DEFAULT_EXTENSIONS)
+    min_size = c.Type(int, default=DEFAULT_MIN_SIZE)
+    cache_dir = c.Type(str, default=DEFAULT_CACHE_DIR)
+    workers = c.Optional(c.Type(int))
+
+
+class PrecompressPlugin(BasePlugin[PrecompressPluginConfig]):
+
+    # run after other plugins have finished writing to site_dir
+    @event_priority(-100)
+    def on_post_build(self, config, **kwargs):
+        formats = self.get_available_formats()
+        if not formats:
+            return
+        site_dir = Path(config.site_dir)
+        cache_dir = self.get_cache_dir(config)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        index_path = cache_dir / CACHE_INDEX_FILE_NAME
+        previous_index = load_index(index_path)
+
+        paths = self.find_compressible_files(site_dir)
+        index = {}
+        compressed_count = 0
+        with ProcessPoolExecutor(max_workers=self.config.workers) as executor:
+            futures = {
+                path.relative_to(site_dir).as_posix(): executor.submit(precompress_file, str(path), formats, str(cache_dir), previous_index.get(path.relative_to(site_dir).as_posix()))
+                for path in paths
+            }
+            for relative_path, future in futures.items():
+                _, content_hash, file_compressed_count = future.result()
+                index[relative_path] = content_hash
+                compressed_count += file_compressed_count
+        index_path.write_text(json.dumps(index, indent=2, sort_keys=True), encoding="utf-8")
+        pruned_count = prune_cache(cache_dir, index.values(), keep=[CACHE_INDEX_FILE_NAME])
+        logger.info("precompressed %d files (%d new compressions), removed %d stale cache entries" % (len(paths), compressed_count, pruned_count))
+        return
+
+    def get_available_formats(self):
+        formats = []
+        for compression_format in self.config.formats:
+            if is_format_available(compression_format):
+                formats.append(compression_format)
+            else:
+                logger.warning("skipping %s precompression: install the '%s' package to enable it" % (compression_format, compression_format))
+        return formats
+
+    def get_cache_dir(self, config):
+        cache_dir = Path(self.config.cache_dir)
+        if not cache_dir.is_absolute() and config.config_file_path:
+            cache_dir = Path(os.path.dirname(config.config_file_path)) / cache_dir
+        return cache_dir.resolve()
+
+    def find_compressible_files(self, site_dir):
+        extensions = tuple(self.config.extensions)
+        return sorted(
+            path for path in site_dir.rglob("*")
+            if path.is_file() and path.name.endswith(extensions) and path.stat().st_size >= self.config.min_size
+        )
+
+
+def load_index(index_path):
+    try:
+        return json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+# Set up logging
+logger = logging.getLogger("mkdocs.terminal.precompress")
+logger.addFilter(DuplicateFilter())
@@ -0,0 +1,99 @@
+from mkdocs.plugins import BasePlugin
+from mkdocs.config import base, config_options as c
+from mkdocs.commands.build import DuplicateFilter
+from terminal.plugins.render_timing.timer import RenderTimer, instrument_environment, TILE_GRID_LABEL
+from terminal.pluglets.tile_grid.util import DEFAULT_GRID_PARTIAL_PATH
+from pathlib import Path
+import json
+import os
+import logging
+RENDER_TIMING_FEATURE = "debug.render_timing"
+RENDER_TIMING_ENV_VAR = "TERMINAL_RENDER_TIMING"
+TRUTHY_VALUES = ("1", "true", "yes", "on")
+
+
+class RenderTimingPluginConfig(base.Config):
+    report_file = c.Optional(c.Type(str))
+    top = c.Type(int, default=10)
+
+
+class RenderTimingPlugin(BasePlugin[RenderTimingPluginConfig]):
+    """times theme partials and the tile_grid macro when the debug.render_timing feature
+    or the TERMINAL_RENDER_TIMING environment variable is set"""
+
+    def __init__(self):
+        self.timer = RenderTimer()
+        self.active = False
+
+    def on_pre_build(self, config, **kwargs):
+        self.timer.reset()
+        self.active = is_render_timing_enabled(config)
+        if self.active:
+            self.instrument_tile_grid_macro()
+        return
+
+    def instrument_tile_grid_macro(self):
+        # tile_grid() renders with the macro's own jinja2 env, which is created when the macros plugin loads
+        from terminal.pluglets.tile_grid.main import MACRO
+        if MACRO.jinja2_env is not None:
+            instrument_environment(MACRO.jinja2_env, self.timer, labels={DEFAULT_GRID_PARTIAL_PATH: TILE_GRID_LABEL})
+
+    def on_env(self, env, config, files, **kwargs):
+        if self.active:
+            instrument_environment(env, self.timer)
+        return env
+
+    def on_pre_page(self, page, config, files, **kwargs):
+        self.timer.current_page = page.file.src_uri
+        return page
+
+    def on_page_content(self, html, page, config, files, **kwargs):
+        self.timer.current_page = None
+        return html
+
+    def on_page_context(self, context, page, config, nav, **kwargs):
+        self.timer.current_page = page.file.src_uri
+        return context
+
+    def on_post_page(self, output, page, config, **kwargs):
+        self.timer.current_page = None
+        return output
+
+    def on_pre_template(self, template, template_name, config, **kwargs):
+        self.timer.current_page = template_name
+        return template
+
+    def on_post_template(self, output_content, template_name, config, **kwargs):
+        self.timer.current_page = None
+        return output_content
+
+    def on_post_build(self, config, **kwargs):
+        if not self.active:
+            return
+        report = self.timer.get_report()
+        for label, timing in list(report["templates"].items())[:self.config.top]:
+            logger.info("render timing: %s %.3f ms total over %d renders" % (label, timing["total_ms"], timing["calls"]))
+        if self.config.report_file:
+            report_path = self.get_report_path(config)
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+            logger.info("render timing report written to %s" % report_path)
+        return
+
+    def get_report_path(self, config):
+        report_path = Path(self.config.report_file)
+        if not report_path.is_absolute() and config.config_file_path:
+            report_path = Path(os.path.dirname(config.config_file_path)) / report_path
+        return report_path.resolve()
+
+
+def is_render_timing_enabled(config):
+    features = config.theme.get("features") or []
+    if RENDER_TIMING_FEATURE in features:
+        return True
+    return os.environ.get(RENDER_TIMING_ENV_VAR, "").strip().lower() in TRUTHY_VALUES
+
+
+# Set up logging
+logger = logging.getLogger("mkdocs.terminal.render_timing")
+logger.addFilter(DuplicateFilter())
@@ -0,0 +1,78 @@
+from collections import defaultdict
+from time import perf_counter
+TIMED_ATTRIBUTE = "_terminal_render_timed"
+TILE_GRID_LABEL = "tile_grid()"
+
+
+class RenderTimer():
+    """records inclusive render time per template, both cumulative and per page.
+
+    times are inclusive: the time recorded for a template contains the time spent
+    rendering every template it includes or extends.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.current_page = None
+        self.calls = defaultdict(int)
+        self.totals = defaultdict(float)
+        self.pages = defaultdict(lambda: defaultdict(float))
+
+    def record(self, label, seconds):
+        self.calls[label] += 1
+        self.totals[label] += seconds
+        if self.current_page is not None:
+            self.pages[self.current_page][label] += seconds
+
+    def get_report(self):
+        """returns json serializable dict of cumulative and per page timings in milliseconds"""
+        templates = {
+            label: {"calls": self.calls[label], "total_ms": to_ms(self.totals[label]), "mean_ms": to_ms(self.totals[label] / self.calls[label])}
+            for label in sorted(self.totals, key=self.totals.get, reverse=True)
+        }
+        pages = {
+            page: {label: to_ms(seconds) for label, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True)}
+            for page, timings in sorted(self.pages.items())
+        }
+        return {"templates": templates, "pages": pages}
+
+
+def to_ms(seconds):
+    return round(seconds * 1000, 3)
+
+
+def instrument_template(template, timer, label=None):
+    """wraps the template's render function so that each render is recorded by timer"""
+    if getattr(template, TIMED_ATTRIBUTE, False):
+        return template
+    label = label or template.name
+    render_function = template.root_render_func
+
+    def timed_render_function(context):
+        start = perf_counter()
+        try:
+            yield from render_function(context)
+        finally:
+            timer.record(label, perf_counter() - start)
+
+    template.root_render_func = timed_render_function
+    setattr(template, TIMED_ATTRIBUTE, True)
+    return template
+
+
+def instrument_environment(env, timer, labels=None):
+    """times every template loaded from env, including those pulled in via include, extends and import.
+
+    labels optionally maps template names to the label they should be recorded under.
+    """
+    labels = labels or {}
+    get_template = env.get_template
+
+    def timed_get_template(name, *args, **kwargs):
+        template = get_template(name, *args, **kwargs)
+        return instrument_template(template, timer, labels.get(template.name))
+
+    env.get_template = timed_get_template
+    return env
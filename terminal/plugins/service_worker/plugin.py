@@ -0,0 +1,55 @@
+from mkdocs.plugins import BasePlugin, event_priority
+from mkdocs.config import base, config_options as c
+from mkdocs.commands.build import DuplicateFilter
+from mkdocs.utils import get_relative_url
+from terminal.plugins.service_worker.worker import (
+    DEFAULT_PRECACHE_PATTERNS, build_manifest, find_precache_paths, get_version, inject_registration, render_registration, render_service_worker
+)
+from pathlib import Path
+import logging
+DEFAULT_FILE_NAME = "sw.js"
+DEFAULT_CACHE_PREFIX = "terminal"
+
+
+class ServiceWorkerPluginConfig(base.Config):
+    file_name = c.Type(str, default=DEFAULT_FILE_NAME)
+    cache_prefix = c.Type(str, default=DEFAULT_CACHE_PREFIX)
+    precache = c.ListOfItems(c.Type(str), default=DEFAULT_PRECACHE_PATTERNS)
+
+
+class ServiceWorkerPlugin(BasePlugin[ServiceWorkerPluginConfig]):
+
+    def __init__(self):
+        self.is_serving = False
+
+    def on_startup(self, command, dirty, **kwargs):
+        # a cached page would be shown instead of each live reload, so the worker is only added to built sites
+        self.is_serving = command == "serve"
+
+    def on_post_page(self, output, page, config, **kwargs):
+        if self.is_serving:
+            return output
+        service_worker_url = get_relative_url(self.config.file_name, page.url)
+        return inject_registration(output, render_registration(service_worker_url))
+
+    # run after the fingerprint and search plugins have written their files, before precompress
+    @event_priority(-50)
+    def on_post_build(self, config, **kwargs):
+        if self.is_serving:
+            return
+        site_dir = Path(config.site_dir)
+        precache_paths = find_precache_paths(site_dir, self.config.precache, exclude=[self.config.file_name])
+        pages = find_precache_paths(site_dir, ["*.html"])
+        # pages are cached at runtime, but are part of the version so that stale pages are dropped after a rebuild
+        version = get_version(build_manifest(site_dir, precache_paths + pages))
+        service_worker = render_service_worker(version, precache_paths, self.config.cache_prefix)
+        service_worker_path = site_dir / self.config.file_name
+        service_worker_path.parent.mkdir(parents=True, exist_ok=True)
+        service_worker_path.write_text(service_worker, encoding="utf-8")
+        logger.info("wrote service worker %s (version %s, %d precached files)" % (self.config.file_name, version, len(precache_paths)))
+        return
+
+
+# Set up logging
+logger = logging.getLogger("mkdocs.terminal.service_worker")
+logger.addFilter(DuplicateFilter())
@@ -0,0 +1,139 @@
+from fnmatch import fnmatch
+from pathlib import Path
+import hashlib
+import json
+DEFAULT_PRECACHE_PATTERNS = [
+    "css/*.css",
+    "css/fontawesome/css/*.css",
+    "css/fontawesome/webfonts/*.woff2",
+    "css/palettes/*.css",
+    "css/search/*.css",
+    "js/*/*.js",
+    "search/*.js",
+    "search/search_index.json",
+]
+DEFAULT_VERSION_LENGTH = 12
+SERVICE_WORKER_TEMPLATE = """/* generated by the terminal/service-worker plugin */
+var VERSION = %(version)s;
+var CACHE_PREFIX = %(cache_prefix)s;
+var PRECACHE = CACHE_PREFIX + "-precache-" + VERSION;
+var PAGES = CACHE_PREFIX + "-pages-" + VERSION;
+var PRECACHE_URLS = %(precache_urls)s;
+var PRECACHED = new Set(PRECACHE_URLS.map(function (url) {
+    return new URL(url, self.location).href;
+}));
+
+self.addEventListener("install", function (event) {
+    event.waitUntil(
+        caches.open(PRECACHE).then(function (cache) {
+            return cache.addAll(PRECACHE_URLS);
+        }).then(function () {
+            return self.skipWaiting();
+        })
+    );
+});
+
+self.addEventListener("activate", function (event) {
+    /* remove the caches of previous versions of the site */
+    event.waitUntil(
+        caches.keys().then(function (names) {
+            return Promise.all(names.filter(function (name) {
+                return name.indexOf(CACHE_PREFIX + "-") === 0 && name !== PRECACHE && name !== PAGES;
+            }).map(function (name) {
+                return caches.delete(name);
+            }));
+        }).then(function () {
+            return self.clients.claim();
+        })
+    );
+});
+
+function isPageRequest(request) {
+    return request.mode === "navigate" || (request.headers.get("accept") || "").indexOf("text/html") !== -1;
+}
+
+/* respond from the cache when possible and refresh the cached page in the background */
+function staleWhileRevalidate(event) {
+    return caches.open(PAGES).then(function (cache) {
+        return cache.match(event.request).then(function (cached) {
+            var fetched = fetch(event.request).then(function (response) {
+                if (response.ok) {
+                    cache.put(event.request, response.clone());
+                }
+                return response;
+            });
+            if (cached) {
+                event.waitUntil(fetched.catch(function () {}));
+                return cached;
+            }
+            return fetched;
+        });
+    });
+}
+
+self.addEventListener("fetch", function (event) {
+    var request = event.request;
+    if (request.method !== "GET" || new URL(request.url).origin !== self.location.origin) {
+        return;
+    }
+    var url = request.url.split("#")[0];
+    if (PRECACHED.has(url)) {
+        event.respondWith(caches.match(url, {cacheName: PRECACHE}).then(function (cached) {
+            return cached || fetch(request);
+        }));
+    } else if (isPageRequest(request)) {
+        event.respondWith(staleWhileRevalidate(event));
+    }
+});
+"""
+REGISTRATION_TEMPLATE = """<script>
+if ("serviceWorker" in navigator) {
+    window.addEventListener("load", function () {
+        navigator.serviceWorker.register(%s);
+    });
+}
+</script>
+"""
+
+
+def find_precache_paths(site_dir, patterns, exclude=()):
+    """returns the site relative paths of the files in site_dir which match any of patterns"""
+    site_dir = Path(site_dir)
+    paths = []
+    for path in sorted(site_dir.rglob("*")):
+        relative_path = path.relative_to(site_dir).as_posix()
+        if path.is_file() and relative_path not in exclude and any(fnmatch(relative_path, pattern) for pattern in patterns):
+            paths.append(relative_path)
+    return paths
+
+
+def build_manifest(site_dir, paths):
+    """returns {relative path: content hash} for each of paths"""
+    site_dir = Path(site_dir)
+    return {path: hashlib.sha256((site_dir / path).read_bytes()).hexdigest() for path in paths}
+
+
+def get_version(manifest, length=DEFAULT_VERSION_LENGTH):
+    """returns a hash of manifest.  the version only changes when a file in the manifest is added, removed or changed"""
+    content = json.dumps(manifest, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(content).hexdigest()[:length]
+
+
+def render_service_worker(version, precache_urls, cache_prefix):
+    return SERVICE_WORKER_TEMPLATE % {
+        "version": json.dumps(version),
+        "cache_prefix": json.dumps(cache_prefix),
+        "precache_urls": json.dumps(precache_urls, indent=4),
+    }
+
+
+def render_registration(service_worker_url):
+    return REGISTRATION_TEMPLATE % json.dumps(service_worker_url)
+
+
+def inject_registration(output, registration):
+    """inserts registration before the closing body tag of output (or appends it when there is none)"""
+    index = output.rfind("</body>")
+    if index == -1:
+        return output + registration
+    return output[:index] + registration + output[index:]
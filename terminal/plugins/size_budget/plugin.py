@@ -0,0 +1,86 @@
+from mkdocs.plugins import BasePlugin
+from mkdocs.config import base, config_options as c
+from mkdocs.commands.build import DuplicateFilter
+from mkdocs.exceptions import PluginError
+from terminal.plugins.size_budget.report import (
+    DEFAULT_REGIONS, PageSize, SizeReport, check_budgets, find_asset_references, measure_assets, measure_regions, resolve_asset_path
+)
+from pathlib import Path
+import json
+import os
+import logging
+
+
+class SizeBudgetPluginConfig(base.Config):
+    # dict values are checked in on_config (config_options.DictOfItems requires MkDocs 1.5)
+    regions = c.Type(dict, default=DEFAULT_REGIONS)
+    page_budget = c.Optional(c.Type(int))
+    region_budgets = c.Type(dict, default={})
+    asset_budgets = c.Type(dict, default={})
+    total_asset_budget = c.Optional(c.Type(int))
+    report_file = c.Optional(c.Type(str))
+    fail_on_exceed = c.Type(bool, default=True)
+
+
+class SizeBudgetPlugin(BasePlugin[SizeBudgetPluginConfig]):
+
+    def __init__(self):
+        self.report = SizeReport()
+        self.asset_paths = set()
+
+    def on_config(self, config, **kwargs):
+        validate_dict_values("regions", self.config.regions, str)
+        validate_dict_values("region_budgets", self.config.region_budgets, int)
+        validate_dict_values("asset_budgets", self.config.asset_budgets, int)
+        return config
+
+    def on_pre_build(self, config, **kwargs):
+        self.report = SizeReport()
+        self.asset_paths = set()
+
+    def on_post_page(self, output, page, config, **kwargs):
+        dest_uri = page.file.dest_uri
+        total, regions = measure_regions(output, self.config.regions)
+        self.report.pages.append(PageSize(dest_uri=dest_uri, total=total, regions=regions))
+        for _, url in find_asset_references(output):
+            asset_path = resolve_asset_path(dest_uri, url)
+            if asset_path is not None:
+                self.asset_paths.add(asset_path)
+        return output
+
+    def on_post_build(self, config, **kwargs):
+        self.report.assets = measure_assets(config.site_dir, sorted(self.asset_paths))
+        if self.config.report_file:
+            report_path = self.get_report_path(config)
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_path.write_text(json.dumps(self.report.to_dict(), indent=2), encoding="utf-8")
+            logger.info("size report written to %s" % report_path)
+        violations = check_budgets(
+            self.report,
+            page_budget=self.config.page_budget,
+            region_budgets=self.config.region_budgets,
+            asset_budgets=self.config.asset_budgets,
+            total_asset_budget=self.config.total_asset_budget
+        )
+        for violation in violations:
+            logger.warning("size budget exceeded: %s" % violation)
+        if violations and self.config.fail_on_exceed:
+            raise PluginError("%d size budgets exceeded" % len(violations))
+        return
+
+    def get_report_path(self, config):
+        report_path = Path(self.config.report_file)
+        if not report_path.is_absolute() and config.config_file_path:
+            report_path = Path(os.path.dirname(config.config_file_path)) / report_path
+        return report_path.resolve()
+
+
+def validate_dict_values(option_name, value, value_type):
+    for key, item in value.items():
+        if not isinstance(key, str) or not isinstance(item, value_type) or isinstance(item, bool):
+            raise PluginError("size budget option '%s' expects %s values, got %r for %r" % (option_name, value_type.__name__, item, key))
+
+
+# Set up logging
+logger = logging.getLogger("mkdocs.terminal.size_budget")
+logger.addFilter(DuplicateFilter())
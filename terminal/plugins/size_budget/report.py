@@ -0,0 +1,207 @@
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, unquote
+import posixpath
+DEFAULT_REGIONS = {
+    "top_nav": ".terminal-nav",
+    "side_nav": "#terminal-mkdocs-side-panel",
+    "content": "#terminal-mkdocs-main-content",
+    "footer": "footer",
+}
+OTHER_REGION = "other"
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+STYLESHEET = "stylesheet"
+SCRIPT = "script"
+
+
+@dataclass
+class SimpleSelector:
+    """a tag, #id or .class selector (or a combination like nav.terminal-menu)"""
+    tag: Optional[str] = None
+    element_id: Optional[str] = None
+    classes: List[str] = field(default_factory=list)
+
+    def matches(self, tag, attrs):
+        if self.tag is not None and self.tag != tag:
+            return False
+        if self.element_id is not None and attrs.get("id") != self.element_id:
+            return False
+        element_classes = (attrs.get("class") or "").split()
+        return all(name in element_classes for name in self.classes)
+
+
+@dataclass
+class PageSize:
+    dest_uri: str
+    total: int
+    regions: Dict[str, int]
+
+
+@dataclass
+class SizeReport:
+    pages: List[PageSize] = field(default_factory=list)
+    assets: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self):
+        return {
+            "pages": {page.dest_uri: {"total": page.total, "regions": page.regions} for page in self.pages},
+            "assets": dict(sorted(self.assets.items())),
+            "total_asset_bytes": sum(self.assets.values()),
+        }
+
+
+def parse_simple_selector(selector):
+    """returns SimpleSelector for strings like 'footer', '#side-panel' or 'nav.terminal-menu'"""
+    parsed = SimpleSelector()
+    token = ""
+    kind = "tag"
+    for character in selector.strip() + "\0":
+        if character in "#.\0":
+            if token:
+                if kind == "tag":
+                    parsed.tag = token.lower()
+                elif kind == "#":
+                    parsed.element_id = token
+                else:
+                    parsed.classes.append(token)
+            token = ""
+            kind = character
+        else:
+            token += character
+    return parsed
+
+
+class RegionSizeParser(HTMLParser):
+    """records the source span of the first element matching each region selector"""
+
+    def __init__(self, html, regions):
+        super().__init__(convert_charrefs=True)
+        self.html = html
+        self.selectors = {name: parse_simple_selector(selector) for name, selector in regions.items()}
+        # HTMLParser counts lines by "\n" only, unlike str.splitlines
+        self.line_offsets = [0]
+        for line in html.split("\n"):
+            self.line_offsets.append(self.line_offsets[-1] + len(line) + 1)
+        self.stack = []
+        self.spans = {}
+        self.active = {}
+
+    def get_offset(self):
+        line, column = self.getpos()
+        return self.line_offsets[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_ELEMENTS:
+            return
+        attributes = dict(attrs)
+        start = self.get_offset()
+        regions = []
+        for name, selector in self.selectors.items():
+            if name not in self.spans and name not in self.active and selector.matches(tag, attributes):
+                self.active[name] = start
+                regions.append(name)
+        self.stack.append((tag, regions))
+
+    def handle_endtag(self, tag):
+        if not any(open_tag == tag for open_tag, _ in self.stack):
+            return
+        start = self.get_offset()
+        end = self.html.find(">", start) + 1 or len(self.html)
+        while self.stack:
+            open_tag, regions = self.stack.pop()
+            # elements closed implicitly end where the current end tag starts
+            self.end_regions(regions, end if open_tag == tag else start)
+            if open_tag == tag:
+                return
+
+    def end_regions(self, regions, end):
+        for name in regions:
+            self.spans[name] = (self.active.pop(name), end)
+
+    def close(self):
+        super().close()
+        for name, start in list(self.active.items()):
+            self.spans[name] = (start, len(self.html))
+        self.active = {}
+
+
+def measure_regions(html, regions=None):
+    """returns (total bytes, {region name: bytes}) for html.  bytes outside every region are reported as 'other'."""
+    regions = DEFAULT_REGIONS if regions is None else regions
+    parser = RegionSizeParser(html, regions)
+    parser.feed(html)
+    parser.close()
+    total = len(html.encode("utf-8"))
+    sizes = {}
+    for name in regions:
+        span = parser.spans.get(name)
+        sizes[name] = len(html[span[0]:span[1]].encode("utf-8")) if span else 0
+    sizes[OTHER_REGION] = total - sum(sizes.values())
+    return total, sizes
+
+
+class AssetReferenceParser(HTMLParser):
+    """collects stylesheet hrefs and script srcs"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.references = []
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+        if tag == "link" and STYLESHEET in (attributes.get("rel") or "").lower().split() and attributes.get("href"):
+            self.references.append((STYLESHEET, attributes["href"]))
+        elif tag == "script" and attributes.get("src"):
+            self.references.append((SCRIPT, attributes["src"]))
+
+
+def find_asset_references(html):
+    parser = AssetReferenceParser()
+    parser.feed(html)
+    parser.close()
+    return parser.references
+
+
+def resolve_asset_path(page_dest_uri, url):
+    """returns the site relative path of url as referenced from page_dest_uri, or None for external urls"""
+    parts = urlsplit(url)
+    if parts.scheme or parts.netloc or not parts.path:
+        return None
+    path = unquote(parts.path)
+    if path.startswith("/"):
+        return posixpath.normpath(path.lstrip("/"))
+    resolved = posixpath.normpath(posixpath.join(posixpath.dirname(page_dest_uri), path))
+    return None if resolved.startswith("..") else resolved
+
+
+def measure_assets(site_dir, asset_paths):
+    """returns {site relative path: bytes} for the asset paths which exist in site_dir"""
+    sizes = {}
+    for asset_path in asset_paths:
+        path = Path(site_dir) / asset_path
+        if path.is_file():
+            sizes[asset_path] = path.stat().st_size
+    return sizes
+
+
+def check_budgets(report, page_budget=None, region_budgets=None, asset_budgets=None, total_asset_budget=None):
+    """returns a message for every page, region or asset which is larger than its budget"""
+    violations = []
+    for page in report.pages:
+        if page_budget is not None and page.total > page_budget:
+            violations.append("%s is %d bytes (budget %d)" % (page.dest_uri, page.total, page_budget))
+        for region, budget in (region_budgets or {}).items():
+            size = page.regions.get(region, 0)
+            if size > budget:
+                violations.append("%s %s is %d bytes (budget %d)" % (page.dest_uri, region, size, budget))
+    for asset_path, size in sorted(report.assets.items()):
+        for pattern, budget in (asset_budgets or {}).items():
+            if fnmatch(asset_path, pattern) and size > budget:
+                violations.append("%s is %d bytes (budget %d for %s)" % (asset_path, size, budget, pattern))
+    total_asset_bytes = sum(report.assets.values())
+    if total_asset_budget is not None and total_asset_bytes > total_asset_budget:
+        violations.append("stylesheets and scripts are %d bytes (budget %d)" % (total_asset_bytes, total_asset_budget))
+    return violations
@@ -0,0 +1,214 @@
+import pytest
+from tests.accessibility.utilities import get_element_computed_styles, parse_html
+from tests.accessibility.utilities.cascade import (
+    StyleResolver,
+    StylesheetIndex,
+    get_background_shorthand_color,
+    get_page_style_resolver,
+    get_specificity,
+    get_stylesheet_index,
+    has_own_text,
+    media_query_applies,
+    parse_declarations,
+    resolve_var_references,
+)
+from tests.accessibility.validators import validate_color_contrast
+
+THEME_CSS = """
+/* comment { color: red; } */
+:root { --font-color: #151515; --background-color: #fff; --primary-color: #1a95e0; --invert-font-color: #fff; }
+body { color: var(--font-color); background-color: var(--background-color); }
+a { color: var(--primary-color); }
+.btn { color: var(--font-color); }
+.btn-primary { color: var(--invert-font-color); background-color: var(--primary-color); }
+#special { color: #333 !important; }
+p.muted, .note { color: var(--muted-color, #999); }
+.panel { --font-color: #00ff00; background-color: transparent; }
+.panel p { color: var(--font-color); }
+.hidden { display: none; }
+a:hover { color: #000; }
+a::before { content: ">"; color: #000; }
+@keyframes blink { 50% { color: #000; } }
+@media screen and (min-width: 960px) { .wide { color: #010101; } }
+@media screen and (max-width: 480px) { .wide { color: #020202; } }
+@media print { body { color: #000; } }
+"""
+
+PAGE = """
+<html>
+<head><title>Cascade</title></head>
+<body>
+  <p id="plain">plain <span id="child">child</span></p>
+  <a id="link" href="#">link</a>
+  <a id="special" href="#" style="color: #444">special</a>
+  <button class="btn btn-primary" id="primary">Go</button>
+  <p class="muted" id="muted">muted</p>
+  <div class="panel"><p id="panel-text">panel</p></div>
+  <div class="hidden"><p id="hidden-text">hidden</p></div>
+  <p class="wide" id="wide" style="background-color: #eee">wide</p>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def page():
+    return parse_html(PAGE)
+
+
+@pytest.fixture
+def resolver():
+    return StyleResolver(StylesheetIndex(THEME_CSS))
+
+
+def computed_color(resolver, page, element_id):
+    return resolver.get_computed_styles(page.find(id=element_id)).get("color")
+
+
+class TestStylesheetIndex:
+    def test_rules_are_bucketed_by_rightmost_compound(self):
+        index = StylesheetIndex(THEME_CSS)
+        assert [rule.selector for rule in index.by_id["special"]] == ["#special"]
+        assert {rule.selector for rule in index.by_class["btn-primary"]} == {".btn-primary"}
+        assert {rule.selector for rule in index.by_class["muted"]} == {"p.muted"}
+        assert {rule.selector for rule in index.by_tag["p"]} == {".panel p"}
+        assert [rule.selector for rule in index.universal] == [":root"]
+
+    def test_at_rules_and_comments(self):
+        selectors = [rule.selector for rule in StylesheetIndex(THEME_CSS).rules]
+        assert "comment" not in selectors
+        assert "50%" not in selectors
+        assert selectors.count(".wide") == 1
+
+    def test_index_is_shared_for_identical_css(self):
+        assert get_stylesheet_index(THEME_CSS) is get_stylesheet_index(THEME_CSS)
+
+    def test_selector_matches_are_compiled_once(self, page):
+        index = StylesheetIndex(THEME_CSS)
+        index.get_matching_rules(page.find(id="link"))
+        compiled = dict(index._compiled)
+        index.get_matching_rules(page.find(id="special"))
+        assert all(index._compiled[selector] is compiled[selector] for selector in compiled)
+
+
+class TestStyleResolver:
+    def test_inherited_color(self, resolver, page):
+        assert computed_color(resolver, page, "plain") == "#151515"
+        assert computed_color(resolver, page, "child") == "#151515"
+
+    def test_tag_rule(self, resolver, page):
+        assert computed_color(resolver, page, "link") == "#1a95e0"
+
+    def test_important_beats_inline_style(self, resolver, page):
+        assert computed_color(resolver, page, "special") == "#333"
+
+    def test_class_rules_and_background(self, resolver, page):
+        primary = page.find(id="primary")
+        assert computed_color(resolver, page, "primary") == "#fff"
+        assert resolver.get_background_color(primary) == "#1a95e0"
+
+    def test_background_shorthand_sets_background_color(self):
+        page = parse_html('<html><body><pre class="hljs" id="code">code</pre><p class="reset" id="reset">x</p><p class="late" id="late">x</p></body></html>')
+        css = (
+            ":root { --block-background-color: #222; } body { background-color: #fff; } "
+            ".hljs { background: var(--block-background-color); color: #fff; } "
+            "p.reset { background-color: #eee; } .reset { background: url(bg.png) no-repeat; } "
+            ".late { background: #000; background-color: #ccc; }"
+        )
+        resolver = StyleResolver(StylesheetIndex(css))
+        assert resolver.get_background_color(page.find(id="code")) == "#222"
+        assert resolver.get_background_color(page.find(id="reset")) == "#eee"
+        assert resolver.get_background_color(page.find(id="late")) == "#ccc"
+
+    def test_background_shorthand_color_is_found(self):
+        assert get_background_shorthand_color("#000") == "#000"
+        assert get_background_shorthand_color("url(a.png) center/cover no-repeat rgba(0, 0, 0, 0.5)") == "rgba(0, 0, 0, 0.5)"
+        assert get_background_shorthand_color("url(a.png), linear-gradient(red, blue) black") == "black"
+        assert get_background_shorthand_color("none") == "transparent"
+        assert get_background_shorthand_color("inherit") == "inherit"
+
+    def test_var_fallback(self, resolver, page):
+        assert computed_color(resolver, page, "muted") == "#999"
+
+    def test_custom_properties_cascade(self, resolver, page):
+        panel_text = page.find(id="panel-text")
+        assert computed_color(resolver, page, "panel-text") == "#00ff00"
+        assert resolver.get_background_color(panel_text) == "#fff"
+
+    def test_media_queries_use_desktop_viewport(self, resolver, page):
+        wide = page.find(id="wide")
+        assert computed_color(resolver, page, "wide") == "#010101"
+        assert resolver.get_background_color(wide) == "#eee"
+
+    def test_hover_and_pseudo_elements_are_ignored(self, resolver, page):
+        assert computed_color(resolver, page, "link") != "#000"
+
+    def test_hidden_elements(self, resolver, page):
+        assert not resolver.is_displayed(page.find(id="hidden-text"))
+        assert not resolver.is_displayed(page.find("title"))
+        assert resolver.is_displayed(page.find(id="plain"))
+
+    def test_computed_styles_are_cached(self, resolver, page):
+        element = page.find(id="link")
+        assert resolver.get_computed_styles(element) is resolver.get_computed_styles(element)
+
+    def test_page_resolver_includes_inline_stylesheets(self):
+        page = parse_html('<html><head><style>.x { color: #123456; }</style></head><body><p class="x">x</p></body></html>')
+        resolver = get_page_style_resolver(page, "body { color: #000; }")
+        assert resolver.get_computed_styles(page.find("p")).get("color") == "#123456"
+
+    def test_get_element_computed_styles_with_resolver(self, resolver, page):
+        styles = get_element_computed_styles(page.find(id="primary"), {"--font-color": "#151515"}, resolver)
+        assert styles == {"color": "#fff", "background-color": "#1a95e0"}
+
+
+class TestCascadeHelpers:
+    def test_parse_declarations(self):
+        assert parse_declarations("color: red; background: url(a;b) !important; --Gap: 1px") == [
+            ("color", "red", False),
+            ("background", "url(a;b)", True),
+            ("--Gap", "1px", False),
+        ]
+
+    @pytest.mark.parametrize("selector, specificity", [
+        ("a", (0, 0, 1)),
+        ("p.muted", (0, 1, 1)),
+        ("#special", (1, 0, 0)),
+        (".panel p", (0, 1, 1)),
+        ("a:hover", (0, 1, 1)),
+        ("input[type=search]", (0, 1, 1)),
+        ("a:not(.x)", (0, 1, 1)),
+    ])
+    def test_specificity(self, selector, specificity):
+        assert get_specificity(selector) == specificity
+
+    @pytest.mark.parametrize("query, applies", [
+        ("screen and (min-width: 960px)", True),
+        ("screen and (min-width: 30rem)", True),
+        ("screen and (max-width: 480px)", False),
+        ("print", False),
+        ("(prefers-color-scheme: dark)", False),
+        ("print, screen", True),
+    ])
+    def test_media_query_applies(self, query, applies):
+        assert media_query_applies(query) is applies
+
+    def test_resolve_var_references(self):
+        variables = {"--a": "var(--b)", "--b": "#111"}
+        assert resolve_var_references("var(--a)", variables) == "#111"
+        assert resolve_var_references("1px solid var(--b)", variables) == "1px solid #111"
+        assert resolve_var_references("var(--missing, var(--b))", variables) == "#111"
+        assert resolve_var_references("var(--missing)", variables) is None
+
+    def test_has_own_text(self, page):
+        assert has_own_text(page.find(id="plain"))
+        assert not has_own_text(page.find("div", class_="panel"))
+
+
+class TestCascadeContrast:
+    def test_stylesheet_colors_are_checked(self):
+        css = ":root { --font-color: #111; --background-color: #fff; } body { color: var(--font-color); background-color: var(--background-color); } .faint { color: #ddd; }"
+        html = '<html><body><p>fine</p><div><span class="faint">faint</span></div><p class="faint" hidden>hidden</p></body></html>'
+        violations = validate_color_contrast(html, "page.html", css)
+        assert len(violations) == 1
+        assert "span" in violations[0] and "#ddd" in violations[0]
@@ -6,9 +6,13 @@ Reference: https://www.w3.org/TR/WCAG20-TECHS/G17.html
 """
 
 from pathlib import Path
+
+import pytest
 from tests.accessibility.utilities import extract_css_attributes
 from tests.accessibility.utilities.color_utils import (
+    CSS_NAMED_COLORS,
     normalize_color,
+    parse_color,
     get_relative_luminance,
     get_contrast_ratio,
     meets_wcag_aa,
@@ -72,6 +76,74 @@ class TestColorNormalization:
         assert normalize_color("") is None
         assert normalize_color(None) is None
 
+    def test_normalize_hex_with_alpha(self):
+        """Test 4 and 8-digit hex colors ignore alpha unless fully transparent."""
+        assert normalize_color("#f00f") == (1.0, 0.0, 0.0)
+        assert normalize_color("#FF000080") == (1.0, 0.0, 0.0)
+        assert normalize_color("#ff000000") is None
+        assert normalize_color("#f000") is None
+        assert normalize_color("#ff00000") is None
+
+    @pytest.mark.parametrize("color", [
+        "rgb(255 0 0)",
+        "rgb(255 0 0 / 50%)",
+        "rgb(100%, 0%, 0%)",
+        "rgba(255, 0, 0, 0.5)",
+        "rgb(255.0, -10, 0)",
+        "rgb(300 0 0)",
+        "hsl(0, 100%, 50%)",
+        "hsl(0deg 100% 50%)",
+        "hsl(360 100% 50% / 0.2)",
+        "hsl(1turn 100% 50%)",
+        "hsl(400grad 100% 50%)",
+        "hsla(0, 100%, 50%, 1)",
+        "HSL(0, 100%, 50%)",
+    ])
+    def test_normalize_color_functions(self, color):
+        """Test modern and legacy rgb()/hsl() syntax."""
+        assert normalize_color(color) == pytest.approx((1.0, 0.0, 0.0))
+
+    def test_normalize_hsl_hue_units(self):
+        """Test hue units convert to the same color."""
+        expected = normalize_color("hsl(180, 100%, 25%)")
+        assert expected == pytest.approx((0.0, 0.5, 0.5))
+        assert normalize_color("hsl(3.14159265rad 100% 25%)") == pytest.approx(expected)
+        assert normalize_color("hsl(0.5turn 100% 25%)") == pytest.approx(expected)
+
+    @pytest.mark.parametrize("color", [
+        "rgb(255 0 0 / 0)",
+        "rgba(255, 255, 255, 0%)",
+        "hsla(0, 100%, 50%, 0)",
+    ])
+    def test_normalize_fully_transparent_functions(self, color):
+        """Test fully transparent rgb()/hsl() colors return None."""
+        assert normalize_color(color) is None
+
+    @pytest.mark.parametrize("color", [
+        "rgb(255, 0)",
+        "rgb(255 0 0 0)",
+        "rgb(a, b, c)",
+        "hsl(red, 100%, 50%)",
+        "rgb(255 0 0 / x)",
+    ])
+    def test_normalize_invalid_color_functions(self, color):
+        """Test malformed color functions return None."""
+        assert normalize_color(color) is None
+
+    def test_full_named_color_table(self):
+        """Test the complete CSS named color table is supported."""
+        assert len(CSS_NAMED_COLORS) == 149
+        assert normalize_color("rebeccapurple") == pytest.approx((0.4, 0.2, 0.6))
+        assert normalize_color("LightGoldenRodYellow") == normalize_color("#fafad2")
+        assert all(normalize_color(name) is not None for name in CSS_NAMED_COLORS if name != "transparent")
+
+    def test_parsed_colors_are_cached(self):
+        """Test repeated parses of the same color are served from the cache."""
+        normalize_color(" #123456 ")
+        hits = parse_color.cache_info().hits
+        assert normalize_color("#123456") == normalize_color("#123456")
+        assert parse_color.cache_info().hits >= hits + 2
+
 
 class TestRelativeLuminance:
     """Tests for relative luminance calculation."""
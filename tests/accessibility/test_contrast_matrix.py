@@ -0,0 +1,94 @@
+import pytest
+
+from tests.accessibility.utilities.color_utils import get_contrast_ratio
+from tests.accessibility.validators import (
+    PALETTE_CONTRAST_ROLES,
+    ContrastPair,
+    ContrastRole,
+    build_palette_contrast_report,
+    compute_contrast_matrix,
+)
+from tests.accessibility.validators import contrast_matrix
+from tests.interface.theme_features import DEFAULT_PALETTES
+
+# documented in documentation/docs/accessibility.md
+KNOWN_AA_FAILURES = {
+    ("default", "primary_link"),
+    ("default", "primary_button"),
+    ("sans", "primary_link"),
+    ("sans", "primary_button"),
+    ("pink", "primary_link"),
+    ("pink", "primary_button"),
+    ("gruvbox_dark", "error_text"),
+}
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(contrast_matrix, "numpy", None)
+    return request.param
+
+
+class TestComputeContrastMatrix:
+    def test_matches_pairwise_ratios(self, backend):
+        foregrounds = [["#000", "rgb(255, 0, 0)", "white"], ["hsl(120, 100%, 25%)", "#777", "#fff"]]
+        backgrounds = [["#fff", "#fff", "black"], ["#fafafa", "#888", "#1a95e0"]]
+        matrix = compute_contrast_matrix(foregrounds, backgrounds)
+        for row, (fg_row, bg_row) in enumerate(zip(foregrounds, backgrounds)):
+            for column, (foreground, background) in enumerate(zip(fg_row, bg_row)):
+                assert matrix[row][column] == pytest.approx(get_contrast_ratio(foreground, background))
+
+    def test_missing_and_invalid_colors(self, backend):
+        assert compute_contrast_matrix([["#000", None, "oops"]], [["#fff", "#fff", "#fff"]]) == [[pytest.approx(21.0), None, None]]
+
+    def test_empty_matrix(self, backend):
+        assert compute_contrast_matrix([], []) == []
+
+
+class TestPaletteContrastReport:
+    def test_report_covers_every_palette_and_role(self, backend, all_palette_css_attributes):
+        report = build_palette_contrast_report(all_palette_css_attributes, palettes=DEFAULT_PALETTES)
+        assert len(report.pairs) == len(DEFAULT_PALETTES) * len(PALETTE_CONTRAST_ROLES)
+        assert report.get_ratio("default", "text") == pytest.approx(18.26, abs=0.1)
+        assert report.get_ratio("dark", "text") == pytest.approx(13.07, abs=0.1)
+
+    def test_aa_failures_match_known_failures(self, backend, all_palette_css_attributes):
+        report = build_palette_contrast_report(all_palette_css_attributes, palettes=DEFAULT_PALETTES)
+        assert {(pair.palette, pair.role) for pair in report.aa_failures} == KNOWN_AA_FAILURES
+
+    def test_aaa_failures_pass_aa(self, backend, all_palette_css_attributes):
+        report = build_palette_contrast_report(all_palette_css_attributes, palettes=DEFAULT_PALETTES)
+        assert report.aaa_failures
+        assert all(pair.passes_aa and pair.ratio < 7.0 for pair in report.aaa_failures)
+        failures = report.to_dict()
+        assert len(failures["aa"]) == len(KNOWN_AA_FAILURES)
+        assert len(failures["aaa"]) == len(report.aaa_failures)
+
+    def test_custom_roles_and_large_text(self, backend):
+        attributes = {
+            "small": {"font-color": "#767676", "background-color": "#fff"},
+            "large": {"font-color": "#767676", "background-color": "#fff", "global-font-size": "24px"},
+        }
+        roles = [ContrastRole("text", "font-color", "background-color"), ContrastRole("missing", "primary-color", "background-color")]
+        report = build_palette_contrast_report(attributes, roles=roles)
+        assert report.palettes == ["small", "large"]
+        assert [(pair.palette, pair.role) for pair in report.aa_failures] == [("small", "missing"), ("large", "missing")]
+        assert [(pair.palette, pair.role) for pair in report.aaa_failures] == [("small", "text")]
+
+
+class TestContrastPair:
+    @pytest.mark.parametrize("ratio, large_text, passes_aa, passes_aaa", [
+        (4.5, False, True, False),
+        (7.0, False, True, True),
+        (3.0, True, True, False),
+        (4.5, True, True, True),
+        (2.9, True, False, False),
+        (None, False, False, False),
+    ])
+    def test_thresholds(self, ratio, large_text, passes_aa, passes_aaa):
+        pair = ContrastPair("palette", "role", "#000", "#fff", ratio, large_text)
+        assert pair.passes_aa is passes_aa
+        assert pair.passes_aaa is passes_aaa
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+from tests.accessibility.validators import AuditReport, ValidationEngine, audit_site
+from tests.accessibility.validators.site_audit import main, shard_html_files
+from tests.accessibility.utilities import SiteContextBuilder
+
+AUDIT_RULES = ["aria_buttons", "aria_hidden", "search_modal", "form_labels", "link_text", "duplicate_ids", "color_contrast"]
+
+
+class TestShardHtmlFiles:
+    def test_shards_keep_order_and_cover_every_file(self):
+        html_files = ["%d.html" % index for index in range(10)]
+        shards = shard_html_files(html_files, 3)
+        assert len(shards) == 3
+        assert [html_file for shard in shards for html_file in shard] == html_files
+
+    def test_more_shards_than_files(self):
+        assert shard_html_files(["a.html", "b.html"], 8) == [["a.html"], ["b.html"]]
+
+    def test_no_files(self):
+        assert shard_html_files([], 4) == []
+
+
+class TestAuditReport:
+    def test_violations_are_merged(self, tmp_path):
+        report = AuditReport(
+            site_path=tmp_path,
+            pages={
+                "a/index.html": {"duplicate_ids": ["a/index.html: Duplicate ID found: x"], "aria_buttons": []},
+                "index.html": {"duplicate_ids": [], "aria_buttons": ["index.html: Button missing text content or aria-label"]},
+            },
+        )
+        assert report.page_count == 2
+        assert report.violations == [
+            "a/index.html: Duplicate ID found: x",
+            "index.html: Button missing text content or aria-label",
+        ]
+        assert report.by_rule() == {
+            "duplicate_ids": ["a/index.html: Duplicate ID found: x"],
+            "aria_buttons": ["index.html: Button missing text content or aria-label"],
+        }
+        assert report.to_dict()["violation_count"] == 2
+
+
+class TestAuditSite:
+    @pytest.mark.parametrize("built_example_site", ["search-enabled"], indirect=True)
+    def test_parallel_audit_matches_serial_validation(self, built_example_site):
+        report = audit_site(built_example_site, rules=AUDIT_RULES, workers=2, shard_count=3)
+
+        html_files = sorted(path.relative_to(built_example_site.resolve()).as_posix() for path in built_example_site.resolve().glob("**/*.html"))
+        assert list(report.pages) == html_files
+
+        builder = SiteContextBuilder(built_example_site)
+        engine = ValidationEngine(AUDIT_RULES)
+        for html_file in html_files:
+            assert report.pages[html_file] == engine.validate(builder.build_context(html_file), html_file)
+
+    @pytest.mark.parametrize("built_example_site", ["search-enabled"], indirect=True)
+    def test_single_worker_audit(self, built_example_site):
+        parallel = audit_site(built_example_site, rules=AUDIT_RULES, workers=2)
+        serial = audit_site(built_example_site, rules=AUDIT_RULES, workers=1)
+        assert serial.pages == parallel.pages
+
+    @pytest.mark.parametrize("built_example_site", ["search-enabled"], indirect=True)
+    def test_main_writes_report(self, built_example_site, tmp_path, capsys):
+        output = tmp_path / "audit.json"
+        exit_code = main([str(built_example_site), "--rules", "duplicate_ids", "--workers", "1", "--output", str(output)])
+        report = json.loads(output.read_text(encoding="utf-8"))
+        assert exit_code == (1 if report["violation_count"] else 0)
+        assert list(report["rules"]) == ["duplicate_ids"]
+        assert "violation(s) in %d page(s)" % report["page_count"] in capsys.readouterr().out
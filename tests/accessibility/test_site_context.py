@@ -0,0 +1,110 @@
+import pytest
+from tests.accessibility.utilities import (
+    CssBundleCache,
+    SiteContextBuilder,
+    extract_css_variables,
+    get_stylesheet_hrefs,
+    iter_site_html_files,
+    load_css_bundle,
+    load_css_from_site,
+    parse_html,
+)
+
+
+def write_site(site_path, page_count=4, inline_style=""):
+    (site_path / "css").mkdir(parents=True)
+    (site_path / "css" / "terminal.css").write_text(":root { --font-color: #111; --background-color: var(--page-color); --page-color: #fff; }\n", encoding="utf-8")
+    (site_path / "css" / "theme.css").write_text("body { margin: 0; }\n", encoding="utf-8")
+    for index in range(page_count):
+        page_dir = site_path / ("page-%d" % index)
+        page_dir.mkdir()
+        style = inline_style if index == 0 else ""
+        (page_dir / "index.html").write_text(
+            '<html><head><link rel="stylesheet" href="/css/terminal.css">'
+            '<link rel="stylesheet" href="/css/theme.css">%s</head>'
+            "<body><main><p>page %d</p></main></body></html>" % (style, index),
+            encoding="utf-8",
+        )
+    return site_path
+
+
+class TestSiteContextBuilder:
+    def test_contexts_are_cached(self, tmp_path):
+        builder = SiteContextBuilder(write_site(tmp_path / "site"))
+        assert builder.build_context("page-0/index.html") is builder.build_context("page-0/index.html")
+
+    def test_max_contexts_evicts_least_recently_used(self, tmp_path):
+        builder = SiteContextBuilder(write_site(tmp_path / "site"), max_contexts=2)
+        first = builder.build_context("page-0/index.html")
+        builder.build_context("page-1/index.html")
+        assert builder.build_context("page-0/index.html") is first
+        builder.build_context("page-2/index.html")
+        assert len(builder._context_cache) == 2
+        assert builder.build_context("page-0/index.html") is first
+        second = builder.build_context("page-1/index.html")
+        assert builder.build_context("page-1/index.html") is second
+        assert builder.build_context("page-2/index.html").soup.find("p").get_text() == "page 2"
+
+    def test_streaming_keeps_bounded_contexts(self, tmp_path):
+        builder = SiteContextBuilder(write_site(tmp_path / "site", page_count=6), max_contexts=1)
+        pages = [context.soup.find("p").get_text() for context in builder.iter_html_files()]
+        assert pages == ["page %d" % index for index in range(6)]
+        assert len(builder._context_cache) == 1
+
+    def test_invalid_max_contexts(self, tmp_path):
+        with pytest.raises(ValueError):
+            SiteContextBuilder(write_site(tmp_path / "site"), max_contexts=0)
+
+    def test_shared_css_bundle(self, tmp_path):
+        contexts = list(iter_site_html_files(write_site(tmp_path / "site"), max_contexts=1))
+        assert all(context.css_content is contexts[0].css_content for context in contexts)
+        assert all(context.css_variables is contexts[0].css_variables for context in contexts)
+        assert contexts[0].css_variables["--background-color"] == "#fff"
+        assert contexts[0].css_variables == extract_css_variables(contexts[0].html_content, contexts[0].css_content)
+
+    def test_inline_variables_are_not_shared(self, tmp_path):
+        site_path = write_site(tmp_path / "site", inline_style="<style>:root { --link-color: #00f; }</style>")
+        builder = SiteContextBuilder(site_path)
+        inline_page = builder.build_context("page-0/index.html")
+        plain_page = builder.build_context("page-1/index.html")
+        assert inline_page.css_variables["--link-color"] == "#00f"
+        assert inline_page.css_variables["--font-color"] == "#111"
+        assert "--link-color" not in plain_page.css_variables
+
+
+class TestCssBundleCache:
+    def test_pages_with_the_same_stylesheets_share_one_bundle(self, tmp_path, monkeypatch):
+        loaded = []
+
+        def counting_load_css_bundle(site_path, hrefs):
+            loaded.append(hrefs)
+            return load_css_bundle(site_path, hrefs)
+
+        monkeypatch.setattr("tests.accessibility.utilities.site_context.load_css_bundle", counting_load_css_bundle)
+        builder = SiteContextBuilder(write_site(tmp_path / "site", page_count=5))
+        list(builder.iter_html_files())
+        assert loaded == [("/css/terminal.css", "/css/theme.css")]
+        assert len(builder._css_bundles) == 1
+
+    def test_bundle_matches_uncached_loading(self, tmp_path):
+        site_path = write_site(tmp_path / "site")
+        context = SiteContextBuilder(site_path).build_context("page-1/index.html")
+        assert context.css_content == load_css_from_site(site_path.resolve(), context.html_content)
+        assert context.css_variables == extract_css_variables(context.html_content, context.css_content)
+
+    def test_bundle_is_keyed_by_ordered_hrefs(self, tmp_path):
+        cache = CssBundleCache(write_site(tmp_path / "site"))
+        forward = cache.get(("/css/terminal.css", "/css/theme.css"))
+        assert cache.get(("/css/terminal.css", "/css/theme.css")) is forward
+        reverse = cache.get(("/css/theme.css", "/css/terminal.css"))
+        assert reverse is not forward
+        assert reverse.css_content.startswith("body")
+        assert len(cache) == 2
+
+    def test_stylesheet_hrefs(self):
+        soup = parse_html(
+            '<html><head><link rel="stylesheet" href="a.css"><link rel="icon" href="i.png">'
+            '<link rel="stylesheet" href="b.css?v=1"><link rel="stylesheet" href="c.css"></head></html>'
+        )
+        assert get_stylesheet_hrefs(soup) == ("a.css", "c.css")
+        assert get_stylesheet_hrefs(parse_html("<p>no head</p>")) == ()
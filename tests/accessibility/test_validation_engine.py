@@ -0,0 +1,145 @@
+import pytest
+from bs4 import BeautifulSoup
+from tests.accessibility.utilities import SiteContextBuilder, parse_html
+from tests.accessibility.validators import (
+    AriaButtonsRule,
+    TIDY_AVAILABLE,
+    DuplicateIdsRule,
+    HtmlStructureRule,
+    PageDocument,
+    SemanticHtmlRule,
+    ValidationEngine,
+    ValidationRule,
+    get_registered_rules,
+    load_page,
+    validate_aria_buttons,
+    validate_aria_hidden,
+    validate_color_contrast,
+    validate_duplicate_ids,
+    validate_form_labels,
+    validate_html_structure,
+    validate_link_text,
+    validate_search_modal_accessibility,
+    validate_semantic_html,
+)
+
+SOUP_RULES = [
+    "aria_buttons",
+    "aria_hidden",
+    "search_modal",
+    "form_labels",
+    "link_text",
+    "duplicate_ids",
+    "semantic_html",
+    "color_contrast",
+]
+
+BROKEN_PAGE = """
+<html>
+<head><style>:root { --font-color: #777; --background-color: #888; }</style></head>
+<body>
+  <nav><a href="/"></a></nav>
+  <nav aria-label="side"><a href="/a/">A</a></nav>
+  <main>
+    <header>Header</header>
+    <p id="dup">Text</p>
+    <span id="dup" aria-hidden="true">hidden text</span>
+    <button></button>
+    <input type="text" id="q">
+  </main>
+</body>
+</html>
+"""
+
+
+class CountingRule(ValidationRule):
+    name = "counting"
+    tags = frozenset(["p"])
+
+    def start(self, page):
+        self.visited = []
+
+    def visit(self, element, page):
+        self.visited.append(element.get("id"))
+
+    def finish(self, page):
+        return self.visited
+
+
+class TestValidationEngine:
+    def test_every_validator_is_registered(self):
+        registered = get_registered_rules()
+        for rule_name in SOUP_RULES:
+            assert rule_name in registered
+        assert ("html_structure" in registered) == TIDY_AVAILABLE
+
+    def test_html_structure_skips_parsed_soup(self):
+        soup = BeautifulSoup("<html><body><div><p>unclosed</body></html>", "html.parser")
+        assert ValidationEngine([HtmlStructureRule]).validate(soup) == {"html_structure": []}
+        with pytest.raises(TypeError):
+            validate_html_structure(soup)
+
+    @pytest.mark.skipif(not TIDY_AVAILABLE, reason="libtidy is not installed")
+    def test_html_structure_checks_raw_html(self):
+        violations = validate_html_structure("<!DOCTYPE html><html><head><title>t</title></head><body><p><div>x</p></div></body></html>")
+        assert violations
+
+    def test_engine_results_match_individual_validators(self):
+        results = ValidationEngine(SOUP_RULES).validate(BROKEN_PAGE, "broken.html")
+        assert results["aria_buttons"] == validate_aria_buttons(BROKEN_PAGE, "broken.html")
+        assert results["aria_hidden"] == validate_aria_hidden(BROKEN_PAGE, "broken.html")
+        assert results["search_modal"] == validate_search_modal_accessibility(BROKEN_PAGE, "broken.html")
+        assert results["form_labels"] == validate_form_labels(BROKEN_PAGE, "broken.html")
+        assert results["link_text"] == validate_link_text(BROKEN_PAGE, "broken.html")
+        assert results["duplicate_ids"] == validate_duplicate_ids(BROKEN_PAGE, "broken.html")
+        assert results["semantic_html"] == validate_semantic_html(BROKEN_PAGE, "broken.html")
+        assert results["color_contrast"] == validate_color_contrast(BROKEN_PAGE, "broken.html")
+        for rule_name in SOUP_RULES:
+            if rule_name != "search_modal":
+                assert results[rule_name], f"expected violations from {rule_name}"
+
+    def test_page_is_parsed_once(self, monkeypatch):
+        parsed = []
+
+        def counting_parse_html(html_content, parser=None):
+            parsed.append(html_content)
+            return parse_html(html_content, parser)
+
+        monkeypatch.setattr("tests.accessibility.validators.engine.parse_html", counting_parse_html)
+        ValidationEngine(SOUP_RULES).validate(BROKEN_PAGE, "broken.html")
+        assert len(parsed) == 1
+
+    def test_rules_only_visit_their_tags(self):
+        results = ValidationEngine([CountingRule]).validate(BROKEN_PAGE)
+        assert results == {"counting": ["dup"]}
+
+    def test_rule_names_and_classes_are_accepted(self):
+        engine = ValidationEngine(["duplicate_ids", SemanticHtmlRule])
+        assert engine.rule_classes == [DuplicateIdsRule, SemanticHtmlRule]
+
+    def test_validate_all_flattens_results(self):
+        engine = ValidationEngine([AriaButtonsRule, DuplicateIdsRule])
+        violations = engine.validate_all(BROKEN_PAGE, "broken.html")
+        assert violations == validate_aria_buttons(BROKEN_PAGE, "broken.html") + validate_duplicate_ids(BROKEN_PAGE, "broken.html")
+
+    def test_parsed_soup_is_reused(self):
+        soup = BeautifulSoup(BROKEN_PAGE, "html.parser")
+        page = load_page(soup, "broken.html")
+        assert isinstance(page, PageDocument)
+        assert page.soup is soup
+        assert validate_duplicate_ids(soup, "broken.html") == validate_duplicate_ids(BROKEN_PAGE, "broken.html")
+
+    @pytest.mark.parametrize("built_example_site", ["search-enabled"], indirect=True)
+    def test_site_context_soup_is_reused(self, built_example_site):
+        builder = SiteContextBuilder(built_example_site)
+        context = next(builder.iter_html_files())
+        page = load_page(context)
+        assert page.soup is context.soup
+        assert page.css_variables is context.css_variables
+        assert page.filename == context.html_file.name
+
+        results = ValidationEngine(SOUP_RULES).validate(context)
+        html = context.html_content
+        assert results["aria_buttons"] == validate_aria_buttons(html, page.filename)
+        assert results["search_modal"] == validate_search_modal_accessibility(html, page.filename)
+        assert results["duplicate_ids"] == validate_duplicate_ids(html, page.filename)
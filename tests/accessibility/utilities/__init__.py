@@ -1,32 +1,51 @@
 """Utility helpers shared across accessibility tests."""
 
+from .cascade import StyleResolver, StylesheetIndex, get_page_style_resolver, get_stylesheet_index
 from .css_parser import (
     extract_css_attributes,
     extract_css_variables,
     get_element_computed_styles,
     parse_css_variables,
     resolve_css_variable,
+    resolve_css_variables,
 )
 from .palette_loader import load_all_palette_css_attributes, load_palette_css_attributes
 from .site_context import (
+    CssBundle,
+    CssBundleCache,
     SiteContext,
     SiteContextBuilder,
+    get_page_css_variables,
     get_site_path,
+    get_stylesheet_hrefs,
     iter_site_html_files,
+    load_css_bundle,
     load_css_from_site,
+    parse_html,
 )
 
 __all__ = [
+    "StyleResolver",
+    "StylesheetIndex",
+    "get_page_style_resolver",
+    "get_stylesheet_index",
     "extract_css_attributes",
     "extract_css_variables",
     "get_element_computed_styles",
     "parse_css_variables",
     "resolve_css_variable",
+    "resolve_css_variables",
     "load_palette_css_attributes",
     "load_all_palette_css_attributes",
+    "CssBundle",
+    "CssBundleCache",
     "SiteContext",
     "SiteContextBuilder",
+    "get_page_css_variables",
     "get_site_path",
+    "get_stylesheet_hrefs",
     "iter_site_html_files",
+    "load_css_bundle",
     "load_css_from_site",
+    "parse_html",
 ]
@@ -0,0 +1,537 @@
+"""Indexed CSS cascade used to compute element styles in accessibility tests.
+
+Each stylesheet is parsed once into a :class:`StylesheetIndex` whose rules are
+bucketed by the id, class or tag of their rightmost compound selector. A
+:class:`StyleResolver` then computes cascaded, inherited styles for the
+elements of one page, caching selector matches and computed styles per
+element.
+
+Selectors are matched with soupsieve. Rules whose selectors use pseudo-elements
+(``::before``) are ignored, and dynamic pseudo-classes (``:hover``) never
+match. ``@media`` blocks are evaluated for a desktop screen
+(:data:`DEFAULT_VIEWPORT_WIDTH`); other at-rules are ignored.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import soupsieve
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+DEFAULT_VIEWPORT_WIDTH = 1280
+ROOT_FONT_SIZE = 16
+INHERITED_PROPERTIES = frozenset(["color", "font-size", "font-weight", "font-family", "visibility"])
+TRANSPARENT_COLORS = frozenset(["transparent", "none", "initial", "unset", "inherit"])
+NON_RENDERED_TAGS = frozenset(["head", "script", "style", "template", "noscript", "title", "meta", "link"])
+MAX_VAR_DEPTH = 10
+# background shorthand keywords which are not colors
+BACKGROUND_KEYWORDS = frozenset([
+    "none", "auto", "cover", "contain", "repeat", "repeat-x", "repeat-y", "no-repeat", "space", "round",
+    "scroll", "fixed", "local", "top", "bottom", "left", "right", "center",
+    "border-box", "padding-box", "content-box", "text",
+])
+CSS_WIDE_KEYWORDS = frozenset(["inherit", "initial", "unset", "revert"])
+
+COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+VAR_REFERENCE_PATTERN = re.compile(r"var\(\s*(--[A-Za-z0-9_-]+)\s*(?:,\s*([^()]*(?:\([^()]*\)[^()]*)*))?\)")
+IMPORTANT_PATTERN = re.compile(r"\s*!\s*important\s*$", re.IGNORECASE)
+MEDIA_FEATURE_PATTERN = re.compile(r"\(\s*([a-z-]+)\s*(?::\s*([^)]+))?\)")
+LENGTH_PATTERN = re.compile(r"^([0-9.]+)(px|rem|em)?$")
+ID_PATTERN = re.compile(r"#(-?[_a-zA-Z][\w-]*)")
+CLASS_PATTERN = re.compile(r"\.(-?[_a-zA-Z][\w-]*)")
+ATTRIBUTE_PATTERN = re.compile(r"\[[^\]]*\]")
+PSEUDO_CLASS_PATTERN = re.compile(r"(?<!:):(?!not\b|is\b|where\b)[a-zA-Z-]+")
+TYPE_PATTERN = re.compile(r"(?:^|[\s>+~(])([a-zA-Z][\w-]*)")
+COMBINATOR_PATTERN = re.compile(r"\s*[>+~]\s*|\s+")
+COLOR_FUNCTION_PATTERN = re.compile(r"^(?:rgba?|hsla?|hwb|lab|lch|color|var)\(", re.IGNORECASE)
+
+Specificity = Tuple[int, int, int]
+Declaration = Tuple[str, str, bool]
+
+
+@dataclass(frozen=True)
+class StyleRule:
+    """A single selector and its declarations.
+
+    Args:
+        selector: Selector text. Selector lists are split into one rule per selector.
+        specificity: ``(ids, classes, types)`` count of ``selector``.
+        order: Position of the rule in the stylesheet, used to break specificity ties.
+        declarations: ``(property, value, important)`` tuples in source order.
+    """
+
+    selector: str
+    specificity: Specificity
+    order: int
+    declarations: Tuple[Declaration, ...]
+
+
+class StylesheetIndex:
+    """Rules of one stylesheet bucketed by the id, class or tag they target.
+
+    Args:
+        css_text: Complete stylesheet text.
+        viewport_width: Viewport width in pixels used to evaluate ``@media`` blocks.
+    """
+
+    def __init__(self, css_text: str, viewport_width: int = DEFAULT_VIEWPORT_WIDTH):
+        self.viewport_width = viewport_width
+        self.rules: List[StyleRule] = []
+        self.by_id: Dict[str, List[StyleRule]] = {}
+        self.by_class: Dict[str, List[StyleRule]] = {}
+        self.by_tag: Dict[str, List[StyleRule]] = {}
+        self.universal: List[StyleRule] = []
+        self._compiled: Dict[str, Optional[soupsieve.SoupSieve]] = {}
+        for selector_text, declarations in iter_style_rules(css_text, viewport_width):
+            for selector in split_selector_list(selector_text):
+                self.add_rule(StyleRule(selector, get_specificity(selector), len(self.rules), declarations))
+
+    def add_rule(self, rule: StyleRule) -> None:
+        self.rules.append(rule)
+        bucket_type, key = get_bucket_key(rule.selector)
+        if bucket_type == "id":
+            self.by_id.setdefault(key, []).append(rule)
+        elif bucket_type == "class":
+            self.by_class.setdefault(key, []).append(rule)
+        elif bucket_type == "tag":
+            self.by_tag.setdefault(key, []).append(rule)
+        else:
+            self.universal.append(rule)
+
+    def iter_candidate_rules(self, element: Tag) -> Iterator[StyleRule]:
+        """Yield the rules which may match ``element`` based on its id, classes and tag."""
+        yield from self.universal
+        yield from self.by_tag.get(element.name, ())
+        element_id = element.get("id")
+        if element_id:
+            yield from self.by_id.get(element_id, ())
+        for class_name in element.get("class", ()):
+            yield from self.by_class.get(class_name, ())
+
+    def get_matching_rules(self, element: Tag) -> List[StyleRule]:
+        """Return the rules matching ``element`` in ascending cascade order.
+
+        Args:
+            element: Element to match.
+
+        Returns:
+            Matching rules sorted by specificity then source order. Example
+            return: ``[StyleRule(selector="body", ...), StyleRule(selector=".btn", ...)]``.
+        """
+        matched: Dict[int, StyleRule] = {}
+        for rule in self.iter_candidate_rules(element):
+            if rule.order not in matched and self.matches(rule.selector, element):
+                matched[rule.order] = rule
+        return sorted(matched.values(), key=lambda rule: (rule.specificity, rule.order))
+
+    def matches(self, selector: str, element: Tag) -> bool:
+        if selector not in self._compiled:
+            try:
+                self._compiled[selector] = soupsieve.compile(selector)
+            except (soupsieve.SelectorSyntaxError, NotImplementedError):
+                self._compiled[selector] = None
+        compiled = self._compiled[selector]
+        return compiled is not None and compiled.match(element)
+
+
+class StyleResolver:
+    """Compute cascaded styles for the elements of one page.
+
+    Args:
+        index: Stylesheet index for the CSS loaded by the page.
+    """
+
+    def __init__(self, index: StylesheetIndex):
+        self.index = index
+        self._computed: Dict[int, Tuple[Tag, Dict[str, str]]] = {}
+        self._displayed: Dict[int, Tuple[Tag, bool]] = {}
+
+    def get_cascaded_declarations(self, element: Tag) -> Dict[str, str]:
+        """Return the winning declared value of each property set on ``element``.
+
+        Args:
+            element: Element to inspect.
+
+        Returns:
+            Property values before inheritance and ``var()`` resolution,
+            including the ``style`` attribute. Example return:
+            ``{"color": "var(--primary-color)", "--gap": "1rem"}``.
+        """
+        weighted: List[Tuple[Tuple[bool, bool, Specificity, int], str, str]] = []
+        for rule in self.index.get_matching_rules(element):
+            for name, value, important in rule.declarations:
+                add_weighted_declaration(weighted, (important, False, rule.specificity, rule.order), name, value)
+        for position, (name, value, important) in enumerate(parse_declarations(element.get("style", ""))):
+            add_weighted_declaration(weighted, (important, True, (0, 0, 0), position), name, value)
+        # the sort is stable, so declarations with the same weight keep their source order
+        weighted.sort(key=lambda item: item[0])
+        return {name: value for _, name, value in weighted}
+
+    def get_computed_styles(self, element: Tag) -> Dict[str, str]:
+        """Return the computed styles of ``element``.
+
+        Inherited properties and custom properties are taken from the parent
+        when ``element`` does not set them, and ``var()`` references are
+        resolved against the element's custom properties.
+
+        Args:
+            element: Element to inspect.
+
+        Returns:
+            Computed property values. Example return:
+            ``{"color": "#e8e9ed", "background-color": "#222225", "--font-color": "#e8e9ed"}``.
+        """
+        cached = self._computed.get(id(element))
+        if cached is not None:
+            return cached[1]
+
+        parent = element.parent
+        parent_styles = self.get_computed_styles(parent) if isinstance(parent, Tag) and not isinstance(parent, BeautifulSoup) else {}
+        declared = self.get_cascaded_declarations(element)
+
+        styles: Dict[str, str] = {
+            name: value
+            for name, value in parent_styles.items()
+            if name.startswith("--") or name in INHERITED_PROPERTIES
+        }
+        for name, value in declared.items():
+            if name.startswith("--"):
+                styles[name] = value
+        for name, value in declared.items():
+            if name.startswith("--"):
+                continue
+            if value.lower() == "inherit":
+                if name in parent_styles:
+                    styles[name] = parent_styles[name]
+                continue
+            resolved = resolve_var_references(value, styles)
+            if resolved is None:
+                continue
+            if resolved.lower() == "currentcolor" and name != "color":
+                resolved = styles.get("color", resolved)
+            styles[name] = resolved
+
+        self._computed[id(element)] = (element, styles)
+        return styles
+
+    def get_background_color(self, element: Tag) -> Optional[str]:
+        """Return the first opaque ``background-color`` of ``element`` or its ancestors.
+
+        Args:
+            element: Element to inspect.
+
+        Returns:
+            Background color painted behind the element's text, or ``None`` when
+            no element sets one. Example return: ``"#222225"``.
+        """
+        current: Optional[Tag] = element
+        while isinstance(current, Tag) and not isinstance(current, BeautifulSoup):
+            background = self.get_computed_styles(current).get("background-color")
+            if background and not is_transparent(background):
+                return background
+            current = current.parent
+        return None
+
+    def is_displayed(self, element: Tag) -> bool:
+        """Return ``False`` when ``element`` or an ancestor is hidden or not rendered."""
+        cached = self._displayed.get(id(element))
+        if cached is not None:
+            return cached[1]
+
+        if element.name in NON_RENDERED_TAGS or element.has_attr("hidden"):
+            displayed = False
+        elif self.get_computed_styles(element).get("display", "").lower() == "none":
+            displayed = False
+        elif isinstance(element.parent, Tag) and not isinstance(element.parent, BeautifulSoup):
+            displayed = self.is_displayed(element.parent)
+        else:
+            displayed = True
+
+        self._displayed[id(element)] = (element, displayed)
+        return displayed
+
+
+def add_weighted_declaration(
+    weighted: List[Tuple[Tuple[bool, bool, Specificity, int], str, str]],
+    weight: Tuple[bool, bool, Specificity, int],
+    name: str,
+    value: str,
+) -> None:
+    """Append ``name: value`` to ``weighted``, expanding ``background`` into ``background-color`` with the same weight."""
+    weighted.append((weight, name, value))
+    if name == "background":
+        weighted.append((weight, "background-color", get_background_shorthand_color(value)))
+
+
+def get_background_shorthand_color(value: str) -> str:
+    """Return the ``background-color`` set by a ``background`` shorthand value.
+
+    The color can only appear in the last layer. A shorthand without a color
+    resets ``background-color`` to its initial value, ``transparent``. A
+    ``var()`` reference is assumed to hold the color. Example return: passing
+    ``"url(bg.png) no-repeat var(--block-background-color)"`` yields
+    ``"var(--block-background-color)"``.
+    """
+    normalized = value.strip()
+    if normalized.lower() in CSS_WIDE_KEYWORDS:
+        return normalized
+    last_layer = split_top_level(normalized, ",")[-1]
+    for token in split_top_level(last_layer.strip(), " "):
+        token = token.strip()
+        lowered = token.lower()
+        if not token or "/" in token or lowered.startswith("url(") or "gradient(" in lowered:
+            continue
+        if token.startswith("#") or COLOR_FUNCTION_PATTERN.match(token):
+            return token
+        if re.fullmatch(r"[a-z]+", lowered) and lowered not in BACKGROUND_KEYWORDS:
+            return token
+    return "transparent"
+
+
+@lru_cache(maxsize=32)
+def get_stylesheet_index(css_text: str, viewport_width: int = DEFAULT_VIEWPORT_WIDTH) -> StylesheetIndex:
+    """Return the shared :class:`StylesheetIndex` for ``css_text``.
+
+    Pages which load the same stylesheets reuse one index, so each stylesheet is
+    parsed once per session.
+    """
+    return StylesheetIndex(css_text, viewport_width)
+
+
+def get_inline_stylesheets(soup: BeautifulSoup) -> str:
+    """Return the text of every ``<style>`` tag in ``soup`` in document order."""
+    return "\n".join(style_tag.string for style_tag in soup.find_all("style") if style_tag.string)
+
+
+def get_page_style_resolver(soup: BeautifulSoup, css_content: str = "") -> StyleResolver:
+    """Return a :class:`StyleResolver` for a page using ``css_content`` and its inline styles.
+
+    Args:
+        soup: Parsed page.
+        css_content: Combined text of the stylesheets linked from the page.
+
+    Returns:
+        Resolver for the page's elements.
+    """
+    inline_css = get_inline_stylesheets(soup)
+    css_text = f"{css_content}\n{inline_css}" if inline_css else css_content
+    return StyleResolver(get_stylesheet_index(css_text))
+
+
+def has_own_text(element: Tag) -> bool:
+    """Return ``True`` when ``element`` directly contains non-whitespace text."""
+    return any(type(child) is NavigableString and child.strip() for child in element.children)
+
+
+def is_transparent(color: str) -> bool:
+    value = color.strip().lower()
+    if value in TRANSPARENT_COLORS:
+        return True
+    rgba = re.match(r"rgba\([^)]*,\s*0(?:\.0*)?\s*\)$", value)
+    return bool(rgba) or (value.startswith("#") and len(value) == 9 and value.endswith("00"))
+
+
+def strip_css_comments(css_text: str) -> str:
+    return COMMENT_PATTERN.sub("", css_text)
+
+
+def iter_style_rules(css_text: str, viewport_width: int = DEFAULT_VIEWPORT_WIDTH) -> Iterator[Tuple[str, Tuple[Declaration, ...]]]:
+    """Yield ``(selector_list, declarations)`` for every style rule in ``css_text``.
+
+    Rules inside ``@media`` blocks are included when :func:`media_query_applies`.
+    Other at-rules (``@keyframes``, ``@font-face``, ``@import`` ...) are skipped.
+    """
+    text = strip_css_comments(css_text)
+    position = 0
+    length = len(text)
+    while position < length:
+        open_brace = text.find("{", position)
+        if open_brace == -1:
+            return
+        prelude = text[position:open_brace].rsplit(";", 1)[-1].rsplit("}", 1)[-1].strip()
+        close_brace = find_block_end(text, open_brace)
+        block = text[open_brace + 1:close_brace]
+        position = close_brace + 1
+
+        if prelude.startswith("@"):
+            at_rule = prelude.split(None, 1)
+            if at_rule[0].lower() == "@media" and len(at_rule) > 1 and media_query_applies(at_rule[1], viewport_width):
+                yield from iter_style_rules(block, viewport_width)
+            continue
+        if prelude:
+            yield prelude, tuple(parse_declarations(block))
+
+
+def find_block_end(text: str, open_brace: int) -> int:
+    depth = 0
+    for index in range(open_brace, len(text)):
+        if text[index] == "{":
+            depth += 1
+        elif text[index] == "}":
+            depth -= 1
+            if depth == 0:
+                return index
+    return len(text)
+
+
+def parse_declarations(block: str) -> List[Declaration]:
+    """Parse ``property: value`` pairs from a declaration block or ``style`` attribute.
+
+    Args:
+        block: Text between a rule's braces.
+
+    Returns:
+        ``(property, value, important)`` tuples in source order. Property names
+        are lower-cased except custom properties. Example return:
+        ``[("color", "var(--font-color)", False)]``.
+    """
+    declarations: List[Declaration] = []
+    for declaration in split_top_level(block, ";"):
+        name, separator, value = declaration.partition(":")
+        name = name.strip()
+        value = value.strip()
+        if not separator or not name or not value:
+            continue
+        important = bool(IMPORTANT_PATTERN.search(value))
+        if important:
+            value = IMPORTANT_PATTERN.sub("", value)
+        declarations.append((name if name.startswith("--") else name.lower(), value, important))
+    return declarations
+
+
+def split_top_level(text: str, separator: str) -> List[str]:
+    """Split ``text`` on ``separator`` outside of parentheses and brackets."""
+    parts: List[str] = []
+    depth = 0
+    start = 0
+    for index, character in enumerate(text):
+        if character in "([":
+            depth += 1
+        elif character in ")]":
+            depth = max(depth - 1, 0)
+        elif character == separator and depth == 0:
+            parts.append(text[start:index])
+            start = index + 1
+    parts.append(text[start:])
+    return parts
+
+
+def split_selector_list(selector_text: str) -> List[str]:
+    return [selector.strip() for selector in split_top_level(selector_text, ",") if selector.strip()]
+
+
+def get_specificity(selector: str) -> Specificity:
+    """Return the ``(ids, classes, types)`` specificity of a single selector.
+
+    ``:not()``, ``:is()`` and ``:where()`` contribute their arguments rather
+    than themselves, which is exact for the simple arguments used by the theme.
+    """
+    without_attributes = ATTRIBUTE_PATTERN.sub("", selector)
+    ids = len(ID_PATTERN.findall(without_attributes))
+    classes = sum([
+        len(CLASS_PATTERN.findall(without_attributes)),
+        len(ATTRIBUTE_PATTERN.findall(selector)),
+        len(PSEUDO_CLASS_PATTERN.findall(without_attributes)),
+    ])
+    types = len(TYPE_PATTERN.findall(without_attributes))
+    return (ids, classes, types)
+
+
+def get_bucket_key(selector: str) -> Tuple[str, str]:
+    """Return the index bucket for ``selector`` based on its rightmost compound selector.
+
+    Returns:
+        ``("id", name)``, ``("class", name)``, ``("tag", name)`` or
+        ``("universal", "")``. Example return: ``("class", "btn-primary")``.
+    """
+    compound = COMBINATOR_PATTERN.split(re.sub(r"\([^)]*\)", "", ATTRIBUTE_PATTERN.sub("", selector)).strip())[-1]
+    id_match = ID_PATTERN.search(compound)
+    if id_match:
+        return ("id", id_match.group(1))
+    class_match = CLASS_PATTERN.search(compound)
+    if class_match:
+        return ("class", class_match.group(1))
+    tag_match = re.match(r"[a-zA-Z][\w-]*", compound)
+    if tag_match:
+        return ("tag", tag_match.group(0).lower())
+    return ("universal", "")
+
+
+def media_query_applies(query: str, viewport_width: int = DEFAULT_VIEWPORT_WIDTH) -> bool:
+    """Return ``True`` when a ``@media`` query list matches a desktop screen of ``viewport_width`` pixels.
+
+    Only media types and ``min-width``/``max-width`` features are evaluated;
+    queries using any other feature are treated as not matching.
+    """
+    for media_query in split_top_level(query, ","):
+        normalized = media_query.strip().lower()
+        if normalized.startswith("not ") or "print" in normalized or "speech" in normalized:
+            continue
+        if all(media_feature_applies(name, value, viewport_width) for name, value in MEDIA_FEATURE_PATTERN.findall(normalized)):
+            return True
+    return False
+
+
+def media_feature_applies(name: str, value: str, viewport_width: int) -> bool:
+    if name not in ("min-width", "max-width"):
+        return False
+    length = LENGTH_PATTERN.match(value.strip())
+    if not length:
+        return False
+    pixels = float(length.group(1)) * (ROOT_FONT_SIZE if length.group(2) in ("rem", "em") else 1)
+    return viewport_width >= pixels if name == "min-width" else viewport_width <= pixels
+
+
+def resolve_var_references(value: str, variables: Dict[str, str], depth: int = 0) -> Optional[str]:
+    """Replace ``var()`` references in ``value`` using ``variables``.
+
+    Args:
+        value: CSS value which may contain ``var(--name)`` or ``var(--name, fallback)``.
+        variables: Custom properties available to the element.
+        depth: Current recursion depth.
+
+    Returns:
+        Value without ``var()`` references, or ``None`` when a reference is
+        undefined and has no fallback. Example return: passing
+        ``"var(--font-color)"`` with ``{"--font-color": "#000"}`` yields ``"#000"``.
+    """
+    if "var(" not in value:
+        return value
+    if depth >= MAX_VAR_DEPTH:
+        return None
+
+    unresolved = False
+
+    def substitute(match: re.Match) -> str:
+        nonlocal unresolved
+        name, fallback = match.group(1), match.group(2)
+        replacement = variables.get(name)
+        if replacement is None:
+            replacement = fallback
+        resolved = resolve_var_references(replacement.strip(), variables, depth + 1) if replacement is not None else None
+        if resolved is None:
+            unresolved = True
+            return ""
+        return resolved
+
+    result = VAR_REFERENCE_PATTERN.sub(substitute, value)
+    return None if unresolved else result.strip()
+
+
+__all__ = [
+    "StyleResolver",
+    "StyleRule",
+    "StylesheetIndex",
+    "get_background_shorthand_color",
+    "get_page_style_resolver",
+    "get_stylesheet_index",
+    "has_own_text",
+    "iter_style_rules",
+    "media_query_applies",
+    "parse_declarations",
+    "resolve_var_references",
+]
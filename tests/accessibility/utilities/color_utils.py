@@ -12,45 +12,186 @@ both maintainable and reliable.
 Reference: https://www.w3.org/TR/WCAG20-TECHS/G17.html
 """
 
+import math
 import re
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import List, Tuple, Optional
 import colorsys
 
 
-# CSS named colors mapping (subset of most common colors in themes)
+# CSS named colors mapping (full CSS Color Module Level 4 table)
 CSS_NAMED_COLORS = {
-    "white": "#ffffff",
+    "aliceblue": "#f0f8ff",
+    "antiquewhite": "#faebd7",
+    "aqua": "#00ffff",
+    "aquamarine": "#7fffd4",
+    "azure": "#f0ffff",
+    "beige": "#f5f5dc",
+    "bisque": "#ffe4c4",
     "black": "#000000",
-    "red": "#ff0000",
-    "green": "#008000",
+    "blanchedalmond": "#ffebcd",
     "blue": "#0000ff",
-    "yellow": "#ffff00",
+    "blueviolet": "#8a2be2",
+    "brown": "#a52a2a",
+    "burlywood": "#deb887",
+    "cadetblue": "#5f9ea0",
+    "chartreuse": "#7fff00",
+    "chocolate": "#d2691e",
+    "coral": "#ff7f50",
+    "cornflowerblue": "#6495ed",
+    "cornsilk": "#fff8dc",
+    "crimson": "#dc143c",
     "cyan": "#00ffff",
-    "magenta": "#ff00ff",
+    "darkblue": "#00008b",
+    "darkcyan": "#008b8b",
+    "darkgoldenrod": "#b8860b",
+    "darkgray": "#a9a9a9",
+    "darkgreen": "#006400",
+    "darkgrey": "#a9a9a9",
+    "darkkhaki": "#bdb76b",
+    "darkmagenta": "#8b008b",
+    "darkolivegreen": "#556b2f",
+    "darkorange": "#ff8c00",
+    "darkorchid": "#9932cc",
+    "darkred": "#8b0000",
+    "darksalmon": "#e9967a",
+    "darkseagreen": "#8fbc8f",
+    "darkslateblue": "#483d8b",
+    "darkslategray": "#2f4f4f",
+    "darkslategrey": "#2f4f4f",
+    "darkturquoise": "#00ced1",
+    "darkviolet": "#9400d3",
+    "deeppink": "#ff1493",
+    "deepskyblue": "#00bfff",
+    "dimgray": "#696969",
+    "dimgrey": "#696969",
+    "dodgerblue": "#1e90ff",
+    "firebrick": "#b22222",
+    "floralwhite": "#fffaf0",
+    "forestgreen": "#228b22",
+    "fuchsia": "#ff00ff",
+    "gainsboro": "#dcdcdc",
+    "ghostwhite": "#f8f8ff",
+    "gold": "#ffd700",
+    "goldenrod": "#daa520",
     "gray": "#808080",
+    "green": "#008000",
+    "greenyellow": "#adff2f",
     "grey": "#808080",
-    "silver": "#c0c0c0",
-    "maroon": "#800000",
-    "olive": "#808000",
+    "honeydew": "#f0fff0",
+    "hotpink": "#ff69b4",
+    "indianred": "#cd5c5c",
+    "indigo": "#4b0082",
+    "ivory": "#fffff0",
+    "khaki": "#f0e68c",
+    "lavender": "#e6e6fa",
+    "lavenderblush": "#fff0f5",
+    "lawngreen": "#7cfc00",
+    "lemonchiffon": "#fffacd",
+    "lightblue": "#add8e6",
+    "lightcoral": "#f08080",
+    "lightcyan": "#e0ffff",
+    "lightgoldenrodyellow": "#fafad2",
+    "lightgray": "#d3d3d3",
+    "lightgreen": "#90ee90",
+    "lightgrey": "#d3d3d3",
+    "lightpink": "#ffb6c1",
+    "lightsalmon": "#ffa07a",
+    "lightseagreen": "#20b2aa",
+    "lightskyblue": "#87cefa",
+    "lightslategray": "#778899",
+    "lightslategrey": "#778899",
+    "lightsteelblue": "#b0c4de",
+    "lightyellow": "#ffffe0",
     "lime": "#00ff00",
-    "aqua": "#00ffff",
-    "teal": "#008080",
+    "limegreen": "#32cd32",
+    "linen": "#faf0e6",
+    "magenta": "#ff00ff",
+    "maroon": "#800000",
+    "mediumaquamarine": "#66cdaa",
+    "mediumblue": "#0000cd",
+    "mediumorchid": "#ba55d3",
+    "mediumpurple": "#9370db",
+    "mediumseagreen": "#3cb371",
+    "mediumslateblue": "#7b68ee",
+    "mediumspringgreen": "#00fa9a",
+    "mediumturquoise": "#48d1cc",
+    "mediumvioletred": "#c71585",
+    "midnightblue": "#191970",
+    "mintcream": "#f5fffa",
+    "mistyrose": "#ffe4e1",
+    "moccasin": "#ffe4b5",
+    "navajowhite": "#ffdead",
     "navy": "#000080",
-    "fuchsia": "#ff00ff",
-    "purple": "#800080",
+    "oldlace": "#fdf5e6",
+    "olive": "#808000",
+    "olivedrab": "#6b8e23",
     "orange": "#ffa500",
+    "orangered": "#ff4500",
+    "orchid": "#da70d6",
+    "palegoldenrod": "#eee8aa",
+    "palegreen": "#98fb98",
+    "paleturquoise": "#afeeee",
+    "palevioletred": "#db7093",
+    "papayawhip": "#ffefd5",
+    "peachpuff": "#ffdab9",
+    "peru": "#cd853f",
+    "pink": "#ffc0cb",
+    "plum": "#dda0dd",
+    "powderblue": "#b0e0e6",
+    "purple": "#800080",
+    "rebeccapurple": "#663399",
+    "red": "#ff0000",
+    "rosybrown": "#bc8f8f",
+    "royalblue": "#4169e1",
+    "saddlebrown": "#8b4513",
+    "salmon": "#fa8072",
+    "sandybrown": "#f4a460",
+    "seagreen": "#2e8b57",
+    "seashell": "#fff5ee",
+    "sienna": "#a0522d",
+    "silver": "#c0c0c0",
+    "skyblue": "#87ceeb",
+    "slateblue": "#6a5acd",
+    "slategray": "#708090",
+    "slategrey": "#708090",
+    "snow": "#fffafa",
+    "springgreen": "#00ff7f",
+    "steelblue": "#4682b4",
+    "tan": "#d2b48c",
+    "teal": "#008080",
+    "thistle": "#d8bfd8",
+    "tomato": "#ff6347",
+    "turquoise": "#40e0d0",
+    "violet": "#ee82ee",
+    "wheat": "#f5deb3",
+    "white": "#ffffff",
+    "whitesmoke": "#f5f5f5",
+    "yellow": "#ffff00",
+    "yellowgreen": "#9acd32",
     "transparent": None,
 }
 
+NUMBER = r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:e[+-]?\d+)?"
+HEX_COLOR_PATTERN = re.compile(r"^#([0-9a-f]{3,4}|[0-9a-f]{6}|[0-9a-f]{8})$")
+COLOR_FUNCTION_PATTERN = re.compile(r"^(rgba?|hsla?)\s*\((.*)\)$")
+RGB_COMPONENT_PATTERN = re.compile(rf"^{NUMBER}%?$")
+HUE_PATTERN = re.compile(rf"^({NUMBER})(deg|rad|grad|turn)?$")
+HUE_UNITS_PER_TURN = {"deg": 360.0, "rad": 2 * math.pi, "grad": 400.0, "turn": 1.0}
+
 
 def normalize_color(color_str: str) -> Optional[Tuple[float, float, float]]:
     """Convert a CSS color string to an RGB tuple on the 0.0-1.0 scale.
 
     Supports multiple color formats:
-    - Hex: #fff, #ffffff, #FFF, #FFFFFF
-    - RGB: rgb(255, 0, 0), rgb(100%, 0%, 0%)
-    - HSL: hsl(0, 100%, 50%), hsl(0deg, 100%, 50%)
-    - Named colors: white, black, red, etc.
+    - Hex: #fff, #ffff, #ffffff, #ffffffff (any case)
+    - RGB: rgb(255, 0, 0), rgb(100%, 0%, 0%), rgb(255 0 0 / 50%), rgba(...)
+    - HSL: hsl(0, 100%, 50%), hsl(0.5turn 100% 50% / 0.5), hsla(...)
+    - Named colors: every CSS named color (white, rebeccapurple, etc.)
+
+    The alpha channel is ignored, except that a fully transparent color
+    returns `None`. Results are cached, so repeated lookups of the same
+    string cost a dictionary lookup.
 
     Args:
         color_str: Color string in any supported format (hex/rgb/hsl/named value).
@@ -62,56 +203,98 @@ def normalize_color(color_str: str) -> Optional[Tuple[float, float, float]]:
     """
     if not color_str or not isinstance(color_str, str):
         return None
+    return parse_color(color_str.strip().lower())
 
-    color_str = color_str.strip().lower()
 
-    # Handle transparent
-    if color_str in ("transparent", "rgba(0,0,0,0)"):
-        return None
+@lru_cache(maxsize=1024)
+def parse_color(color_str: str) -> Optional[Tuple[float, float, float]]:
+    """Parse a stripped, lower-case CSS color string. Cached; see `normalize_color`.
 
-    # Handle hex colors
-    hex_match = re.match(r"^#([0-9a-f]{3}|[0-9a-f]{6})$", color_str)
-    if hex_match:
-        hex_value = hex_match.group(1)
-        # Expand 3-digit hex to 6-digit
-        if len(hex_value) == 3:
-            hex_value = "".join([c * 2 for c in hex_value])
-        r = int(hex_value[0:2], 16) / 255.0
-        g = int(hex_value[2:4], 16) / 255.0
-        b = int(hex_value[4:6], 16) / 255.0
-        return (r, g, b)
-
-    # Handle rgb() notation
-    rgb_match = re.match(r"^rgba?\s*\(\s*(\d+(?:\.\d+)?%?)\s*,\s*(\d+(?:\.\d+)?%?)\s*,\s*(\d+(?:\.\d+)?%?)\s*(?:,\s*[\d.]+)?\s*\)$", color_str)
-    if rgb_match:
-        r_str, g_str, b_str = rgb_match.groups()
-        r = parse_color_value(r_str)
-        g = parse_color_value(g_str)
-        b = parse_color_value(b_str)
-        if r is not None and g is not None and b is not None:
-            return (r, g, b)
-
-    # Handle hsl() notation
-    hsl_match = re.match(r"^hsla?\s*\(\s*([\d.]+)(?:deg)?\s*,\s*([\d.]+)%\s*,\s*([\d.]+)%\s*(?:,\s*[\d.]+)?\s*\)$", color_str)
-    if hsl_match:
-        h_str, s_str, l_str = hsl_match.groups()
-        hue = float(h_str) / 360.0  # Convert to 0-1 range
-        saturation = float(s_str) / 100.0
-        lightness = float(l_str) / 100.0
-        r, g, b = colorsys.hls_to_rgb(hue, lightness, saturation)
-        return (r, g, b)
+    Args:
+        color_str: Normalized color string such as `"#ff0000"` or `"rgb(255 0 0)"`.
 
-    # Handle named colors
+    Returns:
+        Tuple of `(red, green, blue)` with float values 0.0-1.0, or `None`.
+        Example: `"rebeccapurple"` returns `(0.4, 0.2, 0.6)`.
+    """
     if color_str in CSS_NAMED_COLORS:
         named_color = CSS_NAMED_COLORS[color_str]
-        if named_color is None:
+        return None if named_color is None else parse_color(named_color)
+
+    hex_match = HEX_COLOR_PATTERN.match(color_str)
+    if hex_match:
+        return parse_hex_color(hex_match.group(1))
+
+    function_match = COLOR_FUNCTION_PATTERN.match(color_str)
+    if not function_match:
+        return None
+
+    function_name, arguments = function_match.groups()
+    components, alpha = split_color_arguments(arguments)
+    if components is None or len(components) != 3:
+        return None
+    if alpha is not None:
+        alpha_value = parse_alpha_value(alpha)
+        if alpha_value is None or alpha_value == 0:
             return None
-        return normalize_color(named_color)
 
-    # Unknown color format
-    return None
+    if function_name.startswith("rgb"):
+        channels = [parse_color_value(component) for component in components]
+        if any(channel is None for channel in channels):
+            return None
+        r, g, b = (clamp(channel) for channel in channels)
+        return (r, g, b)
+
+    hue = parse_hue_value(components[0])
+    saturation = parse_percentage_value(components[1])
+    lightness = parse_percentage_value(components[2])
+    if hue is None or saturation is None or lightness is None:
+        return None
+    r, g, b = colorsys.hls_to_rgb(hue, clamp(lightness), clamp(saturation))
+    return (r, g, b)
+
+
+def parse_hex_color(hex_value: str) -> Optional[Tuple[float, float, float]]:
+    """Convert 3, 4, 6 or 8 hex digits (without `#`) to an RGB tuple, or `None` when fully transparent."""
+    # Expand 3/4-digit hex to 6/8-digit
+    if len(hex_value) in (3, 4):
+        hex_value = "".join([c * 2 for c in hex_value])
+    if hex_value[6:8] == "00":
+        return None
+    r = int(hex_value[0:2], 16) / 255.0
+    g = int(hex_value[2:4], 16) / 255.0
+    b = int(hex_value[4:6], 16) / 255.0
+    return (r, g, b)
+
+
+def split_color_arguments(arguments: str) -> Tuple[Optional[List[str]], Optional[str]]:
+    """Split `rgb()`/`hsl()` arguments into color components and an optional alpha.
+
+    Accepts both the legacy comma syntax (`255, 0, 0, 0.5`) and the modern
+    space syntax (`255 0 0 / 50%`).
+
+    Args:
+        arguments: Text between the function parentheses.
+
+    Returns:
+        Tuple of `(components, alpha)`. `components` is `None` when the syntax
+        is invalid. Example: `"255 0 0 / 50%"` returns `(["255", "0", "0"], "50%")`.
+    """
+    arguments = arguments.strip()
+    if "," in arguments:
+        parts = [part.strip() for part in arguments.split(",")]
+        if len(parts) == 4:
+            return parts[:3], parts[3]
+        return (parts, None) if len(parts) == 3 else (None, None)
 
+    alpha = None
+    if "/" in arguments:
+        arguments, alpha = (part.strip() for part in arguments.split("/", 1))
+    parts = arguments.split()
+    return (parts, alpha) if len(parts) == 3 else (None, None)
 
+
+@lru_cache(maxsize=1024)
 def parse_color_value(value_str: str) -> Optional[float]:
     """Parse a numeric RGB component from decimal or percentage notation.
 
@@ -123,13 +306,42 @@ def parse_color_value(value_str: str) -> Optional[float]:
         fails. Example: `"128"` returns approximately `0.50196`.
     """
     value_str = value_str.strip()
-    try:
-        if "%" in value_str:
-            return float(value_str.rstrip("%")) / 100.0
-        else:
-            return float(value_str) / 255.0
-    except ValueError:
+    if not RGB_COMPONENT_PATTERN.match(value_str):
         return None
+    if value_str.endswith("%"):
+        return float(value_str[:-1]) / 100.0
+    return float(value_str) / 255.0
+
+
+def parse_percentage_value(value_str: str) -> Optional[float]:
+    """Parse an HSL saturation/lightness value such as `"50%"` to the 0.0-1.0 range."""
+    value_str = value_str.strip()
+    if not RGB_COMPONENT_PATTERN.match(value_str):
+        return None
+    return float(value_str.rstrip("%")) / 100.0
+
+
+def parse_hue_value(value_str: str) -> Optional[float]:
+    """Parse an HSL hue (`deg`, `rad`, `grad`, `turn` or unitless degrees) to the 0.0-1.0 range."""
+    hue_match = HUE_PATTERN.match(value_str.strip())
+    if not hue_match:
+        return None
+    number, unit = hue_match.groups()
+    return (float(number) / HUE_UNITS_PER_TURN[unit or "deg"]) % 1.0
+
+
+def parse_alpha_value(value_str: str) -> Optional[float]:
+    """Parse an alpha value given as a number (`0.5`) or percentage (`50%`)."""
+    value_str = value_str.strip()
+    if not RGB_COMPONENT_PATTERN.match(value_str):
+        return None
+    if value_str.endswith("%"):
+        return float(value_str[:-1]) / 100.0
+    return float(value_str)
+
+
+def clamp(value: float) -> float:
+    return min(max(value, 0.0), 1.0)
 
 
 def get_relative_luminance(rgb: Tuple[float, float, float]) -> float:
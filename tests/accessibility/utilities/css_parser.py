@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
+from .cascade import StyleResolver
 
-def extract_css_variables(html: str, css_content: str = "") -> Dict[str, str]:
+
+def extract_css_variables(html: Union[str, BeautifulSoup], css_content: str = "") -> Dict[str, str]:
     """Extract CSS custom properties (variables) from HTML and CSS text.
 
     Args:
-        html: Raw HTML string that may include inline ``<style>`` tags.
+        html: Raw HTML string, or an already parsed document, that may include
+            inline ``<style>`` tags.
         css_content: Optional external CSS text to merge with inline styles.
 
     Returns:
@@ -21,7 +24,7 @@ def extract_css_variables(html: str, css_content: str = "") -> Dict[str, str]:
     """
     variables: Dict[str, str] = {}
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(html, "html.parser")
     for style_tag in soup.find_all("style"):
         if style_tag.string:
             variables.update(parse_css_variables(style_tag.string))
@@ -29,6 +32,20 @@ def extract_css_variables(html: str, css_content: str = "") -> Dict[str, str]:
     if css_content:
         variables.update(parse_css_variables(css_content))
 
+    return resolve_css_variables(variables)
+
+
+def resolve_css_variables(variables: Dict[str, str]) -> Dict[str, str]:
+    """Resolve ``var()`` references between the values of ``variables``.
+
+    Args:
+        variables: Unresolved variable definitions, as returned by
+            :func:`parse_css_variables`.
+
+    Returns:
+        Dictionary with the same keys and resolved values. Example return:
+        ``{"--font-color": "#222", "--secondary-color": "#222"}``.
+    """
     resolved: Dict[str, str] = {}
     for var_name, var_value in variables.items():
         resolved[var_name] = resolve_css_variable(var_value, variables)
@@ -60,12 +77,22 @@ def parse_css_variables(css_text: str) -> Dict[str, str]:
     return variables
 
 
-def get_element_computed_styles(element: Optional[Tag], css_variables: Dict[str, str]) -> Dict[str, str]:
+def get_element_computed_styles(
+    element: Optional[Tag],
+    css_variables: Dict[str, str],
+    resolver: Optional[StyleResolver] = None,
+) -> Dict[str, str]:
     """Return basic computed styles for ``color`` and ``background-color``.
 
+    Without a ``resolver`` only the element's ``style`` attribute is read. With a
+    resolver the full cascade is applied: matching stylesheet rules, inherited
+    ``color`` and the nearest opaque ancestor background. In both cases the
+    theme's ``--font-color`` / ``--background-color`` fill in missing values.
+
     Args:
         element: BeautifulSoup ``Tag`` to inspect. When ``None`` an empty dict is returned.
         css_variables: Map of CSS custom properties used to resolve ``var()`` references.
+        resolver: Optional :class:`StyleResolver` for the element's page.
 
     Returns:
         Dictionary containing any discovered ``color`` / ``background-color`` values.
@@ -76,23 +103,31 @@ def get_element_computed_styles(element: Optional[Tag], css_variables: Dict[str,
     if not element:
         return styles
 
-    style_attr = element.get("style", "")
-
-    if "color:" in style_attr:
-        match = re.search(r"(?<!background-)color:\s*([^;]+)", style_attr)
-        if match:
-            color_value = match.group(1).strip()
-            color_value = resolve_css_variable(color_value, css_variables)
-            if color_value:
-                styles["color"] = color_value
-
-    if "background-color:" in style_attr:
-        match = re.search(r"background-color:\s*([^;]+)", style_attr)
-        if match:
-            bg_value = match.group(1).strip()
-            bg_value = resolve_css_variable(bg_value, css_variables)
-            if bg_value:
-                styles["background-color"] = bg_value
+    if resolver is not None:
+        color_value = resolver.get_computed_styles(element).get("color")
+        if color_value:
+            styles["color"] = color_value
+        bg_value = resolver.get_background_color(element)
+        if bg_value:
+            styles["background-color"] = bg_value
+    else:
+        style_attr = element.get("style", "")
+
+        if "color:" in style_attr:
+            match = re.search(r"(?<!background-)color:\s*([^;]+)", style_attr)
+            if match:
+                color_value = match.group(1).strip()
+                color_value = resolve_css_variable(color_value, css_variables)
+                if color_value:
+                    styles["color"] = color_value
+
+        if "background-color:" in style_attr:
+            match = re.search(r"background-color:\s*([^;]+)", style_attr)
+            if match:
+                bg_value = match.group(1).strip()
+                bg_value = resolve_css_variable(bg_value, css_variables)
+                if bg_value:
+                    styles["background-color"] = bg_value
 
     if "color" not in styles and "--font-color" in css_variables:
         color_value = resolve_css_variable("var(--font-color)", css_variables)
@@ -205,6 +240,7 @@ def extract_css_attributes(css_content: str, fallback_css_content: str = "") ->
 __all__ = [
     "extract_css_variables",
     "parse_css_variables",
+    "resolve_css_variables",
     "get_element_computed_styles",
     "resolve_css_variable",
     "extract_css_attributes",
@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Set, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from bs4 import BeautifulSoup
 
-from .css_parser import extract_css_variables
+from .css_parser import parse_css_variables, resolve_css_variables
+
+try:
+    import lxml  # noqa: F401
+except ImportError:  # pragma: no cover - depends on the test environment
+    DEFAULT_HTML_PARSER = "html.parser"
+else:
+    DEFAULT_HTML_PARSER = "lxml"
 
 PathLike = Union[str, Path]
 
@@ -38,17 +46,26 @@ class SiteContext:
 class SiteContextBuilder:
     """Build and cache :class:`SiteContext` objects for a built site.
 
+    Pages which link the same stylesheets share one :class:`CssBundle`, so the
+    combined CSS text is read and parsed once per distinct ``<head>``. Pages
+    without inline ``:root`` variables also share the bundle's resolved
+    variable mapping. Treat both as read-only.
+
     Args:
         site_path: Path to the built MkDocs site (absolute or relative).
+        max_contexts: Maximum number of contexts kept in memory. ``None`` keeps
+            every context. A small value streams over large sites in bounded
+            memory; evicted contexts are rebuilt when requested again.
     """
 
-    def __init__(self, site_path: PathLike):
+    def __init__(self, site_path: PathLike, max_contexts: Optional[int] = None):
+        if max_contexts is not None and max_contexts < 1:
+            raise ValueError(f"max_contexts must be at least 1, got {max_contexts}")
         self.site_path = ensure_site_path(site_path)
+        self.max_contexts = max_contexts
         self._html_files: Optional[List[Path]] = None
-        self._html_cache: Dict[Path, str] = {}
-        self._css_cache: Dict[Path, str] = {}
-        self._css_variable_cache: Dict[Path, Dict[str, str]] = {}
-        self._soup_cache: Dict[Path, BeautifulSoup] = {}
+        self._context_cache: "OrderedDict[Path, SiteContext]" = OrderedDict()
+        self._css_bundles = CssBundleCache(self.site_path)
 
     def iter_html_files(self) -> Iterator[SiteContext]:
         """Yield :class:`SiteContext` objects for every HTML file in the site.
@@ -74,12 +91,18 @@ class SiteContextBuilder:
             whose ``relative_path`` is ``"docs/install/index.html"``.
         """
         html_path = resolve_html_file(self.site_path, html_file)
-        html_content = self._get_html_content(html_path)
-        css_content = self._get_css_content(html_path, html_content)
-        css_variables = self._get_css_variables(html_path, html_content, css_content)
-        soup = self._get_soup(html_path, html_content)
-
-        return SiteContext(
+        context = self._context_cache.get(html_path)
+        if context is not None:
+            self._context_cache.move_to_end(html_path)
+            return context
+
+        html_content = html_path.read_text(encoding="utf-8")
+        soup = parse_html(html_content)
+        css_bundle = self._css_bundles.get(get_stylesheet_hrefs(soup))
+        css_content = css_bundle.css_content
+        css_variables = get_page_css_variables(soup, css_bundle)
+
+        context = SiteContext(
             site_path=self.site_path,
             html_file=html_path,
             html_content=html_content,
@@ -87,6 +110,10 @@ class SiteContextBuilder:
             css_variables=css_variables,
             soup=soup,
         )
+        self._context_cache[html_path] = context
+        if self.max_contexts is not None and len(self._context_cache) > self.max_contexts:
+            self._context_cache.popitem(last=False)
+        return context
 
     def _get_html_files(self) -> List[Path]:
         if self._html_files is None:
@@ -95,68 +122,169 @@ class SiteContextBuilder:
                 raise AssertionError(f"No HTML files found in {self.site_path}")
         return self._html_files
 
-    def _get_html_content(self, html_file: Path) -> str:
-        if html_file not in self._html_cache:
-            self._html_cache[html_file] = html_file.read_text(encoding="utf-8")
-        return self._html_cache[html_file]
 
-    def _get_css_content(self, html_file: Path, html_content: str) -> str:
-        if html_file not in self._css_cache:
-            self._css_cache[html_file] = load_css_from_site(self.site_path, html_content)
-        return self._css_cache[html_file]
+@dataclass
+class CssBundle:
+    """Combined CSS shared by every page which links the same stylesheets.
+
+    Args:
+        hrefs: Ordered ``<link rel="stylesheet">`` hrefs identifying the bundle.
+        css_content: Combined CSS text, as returned by :func:`load_css_from_site`.
+        declared_variables: Unresolved ``:root`` variables declared in ``css_content``.
+        css_variables: ``declared_variables`` with ``var()`` references resolved.
+    """
+
+    hrefs: Tuple[str, ...]
+    css_content: str
+    declared_variables: Dict[str, str]
+    css_variables: Dict[str, str]
+
+
+class CssBundleCache:
+    """Cache :class:`CssBundle` objects for a built site keyed by their stylesheet hrefs.
+
+    Args:
+        site_path: Root directory of the built site.
+    """
+
+    def __init__(self, site_path: Path):
+        self.site_path = site_path
+        self._bundles: Dict[Tuple[str, ...], CssBundle] = {}
+
+    def __len__(self) -> int:
+        return len(self._bundles)
+
+    def get(self, hrefs: Tuple[str, ...]) -> CssBundle:
+        """Return the bundle for ``hrefs``, reading and parsing the stylesheets on first use.
+
+        Args:
+            hrefs: Ordered stylesheet hrefs, as returned by :func:`get_stylesheet_hrefs`.
+
+        Returns:
+            Shared :class:`CssBundle`. Example return: a bundle whose
+            ``css_variables["--background-color"]`` is ``"#fff"``.
+        """
+        bundle = self._bundles.get(hrefs)
+        if bundle is None:
+            css_content = load_css_bundle(self.site_path, hrefs)
+            declared_variables = parse_css_variables(css_content)
+            bundle = CssBundle(
+                hrefs=hrefs,
+                css_content=css_content,
+                declared_variables=declared_variables,
+                css_variables=resolve_css_variables(declared_variables),
+            )
+            self._bundles[hrefs] = bundle
+        return bundle
+
+
+def get_stylesheet_hrefs(soup: BeautifulSoup) -> Tuple[str, ...]:
+    """Return the hrefs of the CSS files linked from the ``<head>`` of ``soup``.
+
+    Args:
+        soup: Parsed page.
+
+    Returns:
+        Hrefs in document order. Example return:
+        ``("../css/terminal.css", "../css/theme.css", "../css/palettes/dark.css")``.
+    """
+    head = soup.find("head")
+    if not head:
+        return ()
+    hrefs = (link.get("href") for link in head.find_all("link", rel="stylesheet"))
+    return tuple(href for href in hrefs if href and href.endswith(".css"))
+
+
+def get_page_css_variables(soup: BeautifulSoup, css_bundle: CssBundle) -> Dict[str, str]:
+    """Return the resolved CSS variables for a page which uses ``css_bundle``.
+
+    Inline ``<style>`` variables are merged under the bundle's variables, matching
+    :func:`extract_css_variables`. Pages without inline variables share the
+    bundle's mapping.
+
+    Args:
+        soup: Parsed page.
+        css_bundle: Bundle for the stylesheets linked from the page.
+
+    Returns:
+        Resolved variable mapping. Example return: ``{"--font-color": "#111"}``.
+    """
+    inline_variables: Dict[str, str] = {}
+    for style_tag in soup.find_all("style"):
+        if style_tag.string:
+            inline_variables.update(parse_css_variables(style_tag.string))
+    if not inline_variables:
+        return css_bundle.css_variables
+    inline_variables.update(css_bundle.declared_variables)
+    return resolve_css_variables(inline_variables)
+
 
-    def _get_css_variables(self, html_file: Path, html_content: str, css_content: str) -> Dict[str, str]:
-        if html_file not in self._css_variable_cache:
-            self._css_variable_cache[html_file] = extract_css_variables(html_content, css_content)
-        return self._css_variable_cache[html_file]
+def parse_html(html_content: str, parser: Optional[str] = None) -> BeautifulSoup:
+    """Parse ``html_content`` with the fastest available BeautifulSoup tree builder.
 
-    def _get_soup(self, html_file: Path, html_content: str) -> BeautifulSoup:
-        if html_file not in self._soup_cache:
-            self._soup_cache[html_file] = BeautifulSoup(html_content, "html.parser")
-        return self._soup_cache[html_file]
+    Args:
+        html_content: HTML string to parse.
+        parser: Optional BeautifulSoup parser name. Defaults to ``"lxml"`` when
+            the C-backed lxml package is installed, otherwise ``"html.parser"``.
+
+    Returns:
+        Parsed :class:`BeautifulSoup` document. Example return: a soup whose
+        ``find("main")`` is the ``#terminal-mkdocs-main-content`` element.
+    """
+    return BeautifulSoup(html_content, parser or DEFAULT_HTML_PARSER)
 
 
-def load_css_from_site(site_path: Path, html_content: str) -> str:
+def load_css_from_site(site_path: Path, html_content: Union[str, BeautifulSoup]) -> str:
     """Load concatenated CSS referenced by ``html_content`` within ``site_path``.
 
     Args:
         site_path: Root of the built site being inspected.
-        html_content: HTML string that may reference CSS files.
+        html_content: HTML string, or an already parsed document, that may
+            reference CSS files.
 
     Returns:
         Combined CSS text for the page. Example return: ``"body { color:#111; }\n"``.
     """
+    soup = html_content if isinstance(html_content, BeautifulSoup) else BeautifulSoup(html_content, "html.parser")
+    return load_css_bundle(site_path, get_stylesheet_hrefs(soup))
+
+
+def load_css_bundle(site_path: Path, hrefs: Iterable[str]) -> str:
+    """Load and concatenate the stylesheets at ``hrefs`` within ``site_path``.
+
+    Missing files and repeated stylesheets are skipped. The active palette is
+    appended last when it was not already linked.
+
+    Args:
+        site_path: Root of the built site being inspected.
+        hrefs: Stylesheet hrefs in document order.
+
+    Returns:
+        Combined CSS text. Example return: ``"body { color:#111; }\n"``.
+    """
     css_content = ""
     loaded_paths: Set[Path] = set()
     active_palette = None
 
-    soup = BeautifulSoup(html_content, "html.parser")
-    head = soup.find("head")
-
-    if head:
-        for link in head.find_all("link", rel="stylesheet"):
-            href = link.get("href")
-            if not href or not href.endswith(".css"):
-                continue
+    for href in hrefs:
+        css_file = href.split("?")[0]
+        palette_match = re.match(r".*/css/palettes/([^/]+)\.css$", css_file)
+        if palette_match:
+            active_palette = palette_match.group(1)
 
-            css_file = href.split("?")[0]
-            palette_match = re.match(r".*/css/palettes/([^/]+)\.css$", css_file)
-            if palette_match:
-                active_palette = palette_match.group(1)
+        css_path = resolve_css_path(site_path, css_file)
+        if not css_path.exists():
+            continue
 
-            css_path = resolve_css_path(site_path, css_file)
-            if not css_path.exists():
-                continue
+        resolved = css_path.resolve()
+        if resolved in loaded_paths:
+            continue
 
-            resolved = css_path.resolve()
-            if resolved in loaded_paths:
-                continue
-
-            try:
-                css_content += css_path.read_text(encoding="utf-8") + "\n"
-                loaded_paths.add(resolved)
-            except OSError:
-                continue
+        try:
+            css_content += css_path.read_text(encoding="utf-8") + "\n"
+            loaded_paths.add(resolved)
+        except OSError:
+            continue
 
     if active_palette:
         palette_css_path = site_path / "css" / "palettes" / f"{active_palette}.css"
@@ -170,17 +298,18 @@ def load_css_from_site(site_path: Path, html_content: str) -> str:
     return css_content
 
 
-def iter_site_html_files(site_path: PathLike) -> Iterator[SiteContext]:
+def iter_site_html_files(site_path: PathLike, max_contexts: Optional[int] = None) -> Iterator[SiteContext]:
     """Yield :class:`SiteContext` objects for every HTML file under ``site_path``.
 
     Args:
         site_path: Path-like reference to the built site root.
+        max_contexts: Optional limit on the number of contexts kept in memory.
 
     Returns:
         Iterator of :class:`SiteContext` objects. Example return: yields a
         context whose ``relative_path`` is ``"index.html"``.
     """
-    builder = SiteContextBuilder(site_path)
+    builder = SiteContextBuilder(site_path, max_contexts)
     yield from builder.iter_html_files()
 
 
@@ -261,9 +390,15 @@ def resolve_css_path(site_path: Path, css_reference: str) -> Path:
 
 
 __all__ = [
+    "CssBundle",
+    "CssBundleCache",
     "SiteContext",
     "SiteContextBuilder",
+    "get_page_css_variables",
+    "get_stylesheet_hrefs",
+    "load_css_bundle",
     "get_site_path",
     "iter_site_html_files",
     "load_css_from_site",
+    "parse_html",
 ]
@@ -1,28 +1,83 @@
 """Accessibility validator helpers exposed for tests."""
 
 from .aria_validator import (
+    AriaButtonsRule,
+    AriaHiddenRule,
+    FormLabelsRule,
+    LinkTextRule,
+    SearchModalRule,
     validate_aria_buttons,
     validate_aria_hidden,
     validate_form_labels,
     validate_link_text,
     validate_search_modal_accessibility,
 )
+from .contrast_matrix import (
+    PALETTE_CONTRAST_ROLES,
+    ContrastPair,
+    ContrastReport,
+    ContrastRole,
+    build_palette_contrast_report,
+    compute_contrast_matrix,
+)
 from .contrast_validator import (
+    ContrastRule,
     PaletteColors,
     assert_contrast_meets_wcag_aa,
     get_palette_colors,
     validate_color_contrast,
 )
+from .engine import (
+    HtmlSource,
+    PageDocument,
+    ValidationEngine,
+    ValidationRule,
+    get_registered_rules,
+    load_page,
+    register_rule,
+    run_rule,
+)
 from .helpers import format_violation
 from .html_validator import (
+    TIDY_AVAILABLE,
+    DuplicateIdsRule,
+    HtmlStructureRule,
+    SemanticHtmlRule,
     validate_duplicate_ids,
     validate_html_structure,
     validate_semantic_html,
 )
+from .site_audit import AuditReport, audit_site
 
 __all__ = [
+    "HtmlSource",
+    "PageDocument",
+    "ValidationEngine",
+    "ValidationRule",
+    "get_registered_rules",
+    "load_page",
+    "register_rule",
+    "run_rule",
+    "AuditReport",
+    "audit_site",
+    "AriaButtonsRule",
+    "AriaHiddenRule",
+    "ContrastRule",
+    "DuplicateIdsRule",
+    "FormLabelsRule",
+    "HtmlStructureRule",
+    "TIDY_AVAILABLE",
+    "LinkTextRule",
+    "SearchModalRule",
+    "SemanticHtmlRule",
     "format_violation",
     "validate_color_contrast",
+    "PALETTE_CONTRAST_ROLES",
+    "ContrastPair",
+    "ContrastReport",
+    "ContrastRole",
+    "build_palette_contrast_report",
+    "compute_contrast_matrix",
     "PaletteColors",
     "assert_contrast_meets_wcag_aa",
     "get_palette_colors",
@@ -2,100 +2,131 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional, Set
 
-from bs4 import BeautifulSoup
+from bs4 import Tag
 
+from .engine import HtmlSource, PageDocument, ValidationRule, register_rule, run_rule
 from .helpers import format_violation
 
+SEARCH_MODAL_ID = "mkdocs_search_modal"
+LINK_TEXT_REGIONS = frozenset(["nav", "header", "footer", "aside"])
+UNLABELLED_INPUT_TYPES = ("hidden", "submit", "button", "reset", "image")
 
-def validate_aria_buttons(html: str, filename: str = "index.html") -> List[str]:
-    """Check that all <button> elements have text content or aria-label."""
-    violations: List[str] = []
-    soup = BeautifulSoup(html, "html.parser")
-    for element in soup.find_all("button"):
+
+@register_rule
+class AriaButtonsRule(ValidationRule):
+    """Buttons must have text content or an aria-label."""
+
+    name = "aria_buttons"
+    tags = frozenset(["button"])
+
+    def start(self, page: PageDocument) -> None:
+        self.violations: List[str] = []
+
+    def visit(self, element: Tag, page: PageDocument) -> None:
         text = element.get_text(strip=True)
         aria_label = element.get("aria-label", "").strip()
         if not text and not aria_label:
-            violations.append(
+            self.violations.append(
                 format_violation(
                     "Button missing text content or aria-label",
-                    filename,
+                    page.filename,
                     element,
                 )
             )
-    return violations
 
+    def finish(self, page: PageDocument) -> List[str]:
+        return self.violations
 
-def validate_aria_hidden(html: str, filename: str = "index.html") -> List[str]:
-    """Check that aria-hidden is only used on decorative elements."""
-    violations: List[str] = []
-    soup = BeautifulSoup(html, "html.parser")
 
-    for element in soup.find_all(attrs={"aria-hidden": "true"}):
-        element_text = element.get_text(strip=True)
-        if element_text:
-            violations.append(
+@register_rule
+class AriaHiddenRule(ValidationRule):
+    """aria-hidden='true' must only be used on decorative elements."""
+
+    name = "aria_hidden"
+
+    def start(self, page: PageDocument) -> None:
+        self.violations: List[str] = []
+
+    def visit(self, element: Tag, page: PageDocument) -> None:
+        if element.get("aria-hidden") != "true":
+            return
+        if element.get_text(strip=True):
+            self.violations.append(
                 format_violation(
                     "Element with aria-hidden='true' contains text. Use aria-label for icon buttons instead.",
-                    filename,
+                    page.filename,
                     element,
                 )
             )
 
-    return violations
+    def finish(self, page: PageDocument) -> List[str]:
+        return self.violations
 
 
-def validate_search_modal_accessibility(html: str, filename: str = "index.html") -> List[str]:
-    """Validate search modal has proper ARIA attributes for accessibility."""
-    violations: List[str] = []
-    soup = BeautifulSoup(html, "html.parser")
+@register_rule
+class SearchModalRule(ValidationRule):
+    """The search modal must be a labelled dialog with a labelled search input."""
 
-    modal = soup.find(id="mkdocs_search_modal")
-    if not modal:
-        return violations
+    name = "search_modal"
 
-    modal_role = modal.get("role", "").lower()
-    if modal_role not in ("alertdialog", "dialog"):
-        violations.append(
-            format_violation(
-                f"Modal should have role='alertdialog' or role='dialog', found role='{modal_role}'",
-                filename,
-                modal,
-            )
-        )
+    def start(self, page: PageDocument) -> None:
+        self.ids: Set[str] = set()
+        self.modal: Optional[Tag] = None
+
+    def visit(self, element: Tag, page: PageDocument) -> None:
+        element_id = element.get("id")
+        if not element_id:
+            return
+        self.ids.add(element_id)
+        if element_id == SEARCH_MODAL_ID and self.modal is None:
+            self.modal = element
 
-    if modal.get("aria-modal", "").lower() != "true":
-        violations.append(format_violation("Modal missing aria-modal='true'", filename, modal))
+    def finish(self, page: PageDocument) -> List[str]:
+        violations: List[str] = []
+        modal = self.modal
+        if modal is None:
+            return violations
+        filename = page.filename
 
-    labelledby = modal.get("aria-labelledby", "").strip()
-    if not labelledby:
-        violations.append(format_violation("Modal missing aria-labelledby pointing to modal title", filename, modal))
-    else:
-        label_elem = soup.find(id=labelledby)
-        if not label_elem:
+        modal_role = modal.get("role", "").lower()
+        if modal_role not in ("alertdialog", "dialog"):
             violations.append(
                 format_violation(
-                    f"Modal aria-labelledby='{labelledby}' references non-existent element",
+                    f"Modal should have role='alertdialog' or role='dialog', found role='{modal_role}'",
                     filename,
                     modal,
                 )
             )
 
-    close_button = modal.find("button", class_="close")
-    if close_button and not close_button.get("aria-label", "").strip():
-        violations.append(format_violation("Modal close button missing aria-label", filename, close_button))
+        if modal.get("aria-modal", "").lower() != "true":
+            violations.append(format_violation("Modal missing aria-modal='true'", filename, modal))
 
-    search_input = modal.find("input", {"type": "search"})
-    if search_input:
-        labelledby = search_input.get("aria-labelledby", "").strip()
+        labelledby = modal.get("aria-labelledby", "").strip()
         if not labelledby:
+            violations.append(format_violation("Modal missing aria-labelledby pointing to modal title", filename, modal))
+        elif labelledby not in self.ids:
             violations.append(
-                format_violation("Search input missing aria-labelledby association", filename, search_input)
+                format_violation(
+                    f"Modal aria-labelledby='{labelledby}' references non-existent element",
+                    filename,
+                    modal,
+                )
             )
-        else:
-            label_elem = soup.find(id=labelledby)
-            if not label_elem:
+
+        close_button = modal.find("button", class_="close")
+        if close_button and not close_button.get("aria-label", "").strip():
+            violations.append(format_violation("Modal close button missing aria-label", filename, close_button))
+
+        search_input = modal.find("input", {"type": "search"})
+        if search_input:
+            labelledby = search_input.get("aria-labelledby", "").strip()
+            if not labelledby:
+                violations.append(
+                    format_violation("Search input missing aria-labelledby association", filename, search_input)
+                )
+            elif labelledby not in self.ids:
                 violations.append(
                     format_violation(
                         f"Search input aria-labelledby='{labelledby}' references non-existent element",
@@ -104,60 +135,97 @@ def validate_search_modal_accessibility(html: str, filename: str = "index.html")
                     )
                 )
 
-    return violations
+        return violations
 
 
-def validate_form_labels(html: str, filename: str = "index.html") -> List[str]:
-    """Validate that form inputs have associated labels or accessible names."""
-    violations: List[str] = []
-    soup = BeautifulSoup(html, "html.parser")
+@register_rule
+class FormLabelsRule(ValidationRule):
+    """Form inputs must have an associated label or accessible name."""
 
-    inputs = soup.find_all(["input", "textarea", "select"])
-    for input_elem in inputs:
-        input_type = input_elem.get("type", "text").lower()
-        if input_type in ("hidden", "submit", "button", "reset", "image"):
-            continue
+    name = "form_labels"
+    tags = frozenset(["input", "textarea", "select", "label"])
 
-        input_id = input_elem.get("id", "")
-        has_label = False
-        if input_id:
-            label = soup.find("label", {"for": input_id})
-            if label:
-                has_label = True
+    def start(self, page: PageDocument) -> None:
+        self.inputs: List[Tag] = []
+        self.label_targets: Set[str] = set()
 
-        aria_label = input_elem.get("aria-label", "").strip()
-        aria_labelledby = input_elem.get("aria-labelledby", "").strip()
-        has_aria_name = bool(aria_label or aria_labelledby)
+    def visit(self, element: Tag, page: PageDocument) -> None:
+        if element.name == "label":
+            if element.get("for"):
+                self.label_targets.add(element.get("for"))
+        else:
+            self.inputs.append(element)
 
-        has_title = bool(input_elem.get("title", "").strip())
+    def finish(self, page: PageDocument) -> List[str]:
+        violations: List[str] = []
+        for input_elem in self.inputs:
+            input_type = input_elem.get("type", "text").lower()
+            if input_type in UNLABELLED_INPUT_TYPES:
+                continue
 
-        if not (has_label or has_aria_name or has_title):
-            violations.append(
-                format_violation(
-                    f"Form input of type '{input_type}' missing accessible label. "
-                    f"Use <label for='{input_id}'>, aria-label, or aria-labelledby.",
-                    filename,
-                    input_elem,
+            input_id = input_elem.get("id", "")
+            has_label = bool(input_id) and input_id in self.label_targets
+
+            aria_label = input_elem.get("aria-label", "").strip()
+            aria_labelledby = input_elem.get("aria-labelledby", "").strip()
+            has_aria_name = bool(aria_label or aria_labelledby)
+
+            has_title = bool(input_elem.get("title", "").strip())
+
+            if not (has_label or has_aria_name or has_title):
+                violations.append(
+                    format_violation(
+                        f"Form input of type '{input_type}' missing accessible label. "
+                        f"Use <label for='{input_id}'>, aria-label, or aria-labelledby.",
+                        page.filename,
+                        input_elem,
+                    )
                 )
-            )
+        return violations
 
-    return violations
 
+@register_rule
+class LinkTextRule(ValidationRule):
+    """Links in the theme's nav, header, footer and aside regions need text or an aria-label."""
 
-def validate_link_text(html: str, filename: str = "index.html") -> List[str]:
-    """Validate that navigation/footer links have descriptive text or aria-label."""
-    violations: List[str] = []
-    soup = BeautifulSoup(html, "html.parser")
+    name = "link_text"
+    tags = frozenset(["a"])
 
-    theme_regions = soup.find_all(["nav", "header", "footer", "aside"])
-    links = []
-    for region in theme_regions:
-        links.extend(region.find_all("a"))
+    def start(self, page: PageDocument) -> None:
+        self.violations: List[str] = []
 
-    for link in links:
-        link_text = link.get_text(strip=True)
-        aria_label = link.get("aria-label", "").strip()
+    def visit(self, element: Tag, page: PageDocument) -> None:
+        if not any(parent.name in LINK_TEXT_REGIONS for parent in element.parents):
+            return
+        link_text = element.get_text(strip=True)
+        aria_label = element.get("aria-label", "").strip()
         if not link_text and not aria_label:
-            violations.append(format_violation("Link missing text content and aria-label", filename, link))
+            self.violations.append(format_violation("Link missing text content and aria-label", page.filename, element))
+
+    def finish(self, page: PageDocument) -> List[str]:
+        return self.violations
 
-    return violations
+
+def validate_aria_buttons(html: HtmlSource, filename: str = "index.html") -> List[str]:
+    """Check that all <button> elements have text content or aria-label."""
+    return run_rule(AriaButtonsRule, html, filename)
+
+
+def validate_aria_hidden(html: HtmlSource, filename: str = "index.html") -> List[str]:
+    """Check that aria-hidden is only used on decorative elements."""
+    return run_rule(AriaHiddenRule, html, filename)
+
+
+def validate_search_modal_accessibility(html: HtmlSource, filename: str = "index.html") -> List[str]:
+    """Validate search modal has proper ARIA attributes for accessibility."""
+    return run_rule(SearchModalRule, html, filename)
+
+
+def validate_form_labels(html: HtmlSource, filename: str = "index.html") -> List[str]:
+    """Validate that form inputs have associated labels or accessible names."""
+    return run_rule(FormLabelsRule, html, filename)
+
+
+def validate_link_text(html: HtmlSource, filename: str = "index.html") -> List[str]:
+    """Validate that navigation/footer links have descriptive text or aria-label."""
+    return run_rule(LinkTextRule, html, filename)
@@ -0,0 +1,276 @@
+"""Batch contrast checks for every palette and foreground/background role.
+
+Every palette color is normalized once. Relative luminance and contrast ratios
+are then computed for all palettes and roles in one pass, using NumPy when it is
+installed and plain Python otherwise.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from tests.accessibility.utilities.color_utils import get_relative_luminance, normalize_color
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - depends on the test environment
+    numpy = None
+
+AA_NORMAL_TEXT = 4.5
+AA_LARGE_TEXT = 3.0
+AAA_NORMAL_TEXT = 7.0
+AAA_LARGE_TEXT = 4.5
+DEFAULT_FONT_SIZE = 14.0
+
+RatioMatrix = List[List[Optional[float]]]
+
+
+@dataclass(frozen=True)
+class ContrastRole:
+    """A foreground/background pairing of palette attributes.
+
+    Args:
+        name: Role name used in reports.
+        foreground: Palette attribute for the text color (no leading ``--``).
+        background: Palette attribute for the background color.
+        large_text: Whether the role is rendered as WCAG large text.
+    """
+
+    name: str
+    foreground: str
+    background: str
+    large_text: bool = False
+
+
+PALETTE_CONTRAST_ROLES = (
+    ContrastRole("text", "font-color", "background-color"),
+    ContrastRole("primary_link", "primary-color", "background-color"),
+    ContrastRole("error_text", "error-color", "background-color"),
+    ContrastRole("top_nav_link", "secondary-color", "background-color"),
+    ContrastRole("default_button", "invert-font-color", "font-color"),
+    ContrastRole("primary_button", "invert-font-color", "primary-color"),
+    ContrastRole("error_button", "invert-font-color", "error-color"),
+    ContrastRole("code_block", "code-font-color", "code-bg-color"),
+)
+
+
+@dataclass
+class ContrastPair:
+    """Contrast of one palette role.
+
+    Args:
+        palette: Palette name.
+        role: Role name.
+        foreground: Foreground color string.
+        background: Background color string.
+        ratio: Contrast ratio, or ``None`` when a color is missing or unparseable.
+        large_text: Whether the WCAG large text thresholds apply.
+    """
+
+    palette: str
+    role: str
+    foreground: Optional[str]
+    background: Optional[str]
+    ratio: Optional[float]
+    large_text: bool = False
+
+    @property
+    def required_aa(self) -> float:
+        return AA_LARGE_TEXT if self.large_text else AA_NORMAL_TEXT
+
+    @property
+    def required_aaa(self) -> float:
+        return AAA_LARGE_TEXT if self.large_text else AAA_NORMAL_TEXT
+
+    @property
+    def passes_aa(self) -> bool:
+        return self.ratio is not None and self.ratio >= self.required_aa
+
+    @property
+    def passes_aaa(self) -> bool:
+        return self.ratio is not None and self.ratio >= self.required_aaa
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "palette": self.palette,
+            "role": self.role,
+            "foreground": self.foreground,
+            "background": self.background,
+            "ratio": None if self.ratio is None else round(self.ratio, 2),
+            "required_aa": self.required_aa,
+            "required_aaa": self.required_aaa,
+        }
+
+
+@dataclass
+class ContrastReport:
+    """Contrast ratios of every palette and role.
+
+    Args:
+        palettes: Palette names, one per matrix row.
+        roles: Roles, one per matrix column.
+        ratios: Contrast ratio matrix indexed by ``[palette][role]``.
+        pairs: One :class:`ContrastPair` per matrix cell in row order.
+    """
+
+    palettes: List[str]
+    roles: List[ContrastRole]
+    ratios: RatioMatrix
+    pairs: List[ContrastPair] = field(default_factory=list)
+
+    @property
+    def aa_failures(self) -> List[ContrastPair]:
+        """Pairs below the WCAG AA threshold, including pairs whose ratio could not be computed."""
+        return [pair for pair in self.pairs if not pair.passes_aa]
+
+    @property
+    def aaa_failures(self) -> List[ContrastPair]:
+        """Pairs which meet AA but fall below the WCAG AAA threshold."""
+        return [pair for pair in self.pairs if pair.passes_aa and not pair.passes_aaa]
+
+    def get_ratio(self, palette: str, role: str) -> Optional[float]:
+        role_names = [contrast_role.name for contrast_role in self.roles]
+        return self.ratios[self.palettes.index(palette)][role_names.index(role)]
+
+    def to_dict(self) -> Dict[str, object]:
+        """Return the failing pairs grouped by level.
+
+        Returns:
+            Example return: ``{"aa": [{"palette": "default", "role": "primary_link", "ratio": 3.27, ...}], "aaa": [...]}``.
+        """
+        return {
+            "aa": [pair.to_dict() for pair in self.aa_failures],
+            "aaa": [pair.to_dict() for pair in self.aaa_failures],
+        }
+
+
+def get_relative_luminances(colors: Sequence[str]) -> List[Optional[float]]:
+    """Return the relative luminance of each color, normalizing each color string once.
+
+    Args:
+        colors: CSS color strings.
+
+    Returns:
+        Luminance per color, or ``None`` for colors which cannot be parsed.
+        Example return: ``[1.0, 0.0, None]`` for ``["#fff", "black", "oops"]``.
+    """
+    rgb_values = [normalize_color(color) for color in colors]
+    parsed = [rgb for rgb in rgb_values if rgb is not None]
+
+    if numpy is not None and parsed:
+        components = numpy.array(parsed, dtype=float)
+        linear = numpy.where(components <= 0.03928, components / 12.92, ((components + 0.055) / 1.055) ** 2.4)
+        parsed_luminances = iter((linear @ numpy.array([0.2126, 0.7152, 0.0722])).tolist())
+    else:
+        parsed_luminances = iter([get_relative_luminance(rgb) for rgb in parsed])
+
+    return [None if rgb is None else next(parsed_luminances) for rgb in rgb_values]
+
+
+def compute_contrast_matrix(
+    foregrounds: Sequence[Sequence[Optional[str]]],
+    backgrounds: Sequence[Sequence[Optional[str]]],
+) -> RatioMatrix:
+    """Compute contrast ratios for matrices of foreground and background colors.
+
+    Args:
+        foregrounds: Foreground colors indexed by ``[row][column]``.
+        backgrounds: Background colors with the same shape as ``foregrounds``.
+
+    Returns:
+        Ratio matrix of the same shape, with ``None`` where a color is missing
+        or cannot be parsed. Example return: ``[[21.0, None]]`` for
+        ``[["#000", None]]`` on ``[["#fff", "#fff"]]``.
+    """
+    unique_colors = sorted({color for rows in (foregrounds, backgrounds) for row in rows for color in row if color})
+    color_index = {color: index for index, color in enumerate(unique_colors)}
+    luminances = get_relative_luminances(unique_colors)
+
+    def to_indexes(rows: Sequence[Sequence[Optional[str]]]) -> List[List[int]]:
+        return [[color_index[color] if color and luminances[color_index[color]] is not None else -1 for color in row] for row in rows]
+
+    fg_indexes = to_indexes(foregrounds)
+    bg_indexes = to_indexes(backgrounds)
+
+    if numpy is not None and fg_indexes and all(fg_indexes):
+        luminance_array = numpy.array([numpy.nan if luminance is None else luminance for luminance in luminances] + [numpy.nan])
+        fg_luminance = luminance_array[numpy.array(fg_indexes)]
+        bg_luminance = luminance_array[numpy.array(bg_indexes)]
+        ratios = (numpy.maximum(fg_luminance, bg_luminance) + 0.05) / (numpy.minimum(fg_luminance, bg_luminance) + 0.05)
+        return [[None if numpy.isnan(ratio) else ratio for ratio in row] for row in ratios.tolist()]
+
+    matrix: RatioMatrix = []
+    for fg_row, bg_row in zip(fg_indexes, bg_indexes):
+        row: List[Optional[float]] = []
+        for fg_index, bg_index in zip(fg_row, bg_row):
+            if fg_index < 0 or bg_index < 0:
+                row.append(None)
+                continue
+            lighter, darker = sorted((luminances[fg_index], luminances[bg_index]), reverse=True)
+            row.append((lighter + 0.05) / (darker + 0.05))
+        matrix.append(row)
+    return matrix
+
+
+def build_palette_contrast_report(
+    all_palette_css_attributes: Dict[str, Dict[str, str]],
+    roles: Sequence[ContrastRole] = PALETTE_CONTRAST_ROLES,
+    palettes: Optional[Sequence[str]] = None,
+) -> ContrastReport:
+    """Check every palette and role against the WCAG AA and AAA thresholds.
+
+    Args:
+        all_palette_css_attributes: Palette attributes keyed by palette name, as
+            returned by ``load_all_palette_css_attributes``.
+        roles: Foreground/background roles to check.
+        palettes: Palette names to include. Defaults to every palette.
+
+    Returns:
+        :class:`ContrastReport` with the ratio matrix and a pair per palette and role.
+        Roles are treated as large text when the palette's ``global-font-size``
+        is at least 24px.
+    """
+    palette_names = list(palettes) if palettes is not None else list(all_palette_css_attributes)
+    role_list = list(roles)
+    attributes = [all_palette_css_attributes.get(palette_name, {}) for palette_name in palette_names]
+
+    foregrounds = [[palette.get(role.foreground) for role in role_list] for palette in attributes]
+    backgrounds = [[palette.get(role.background) for role in role_list] for palette in attributes]
+    ratios = compute_contrast_matrix(foregrounds, backgrounds)
+
+    pairs: List[ContrastPair] = []
+    for row, palette_name in enumerate(palette_names):
+        font_size = get_font_size(attributes[row])
+        for column, role in enumerate(role_list):
+            pairs.append(
+                ContrastPair(
+                    palette=palette_name,
+                    role=role.name,
+                    foreground=foregrounds[row][column],
+                    background=backgrounds[row][column],
+                    ratio=ratios[row][column],
+                    large_text=role.large_text or font_size >= 24,
+                )
+            )
+
+    return ContrastReport(palettes=palette_names, roles=role_list, ratios=ratios, pairs=pairs)
+
+
+def get_font_size(palette_attributes: Dict[str, str]) -> float:
+    font_size = palette_attributes.get("global-font-size", "")
+    try:
+        return float(font_size.replace("px", "").strip())
+    except ValueError:
+        return DEFAULT_FONT_SIZE
+
+
+__all__ = [
+    "PALETTE_CONTRAST_ROLES",
+    "ContrastPair",
+    "ContrastReport",
+    "ContrastRole",
+    "build_palette_contrast_report",
+    "compute_contrast_matrix",
+    "get_relative_luminances",
+]
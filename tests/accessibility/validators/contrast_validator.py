@@ -5,10 +5,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Sequence
 
-from bs4 import BeautifulSoup
+from bs4 import Tag
 
-from tests.accessibility.utilities import extract_css_variables, get_element_computed_styles
+from tests.accessibility.utilities import get_element_computed_styles
+from tests.accessibility.utilities.cascade import get_page_style_resolver, has_own_text
 from tests.accessibility.utilities.color_utils import get_contrast_ratio, meets_wcag_aa
+from .engine import HtmlSource, PageDocument, ValidationRule, register_rule, run_rule
 from .helpers import format_violation
 
 
@@ -91,46 +93,38 @@ def assert_contrast_meets_wcag_aa(
     )
 
 
-def validate_color_contrast(html: str, filename: str = "index.html", css_content: str = "") -> List[str]:
-    """Validate color contrast meets WCAG 2.1 AA standards for theme elements."""
-    violations: List[str] = []
-    soup = BeautifulSoup(html, "html.parser")
-
-    css_variables = extract_css_variables(html, css_content)
-
-    body = soup.find("body")
-    body_styles = get_element_computed_styles(body, css_variables) if body else {}
-    body_bg_color = body_styles.get("background-color")
-
-    if not body_bg_color:
-        return violations
-
-    elements_to_check = soup.find_all([
-        "body",
-        "p",
-        "a",
-        "button",
-        "input",
-        "label",
-        "h1",
-        "h2",
-        "h3",
-        "h4",
-        "h5",
-        "h6",
-    ])
-
-    for element in elements_to_check:
+@register_rule
+class ContrastRule(ValidationRule):
+    """Every rendered text element must meet WCAG 2.1 AA contrast against its background.
+
+    Styles are computed with the page's full CSS cascade, so each element is
+    checked against the colors it actually renders with.
+    """
+
+    name = "color_contrast"
+
+    def start(self, page: PageDocument) -> None:
+        self.violations: List[str] = []
+        self.css_variables = page.get_css_variables()
+        self.resolver = get_page_style_resolver(page.soup, page.css_content)
+        body = page.soup.find("body")
+        body_styles = get_element_computed_styles(body, self.css_variables, self.resolver) if body else {}
+        self.body_bg_color = body_styles.get("background-color")
+
+    def visit(self, element: Tag, page: PageDocument) -> None:
+        if not self.body_bg_color:
+            return
+
+        if not has_own_text(element) or not self.resolver.is_displayed(element):
+            return
         text_content = element.get_text(strip=True)
-        if not text_content:
-            continue
 
-        element_styles = get_element_computed_styles(element, css_variables)
+        element_styles = get_element_computed_styles(element, self.css_variables, self.resolver)
         fg_color = element_styles.get("color")
         if not fg_color:
-            continue
+            return
 
-        bg_color = element_styles.get("background-color") or body_bg_color
+        bg_color = element_styles.get("background-color") or self.body_bg_color
 
         ratio = get_contrast_ratio(fg_color, bg_color)
 
@@ -146,20 +140,27 @@ def validate_color_contrast(html: str, filename: str = "index.html", css_content
             elif element_desc in ["button", "input", "label"]:
                 element_desc = f"{element_desc} element"
 
-            violations.append(
+            self.violations.append(
                 format_violation(
                     f"Insufficient color contrast on {element_desc}: {ratio:.2f}:1 "
                     f"(need {4.5 if not is_large_text else 3.0}:1 for WCAG AA). "
                     f"Color: {fg_color}, Background: {bg_color}",
-                    filename,
+                    page.filename,
                     element,
                 )
             )
 
-    return violations
+    def finish(self, page: PageDocument) -> List[str]:
+        return self.violations
+
+
+def validate_color_contrast(html: HtmlSource, filename: str = "index.html", css_content: str = "") -> List[str]:
+    """Validate color contrast meets WCAG 2.1 AA standards for theme elements."""
+    return run_rule(ContrastRule, html, filename, css_content)
 
 
 __all__ = [
+    "ContrastRule",
     "validate_color_contrast",
     "PaletteColors",
     "assert_contrast_meets_wcag_aa",
@@ -0,0 +1,207 @@
+"""Single-parse validation engine for accessibility validators.
+
+Each validator is a :class:`ValidationRule`. The engine parses a page once and
+walks its tree once, handing every element to the rules interested in its tag.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Type, Union
+
+from bs4 import BeautifulSoup, Tag
+
+from tests.accessibility.utilities import SiteContext, extract_css_variables, parse_html
+
+HtmlSource = Union[str, BeautifulSoup, SiteContext]
+
+
+@dataclass
+class PageDocument:
+    """A parsed page shared by every rule during one validation pass.
+
+    Args:
+        filename: Name used when formatting violations.
+        soup: Parsed document.
+        html: Raw HTML when available. ``None`` when only a soup was provided.
+        css_content: Combined CSS text for the page.
+        css_variables: Resolved CSS custom properties. Computed on first use
+            when not provided.
+    """
+
+    filename: str
+    soup: BeautifulSoup
+    html: Optional[str] = None
+    css_content: str = ""
+    css_variables: Optional[Dict[str, str]] = None
+
+    def get_css_variables(self) -> Dict[str, str]:
+        if self.css_variables is None:
+            self.css_variables = extract_css_variables(self.soup, self.css_content)
+        return self.css_variables
+
+    def get_html(self) -> str:
+        if self.html is None:
+            self.html = str(self.soup)
+        return self.html
+
+
+class ValidationRule:
+    """Base class for validators run by :class:`ValidationEngine`.
+
+    A new rule instance is created for every page, so rules may keep per-page
+    state on ``self``.
+
+    Attributes:
+        name: Unique name used as the key in validation results.
+        tags: Element names passed to :meth:`visit`. ``None`` visits every element
+            and an empty set visits none.
+    """
+
+    name: str = ""
+    tags: Optional[FrozenSet[str]] = None
+
+    def start(self, page: PageDocument) -> None:
+        """Prepare per-page state before the tree walk."""
+
+    def visit(self, element: Tag, page: PageDocument) -> None:
+        """Inspect one element during the tree walk."""
+
+    def finish(self, page: PageDocument) -> List[str]:
+        """Return the violations found on the page."""
+        return []
+
+
+RuleReference = Union[str, Type[ValidationRule]]
+_REGISTERED_RULES: Dict[str, Type[ValidationRule]] = {}
+
+
+def register_rule(rule_class: Type[ValidationRule]) -> Type[ValidationRule]:
+    """Register ``rule_class`` so that it runs in the default engine.
+
+    Args:
+        rule_class: :class:`ValidationRule` subclass with a unique ``name``.
+
+    Returns:
+        ``rule_class`` unchanged, so this can be used as a class decorator.
+    """
+    if not rule_class.name:
+        raise ValueError(f"{rule_class.__name__} must define a rule name")
+    _REGISTERED_RULES[rule_class.name] = rule_class
+    return rule_class
+
+
+def get_registered_rules() -> Dict[str, Type[ValidationRule]]:
+    """Return registered rules keyed by name. Example return: ``{"aria_buttons": AriaButtonsRule, ...}``."""
+    return dict(_REGISTERED_RULES)
+
+
+def load_page(
+    source: HtmlSource,
+    filename: Optional[str] = None,
+    css_content: str = "",
+    parser: Optional[str] = None,
+) -> PageDocument:
+    """Wrap an HTML string, parsed soup or :class:`SiteContext` as a :class:`PageDocument`.
+
+    Args:
+        source: Raw HTML, an already parsed document, or a site context whose
+            ``soup`` is reused.
+        filename: Name used in violation messages. Defaults to ``"index.html"``
+            or the site context's file name.
+        css_content: Combined CSS text for the page. Ignored for site contexts.
+        parser: Optional BeautifulSoup parser name used for raw HTML.
+
+    Returns:
+        Page document ready for validation.
+    """
+    if isinstance(source, SiteContext):
+        return PageDocument(
+            filename=filename or source.html_file.name,
+            soup=source.soup,
+            html=source.html_content,
+            css_content=source.css_content,
+            css_variables=source.css_variables,
+        )
+    if isinstance(source, BeautifulSoup):
+        return PageDocument(filename=filename or "index.html", soup=source, css_content=css_content)
+    return PageDocument(
+        filename=filename or "index.html",
+        soup=parse_html(source, parser),
+        html=source,
+        css_content=css_content,
+    )
+
+
+class ValidationEngine:
+    """Run several validation rules over a page with one parse and one tree walk.
+
+    Args:
+        rules: Rule names or classes to run. Defaults to every registered rule.
+        parser: Optional BeautifulSoup parser name used for raw HTML.
+    """
+
+    def __init__(self, rules: Optional[Iterable[RuleReference]] = None, parser: Optional[str] = None):
+        registered = get_registered_rules()
+        if rules is None:
+            self.rule_classes: List[Type[ValidationRule]] = list(registered.values())
+        else:
+            self.rule_classes = [registered[rule] if isinstance(rule, str) else rule for rule in rules]
+        self.parser = parser
+
+    def validate(self, source: HtmlSource, filename: Optional[str] = None, css_content: str = "") -> Dict[str, List[str]]:
+        """Validate ``source`` with every rule.
+
+        Args:
+            source: Raw HTML, an already parsed document, or a :class:`SiteContext`.
+            filename: Name used in violation messages.
+            css_content: Combined CSS text for the page, used by contrast rules.
+
+        Returns:
+            Violations keyed by rule name. Example return:
+            ``{"aria_buttons": [], "duplicate_ids": ["index.html: Duplicate ID found: nav"]}``.
+        """
+        page = load_page(source, filename, css_content, self.parser)
+        rules = [rule_class() for rule_class in self.rule_classes]
+        rules_for_every_element: List[ValidationRule] = []
+        rules_by_tag: Dict[str, List[ValidationRule]] = {}
+        for rule in rules:
+            rule.start(page)
+            if rule.tags is None:
+                rules_for_every_element.append(rule)
+            else:
+                for tag in rule.tags:
+                    rules_by_tag.setdefault(tag, []).append(rule)
+
+        if rules_for_every_element or rules_by_tag:
+            for element in page.soup.descendants:
+                if not isinstance(element, Tag):
+                    continue
+                for rule in rules_for_every_element:
+                    rule.visit(element, page)
+                for rule in rules_by_tag.get(element.name, ()):
+                    rule.visit(element, page)
+
+        return {rule.name: rule.finish(page) for rule in rules}
+
+    def validate_all(self, source: HtmlSource, filename: Optional[str] = None, css_content: str = "") -> List[str]:
+        """Validate ``source`` and return every violation as one flat list."""
+        results = self.validate(source, filename, css_content)
+        return [violation for violations in results.values() for violation in violations]
+
+
+def run_rule(rule_class: Type[ValidationRule], source: HtmlSource, filename: str = "index.html", css_content: str = "") -> List[str]:
+    """Run a single rule over ``source`` and return its violations."""
+    return ValidationEngine([rule_class]).validate(source, filename, css_content)[rule_class.name]
+
+
+__all__ = [
+    "HtmlSource",
+    "PageDocument",
+    "ValidationEngine",
+    "ValidationRule",
+    "get_registered_rules",
+    "load_page",
+    "register_rule",
+    "run_rule",
+]
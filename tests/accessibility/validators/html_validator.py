@@ -2,118 +2,194 @@
 
 from __future__ import annotations
 
-from typing import List, Set
+from typing import List, Optional, Set
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 from tidylib import tidy_document
 
+from .engine import HtmlSource, PageDocument, ValidationRule, register_rule, run_rule
 from .helpers import format_violation
 
 
-def validate_duplicate_ids(html: str, filename: str = "index.html") -> List[str]:
-    """Validate that no duplicate IDs exist in the provided HTML."""
-    violations: List[str] = []
-    soup = BeautifulSoup(html, "html.parser")
+def is_tidy_available() -> bool:
+    """Return ``True`` when the HTML Tidy library (libtidy) can be loaded."""
+    try:
+        tidy_document("")
+    except OSError:
+        return False
+    return True
 
-    all_ids: Set[str] = set()
-    for element in soup.find_all(id=True):
-        element_id = element.get("id", "")
-        if element_id in all_ids:
-            violations.append(format_violation(f"Duplicate ID found: {element_id}", filename, element))
-        all_ids.add(element_id)
 
-    return violations
+TIDY_AVAILABLE = is_tidy_available()
 
 
-def validate_semantic_html(html: str, filename: str = "index.html") -> List[str]:
-    """Validate semantic HTML structure for the theme output."""
-    violations: List[str] = []
-    soup = BeautifulSoup(html, "html.parser")
-
-    main_elements = soup.find_all("main")
-    if len(main_elements) != 1:
-        violations.append(
-            format_violation(
-                f"Expected exactly 1 <main> element, found {len(main_elements)}",
-                filename,
-            )
-        )
+@register_rule
+class DuplicateIdsRule(ValidationRule):
+    """Element ids must be unique within a page."""
+
+    name = "duplicate_ids"
+
+    def start(self, page: PageDocument) -> None:
+        self.ids: Set[str] = set()
+        self.violations: List[str] = []
 
-    if main_elements:
-        main_elem = main_elements[0]
-        if main_elem.parent.name != "body":
+    def visit(self, element: Tag, page: PageDocument) -> None:
+        if not element.has_attr("id"):
+            return
+        element_id = element.get("id", "")
+        if element_id in self.ids:
+            self.violations.append(format_violation(f"Duplicate ID found: {element_id}", page.filename, element))
+        self.ids.add(element_id)
+
+    def finish(self, page: PageDocument) -> List[str]:
+        return self.violations
+
+
+@register_rule
+class SemanticHtmlRule(ValidationRule):
+    """The page needs one <main> directly under <body>, labelled <nav>s and no header/footer inside main."""
+
+    name = "semantic_html"
+    tags = frozenset(["main", "nav", "header", "footer"])
+
+    def start(self, page: PageDocument) -> None:
+        self.main_elements: List[Tag] = []
+        self.nav_elements: List[Tag] = []
+        self.header_in_main: Optional[Tag] = None
+        self.footer_in_main: Optional[Tag] = None
+
+    def visit(self, element: Tag, page: PageDocument) -> None:
+        if element.name == "main":
+            self.main_elements.append(element)
+        elif element.name == "nav":
+            self.nav_elements.append(element)
+        elif self.main_elements and self.is_in_first_main(element):
+            if element.name == "header" and self.header_in_main is None:
+                self.header_in_main = element
+            elif element.name == "footer" and self.footer_in_main is None:
+                self.footer_in_main = element
+
+    def is_in_first_main(self, element: Tag) -> bool:
+        return any(parent is self.main_elements[0] for parent in element.parents)
+
+    def finish(self, page: PageDocument) -> List[str]:
+        violations: List[str] = []
+        filename = page.filename
+        main_elements = self.main_elements
+        if len(main_elements) != 1:
             violations.append(
                 format_violation(
-                    f"<main> should be direct child of <body>, found parent: {main_elem.parent.name}",
+                    f"Expected exactly 1 <main> element, found {len(main_elements)}",
                     filename,
-                    main_elem,
                 )
             )
 
-    nav_elements = soup.find_all("nav")
-    if len(nav_elements) > 1:
-        for nav in nav_elements:
-            if not nav.get("aria-label"):
+        if main_elements:
+            main_elem = main_elements[0]
+            if main_elem.parent.name != "body":
                 violations.append(
                     format_violation(
-                        "Multiple <nav> elements should have aria-label to distinguish them",
+                        f"<main> should be direct child of <body>, found parent: {main_elem.parent.name}",
                         filename,
-                        nav,
+                        main_elem,
                     )
                 )
 
-    if main_elements:
-        main_elem = main_elements[0]
+        if len(self.nav_elements) > 1:
+            for nav in self.nav_elements:
+                if not nav.get("aria-label"):
+                    violations.append(
+                        format_violation(
+                            "Multiple <nav> elements should have aria-label to distinguish them",
+                            filename,
+                            nav,
+                        )
+                    )
 
-        header_in_main = main_elem.find("header")
-        if header_in_main:
+        if self.header_in_main is not None:
             violations.append(
                 format_violation(
                     "<header> should not be nested inside <main> (should be theme header outside main content)",
                     filename,
-                    header_in_main,
+                    self.header_in_main,
                 )
             )
 
-        footer_in_main = main_elem.find("footer")
-        if footer_in_main:
+        if self.footer_in_main is not None:
             violations.append(
                 format_violation(
                     "<footer> should not be nested inside <main> (should be theme footer outside main content)",
                     filename,
-                    footer_in_main,
+                    self.footer_in_main,
                 )
             )
 
-    return violations
+        return violations
+
+
+class HtmlStructureRule(ValidationRule):
+    """HTML Tidy must not report structural errors. Runs on the raw HTML, not the tree.
+
+    Pages given as a parsed soup are skipped: the parser has already closed and
+    re-nested the tags that tidy should report. The rule is only registered in
+    the default engine when libtidy can be loaded.
+    """
+
+    name = "html_structure"
+    tags = frozenset()
 
+    def finish(self, page: PageDocument) -> List[str]:
+        violations: List[str] = []
+        if page.html is None:
+            return violations
 
-def validate_html_structure(html: str, filename: str = "index.html") -> List[str]:
-    """Validate HTML5 structure and element nesting using HTML Tidy."""
-    violations: List[str] = []
+        tidy_options = {
+            "doctype": "html5",
+        }
 
-    tidy_options = {
-        "doctype": "html5",
-    }
+        _, errors = tidy_document(page.html, options=tidy_options)
+        error_lines = errors.strip().split("\n") if errors.strip() else []
+        for error in error_lines:
+            if not error:
+                continue
 
-    _, errors = tidy_document(html, options=tidy_options)
-    error_lines = errors.strip().split("\n") if errors.strip() else []
-    for error in error_lines:
-        if not error:
-            continue
+            is_structural_issue = any(
+                keyword in error.lower()
+                for keyword in [
+                    "unexpected",
+                    "missing </",
+                    "previously",
+                    "discarding",
+                    "occurs after end",
+                ]
+            )
+
+            if is_structural_issue:
+                violations.append(format_violation(error, page.filename))
+
+        return violations
+
+
+if TIDY_AVAILABLE:
+    register_rule(HtmlStructureRule)
+
+
+def validate_duplicate_ids(html: HtmlSource, filename: str = "index.html") -> List[str]:
+    """Validate that no duplicate IDs exist in the provided HTML."""
+    return run_rule(DuplicateIdsRule, html, filename)
+
+
+def validate_semantic_html(html: HtmlSource, filename: str = "index.html") -> List[str]:
+    """Validate semantic HTML structure for the theme output."""
+    return run_rule(SemanticHtmlRule, html, filename)
 
-        is_structural_issue = any(
-            keyword in error.lower()
-            for keyword in [
-                "unexpected",
-                "missing </",
-                "previously",
-                "discarding",
-                "occurs after end",
-            ]
-        )
 
-        if is_structural_issue:
-            violations.append(format_violation(error, filename))
+def validate_html_structure(html: HtmlSource, filename: str = "index.html") -> List[str]:
+    """Validate HTML5 structure and element nesting using HTML Tidy.
 
-    return violations
+    Raises:
+        TypeError: ``html`` is a parsed soup instead of raw HTML or a site context.
+    """
+    if isinstance(html, BeautifulSoup):
+        raise TypeError("validate_html_structure needs the raw HTML, not a parsed soup")
+    return run_rule(HtmlStructureRule, html, filename)
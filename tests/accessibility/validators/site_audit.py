@@ -0,0 +1,167 @@
+"""Parallel whole-site accessibility audits.
+
+The HTML files of a built site are split into shards which are validated in a
+process pool. Each worker builds its own :class:`SiteContextBuilder` and runs
+the :class:`ValidationEngine` over its shard; the results are merged into a
+single :class:`AuditReport`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from tests.accessibility.utilities import SiteContextBuilder, get_site_path
+from tests.accessibility.utilities.site_context import PathLike
+from .engine import RuleReference, ValidationEngine
+
+PageResults = Dict[str, List[str]]
+SHARDS_PER_WORKER = 4
+
+
+@dataclass
+class AuditReport:
+    """Merged validation results for a built site.
+
+    Args:
+        site_path: Root directory of the audited site.
+        pages: Violations keyed by page path (relative to ``site_path``) and rule name.
+    """
+
+    site_path: Path
+    pages: Dict[str, PageResults] = field(default_factory=dict)
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages)
+
+    @property
+    def violations(self) -> List[str]:
+        """Every violation in page order. Example return: ``["about/index.html: Duplicate ID found: nav"]``."""
+        return [violation for results in self.pages.values() for violations in results.values() for violation in violations]
+
+    def by_rule(self) -> Dict[str, List[str]]:
+        """Return every violation grouped by rule name.
+
+        Returns:
+            Violations keyed by rule name. Example return:
+            ``{"aria_buttons": [], "duplicate_ids": ["index.html: Duplicate ID found: nav"]}``.
+        """
+        grouped: Dict[str, List[str]] = {}
+        for results in self.pages.values():
+            for rule_name, violations in results.items():
+                grouped.setdefault(rule_name, []).extend(violations)
+        return grouped
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "site_path": str(self.site_path),
+            "page_count": self.page_count,
+            "violation_count": len(self.violations),
+            "rules": self.by_rule(),
+        }
+
+
+def audit_pages(
+    site_path: PathLike,
+    html_files: Sequence[str],
+    rules: Optional[Sequence[RuleReference]] = None,
+) -> List[Tuple[str, PageResults]]:
+    """Validate one shard of a site. Runs inside the audit worker processes.
+
+    Args:
+        site_path: Root directory of the built site.
+        html_files: Page paths relative to ``site_path``.
+        rules: Rule names or classes to run. Defaults to every registered rule.
+
+    Returns:
+        ``(relative_path, results)`` pairs in the order of ``html_files``.
+        Example return: ``[("index.html", {"aria_buttons": [], ...})]``.
+    """
+    builder = SiteContextBuilder(site_path, max_contexts=1)
+    engine = ValidationEngine(rules)
+    return [(html_file, engine.validate(builder.build_context(html_file), html_file)) for html_file in html_files]
+
+
+def shard_html_files(html_files: Sequence[str], shard_count: int) -> List[List[str]]:
+    """Split ``html_files`` into at most ``shard_count`` contiguous shards of similar size."""
+    if not html_files:
+        return []
+    shard_size = math.ceil(len(html_files) / max(shard_count, 1))
+    return [list(html_files[index:index + shard_size]) for index in range(0, len(html_files), shard_size)]
+
+
+def audit_site(
+    site_path: PathLike,
+    rules: Optional[Iterable[RuleReference]] = None,
+    workers: Optional[int] = None,
+    shard_count: Optional[int] = None,
+) -> AuditReport:
+    """Validate every HTML file under ``site_path`` using a process pool.
+
+    Args:
+        site_path: Root directory of the built site.
+        rules: Rule names or classes to run. Defaults to every registered rule
+            (contrast, ARIA, and HTML structure when libtidy can be loaded).
+            Rule classes must be importable by the worker processes.
+        workers: Number of worker processes. Defaults to ``os.cpu_count()``.
+            ``1`` validates every page in the current process.
+        shard_count: Number of shards to split the site into. Defaults to a few
+            shards per worker so that slow pages do not leave workers idle.
+
+    Returns:
+        Merged :class:`AuditReport` with pages in path order.
+    """
+    root = get_site_path(site_path)
+    rule_list = list(rules) if rules is not None else None
+    html_files = sorted(path.relative_to(root).as_posix() for path in root.glob("**/*.html"))
+    workers = workers or os.cpu_count() or 1
+    shards = shard_html_files(html_files, shard_count or workers * SHARDS_PER_WORKER)
+
+    report = AuditReport(site_path=root)
+    if workers == 1 or len(shards) <= 1:
+        for shard in shards:
+            report.pages.update(audit_pages(root, shard, rule_list))
+        return report
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as executor:
+        futures = [executor.submit(audit_pages, root, shard, rule_list) for shard in shards]
+        for future in futures:
+            report.pages.update(future.result())
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Audit every page of a built site for accessibility violations.")
+    parser.add_argument("site_path", help="built site directory")
+    parser.add_argument("--rules", nargs="+", help="rule names to run (default: all registered rules)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: cpu count)")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = audit_site(args.site_path, rules=args.rules, workers=args.workers)
+    for violation in report.violations:
+        print(violation)
+    print("%d violation(s) in %d page(s)" % (len(report.violations), report.page_count))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+    return 1 if report.violations else 0
+
+
+__all__ = [
+    "AuditReport",
+    "audit_pages",
+    "audit_site",
+    "shard_html_files",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
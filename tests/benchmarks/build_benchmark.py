@@ -0,0 +1,200 @@
+"""Build benchmarks for the example sites and synthetic large sites.
+
+Run from the repository root::
+
+    python -m tests.benchmarks.build_benchmark --output benchmark.json
+    python -m tests.benchmarks.build_benchmark --baseline benchmark.json
+
+Each case is built in a fresh process so that peak memory is measured per build.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from typing import List, Optional
+
+from mkdocs.commands.build import build
+
+from tests.e2e_helper import load_example_config
+from tests.synthetic_site import SyntheticSiteOptions, generate_site, load_site_config
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - windows
+    resource = None
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+DEFAULT_SYNTHETIC_PAGE_COUNTS = [1000, 10000]
+DEFAULT_NAV_DEPTH = 4
+DEFAULT_REPEAT = 1
+DEFAULT_THRESHOLD = 0.2
+COMPARED_METRICS = ["build_seconds", "peak_memory_bytes", "output_bytes"]
+
+
+@dataclass
+class BenchmarkCase:
+    """An example site or a synthetic site with page_count pages nested nav_depth levels deep."""
+
+    name: str
+    example_name: Optional[str] = None
+    page_count: int = 0
+    nav_depth: int = DEFAULT_NAV_DEPTH
+    tiles_per_page: int = 0
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    build_seconds: float
+    peak_memory_bytes: Optional[int]
+    output_bytes: int
+    output_files: int
+
+
+def get_example_names() -> List[str]:
+    """Return the names of the example sites under tests/examples."""
+    return sorted(path.name for path in EXAMPLES_DIR.iterdir() if (path / "docs").is_dir())
+
+
+def get_default_cases(examples=None, page_counts=None, nav_depth=DEFAULT_NAV_DEPTH, tiles_per_page=0) -> List[BenchmarkCase]:
+    examples = get_example_names() if examples is None else examples
+    page_counts = DEFAULT_SYNTHETIC_PAGE_COUNTS if page_counts is None else page_counts
+    cases = [BenchmarkCase(name=f"example:{name}", example_name=name) for name in examples]
+    cases += [
+        BenchmarkCase(
+            name=f"synthetic:{count}:depth{nav_depth}:tiles{tiles_per_page}",
+            page_count=count,
+            nav_depth=nav_depth,
+            tiles_per_page=tiles_per_page,
+        )
+        for count in page_counts
+    ]
+    return cases
+
+
+def load_case_config(case: BenchmarkCase, work_dir: Path):
+    site_dir = work_dir / "site"
+    if case.example_name is not None:
+        return load_example_config(case.example_name, site_dir)
+    options = SyntheticSiteOptions(
+        page_count=case.page_count,
+        nav_depth=case.nav_depth,
+        tiles_per_page=case.tiles_per_page,
+        site_name=case.name,
+    )
+    return load_site_config(generate_site(work_dir / "project", options), site_dir)
+
+
+def get_peak_memory_bytes() -> Optional[int]:
+    """Return the peak resident set size of the current process."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macOS reports bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def get_output_size(site_dir: Path):
+    files = [path for path in site_dir.rglob("*") if path.is_file()]
+    return sum(path.stat().st_size for path in files), len(files)
+
+
+def run_case(case: BenchmarkCase, work_dir: str, repeat: int = DEFAULT_REPEAT) -> BenchmarkResult:
+    """Build case repeat times in the current process and return the fastest build time."""
+    work_path = Path(work_dir)
+    config = load_case_config(case, work_path)
+    build_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build(config)
+        build_times.append(time.perf_counter() - start)
+    output_bytes, output_files = get_output_size(Path(config.site_dir))
+    return BenchmarkResult(
+        name=case.name,
+        build_seconds=round(min(build_times), 4),
+        peak_memory_bytes=get_peak_memory_bytes(),
+        output_bytes=output_bytes,
+        output_files=output_files,
+    )
+
+
+def run_benchmarks(cases: List[BenchmarkCase], repeat: int = DEFAULT_REPEAT) -> List[BenchmarkResult]:
+    """Run each case in a fresh process so that peak memory is not shared between cases."""
+    results = []
+    for case in cases:
+        with tempfile.TemporaryDirectory(prefix="terminal-benchmark-") as work_dir:
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                results.append(executor.submit(run_case, case, work_dir, repeat).result())
+    return results
+
+
+def compare_results(results: List[BenchmarkResult], baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """Return a message for every metric which grew by more than threshold compared to baseline."""
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None:
+            continue
+        for metric in COMPARED_METRICS:
+            current_value = getattr(result, metric)
+            previous_value = previous.get(metric)
+            if not current_value or not previous_value:
+                continue
+            if current_value > previous_value * (1 + threshold):
+                regressions.append(
+                    f"{result.name} {metric} regressed: {previous_value} -> {current_value} "
+                    f"(+{(current_value / previous_value - 1) * 100:.1f}%)"
+                )
+    return regressions
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    lines = [f"{'case':<40} {'build (s)':>10} {'peak mem (MB)':>14} {'output (MB)':>12} {'files':>8}"]
+    for result in results:
+        peak_memory = f"{result.peak_memory_bytes / 2**20:.1f}" if result.peak_memory_bytes else "n/a"
+        lines.append(
+            f"{result.name:<40} {result.build_seconds:>10.3f} {peak_memory:>14} "
+            f"{result.output_bytes / 2**20:>12.2f} {result.output_files:>8}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Terminal for MkDocs site builds.")
+    parser.add_argument("--examples", nargs="*", default=None, help="example sites to build (default: all)")
+    parser.add_argument("--pages", nargs="*", type=int, default=None, help="synthetic site page counts (default: 1000 10000)")
+    parser.add_argument("--nav-depth", type=int, default=DEFAULT_NAV_DEPTH, help="synthetic site nav depth")
+    parser.add_argument("--tiles", type=int, default=0, help="synthetic site tiles per page")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="builds per case, fastest is reported")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed relative growth before failing")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    cases = get_default_cases(args.examples, args.pages, args.nav_depth, args.tiles)
+    results = run_benchmarks(cases, args.repeat)
+    print(format_results(results))
+    if args.output:
+        args.output.write_text(json.dumps({result.name: asdict(result) for result in results}, indent=2), encoding="utf-8")
+    if args.baseline:
+        regressions = compare_results(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.threshold)
+        for regression in regressions:
+            print(regression, file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+from tests.benchmarks.build_benchmark import (
+    BenchmarkCase, BenchmarkResult, compare_results, get_default_cases, get_example_names, run_case
+)
+
+
+def test_that_every_example_has_a_case():
+    names = [case.name for case in get_default_cases(page_counts=[])]
+    assert names == [f"example:{name}" for name in get_example_names()]
+    assert "example:minimal" in names
+
+
+def test_that_example_build_is_measured(tmp_path):
+    result = run_case(BenchmarkCase(name="example:minimal", example_name="minimal"), str(tmp_path))
+    assert result.build_seconds > 0
+    assert result.output_bytes > 0
+    assert result.output_files > 0
+
+
+def test_that_synthetic_build_is_measured(tmp_path):
+    result = run_case(BenchmarkCase(name="synthetic", page_count=20, nav_depth=3, tiles_per_page=2), str(tmp_path))
+    assert (tmp_path / "site" / "section-0" / "section-0" / "page-1" / "index.html").exists()
+    assert result.output_files > 20
+
+
+def test_that_regressions_are_reported():
+    result = BenchmarkResult(name="case", build_seconds=2.0, peak_memory_bytes=100, output_bytes=1000, output_files=1)
+    baseline = {"case": {"build_seconds": 1.0, "peak_memory_bytes": 100, "output_bytes": 1000}}
+    regressions = compare_results([result], baseline, threshold=0.2)
+    assert len(regressions) == 1
+    assert "build_seconds" in regressions[0]
@@ -4,7 +4,7 @@ from jinja2.environment import Environment
 from tests.interface.tile import Tile
 from tests import defaults
 from tests.utils.filters import mock_url_filter, mock_markup_filter
-from tests.e2e_helper import build_example_site
+from tests.e2e_helper import build_example_site, get_build_cache_dir, prebuild_example_sites
 from terminal.plugins.md_to_html.plugin import DEFAULT_MARKUP_FILTER_NAME
 from terminal.pluglets.tile_grid.macro import TileGridMacroEnvironment
 from unittest.mock import MagicMock, PropertyMock
@@ -316,16 +316,49 @@ def all_palette_css_attributes():
     return load_all_palette_css_attributes()
 
 
+EXAMPLE_SITE_FIXTURES = {
+    "built_example_site_with_palette": ("minimal", "default"),
+    "built_example_site": "minimal",
+}
+EXAMPLE_BUILD_MATRIX_KEY = pytest.StashKey[list]()
+
+
+def get_example_build(fixture_name, param):
+    """Return the (example_name, palette_name) pair built for an example site fixture param."""
+    if fixture_name == "built_example_site_with_palette":
+        example_name, palette_name = param
+        return example_name, palette_name
+    return param, None
+
+
+def pytest_collection_modifyitems(config, items):
+    """Record every example site and palette combination requested by the collected tests."""
+    example_builds = {}
+    for item in items:
+        params = getattr(getattr(item, "callspec", None), "params", {})
+        for fixture_name, default_param in EXAMPLE_SITE_FIXTURES.items():
+            if fixture_name in getattr(item, "fixturenames", ()):
+                example_builds[get_example_build(fixture_name, params.get(fixture_name, default_param))] = None
+    config.stash[EXAMPLE_BUILD_MATRIX_KEY] = list(example_builds)
+
+
+@pytest.fixture(scope="session")
+def example_site_builds(tmp_path_factory, request):
+    """Build every example site needed by the session concurrently and return them keyed by (example_name, palette_name)."""
+    example_builds = request.config.stash.get(EXAMPLE_BUILD_MATRIX_KEY, [])
+    return prebuild_example_sites(tmp_path_factory, example_builds, get_build_cache_dir(request.config))
+
+
 @pytest.fixture(scope="session")
-def built_example_site_with_palette(tmp_path_factory, request):
+def built_example_site_with_palette(tmp_path_factory, request, example_site_builds):
     """Build an example site with a specified palette for accessibility tests."""
-    example_name, palette_name = getattr(request, "param", ("minimal", "default"))
-    return build_example_site(tmp_path_factory, example_name, palette_name)
+    example_name, palette_name = getattr(request, "param", EXAMPLE_SITE_FIXTURES["built_example_site_with_palette"])
+    return build_example_site(tmp_path_factory, example_name, palette_name, get_build_cache_dir(request.config))
 
 
 @pytest.fixture(scope="session")
-def built_example_site(tmp_path_factory, request):
+def built_example_site(tmp_path_factory, request, example_site_builds):
     """Build any example site for testing without overriding the palette."""
 
-    example_site_name = getattr(request, "param", "minimal")
-    return build_example_site(tmp_path_factory, example_site_name)
+    example_site_name = getattr(request, "param", EXAMPLE_SITE_FIXTURES["built_example_site"])
+    return build_example_site(tmp_path_factory, example_site_name, cache_dir=get_build_cache_dir(request.config))
@@ -2,29 +2,66 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 
+import mkdocs
 import yaml
 from mkdocs.commands.build import build
+from terminal.plugins.fingerprint.plugin import DEFAULT_MANIFEST_FILE_NAME
 from tests.integration_helper import load_config
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
 
-_BUILT_SITES: Dict[Tuple[str, Optional[str]], Path] = {}
+
+ExampleBuild = Tuple[str, Optional[str]]
+
+_BUILT_SITES: Dict[ExampleBuild, Path] = {}
+
+TESTS_DIR = Path(__file__).parent
+EXAMPLES_DIR = TESTS_DIR / "examples"
+THEME_DIR = TESTS_DIR.parent / "terminal"
+BASE_CONFIG_FILE = TESTS_DIR / "integration" / "base" / "mkdocs.yml"
+BUILD_CACHE_NAME = "example-sites"
+BUILD_CACHE_VERSION = "1"
+BUILD_COMPLETE_MARKER = ".build-complete"
+IGNORED_CACHE_KEY_PATTERNS = ("__pycache__", ".pyc")
+PREBUILD_WORKERS_ENV = "TERMINAL_PREBUILD_WORKERS"
+PALETTE_LINK_PATTERN = re.compile(r'(<link href="[^"]*?)css/palettes/[\w.-]+?\.css(" rel="stylesheet">)')
+PALETTE_COMMENT_PATTERN = re.compile(r"<!-- [\w-]+ color palette -->")
 
 
 def build_example_site(
     tmp_path_factory,
     example_name: str = "minimal",
     palette_name: Optional[str] = None,
+    cache_dir: Optional[Path] = None,
 ):
-    """Build the requested example site with an optional palette override."""
+    """Build the requested example site with an optional palette override.
+
+    Each example is only built once.  Palette variants are derived from the example's build
+    without a palette override (see derive_palette_site).  When cache_dir is given, the build
+    is shared with other pytest processes and later runs through the persistent cache in
+    cache_dir.  See get_cached_example_site.
+    """
     cache_key = (example_name, palette_name)
     cached_path = _BUILT_SITES.get(cache_key)
     if cached_path and cached_path.exists():
         return cached_path
 
-    site_path = _build_example_site(tmp_path_factory, example_name, palette_name)
+    site_path = _build_example_site(tmp_path_factory, example_name, palette_name, cache_dir)
     _BUILT_SITES[cache_key] = site_path
     return site_path
 
@@ -33,14 +70,251 @@ def _build_example_site(
     tmp_path_factory,
     example_name: str,
     palette_name: Optional[str],
+    cache_dir: Optional[Path] = None,
 ):
+    site_dir = make_site_dir(tmp_path_factory, example_name, palette_name)
+    if palette_name is None:
+        return build_example_site_into(example_name, None, site_dir, cache_dir)
+    if cache_dir is None:
+        base_site = build_example_site(tmp_path_factory, example_name)
+    else:
+        base_site = get_cached_example_site(example_name, None, cache_dir)
+    return derive_palette_site(base_site, site_dir, palette_name)
+
+
+def make_site_dir(tmp_path_factory, example_name: str, palette_name: Optional[str]) -> Path:
+    """Return a site dir which does not exist yet inside a new temporary directory, so that copy_site can create it."""
     suffix = f"_{palette_name}" if palette_name else ""
-    tmp_dir = tmp_path_factory.mktemp(f"built_{example_name}{suffix}_site")
+    return tmp_path_factory.mktemp(f"built_{example_name}{suffix}_site") / "site"
+
+
+def build_example_site_into(
+    example_name: str,
+    palette_name: Optional[str],
+    site_dir: Path,
+    cache_dir: Optional[Path] = None,
+) -> Path:
+    """Build the example site into site_dir, or copy it from the persistent cache when cache_dir is given."""
+    if cache_dir is None:
+        build(load_example_config(example_name, site_dir, palette_name))
+    else:
+        copy_site(get_cached_example_site(example_name, palette_name, cache_dir), site_dir)
+    return Path(site_dir)
+
+
+def prebuild_example_sites(
+    tmp_path_factory,
+    example_builds: Iterable[ExampleBuild],
+    cache_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+) -> Dict[ExampleBuild, Path]:
+    """Build every (example_name, palette_name) pair, building the examples concurrently in a process pool.
+
+    Each example is built once in a worker and its palette variants are derived from that build.
+    The sites are registered so that later build_example_site calls return them without building
+    again.  Examples which are already built in this session or in the persistent cache are not
+    sent to the pool.  workers defaults to the TERMINAL_PREBUILD_WORKERS environment variable,
+    then to the CPU count; 1 builds every example in the current process.
+    """
+    example_builds = list(dict.fromkeys(example_builds))
+    base_site_dirs: Dict[str, Path] = {}
+    for example_name in dict.fromkeys(example_name for example_name, _ in example_builds):
+        built_path = _BUILT_SITES.get((example_name, None))
+        if built_path and built_path.exists():
+            continue
+        if cache_dir is not None and is_cached_example_site(example_name, None, cache_dir):
+            continue
+        base_site_dirs[example_name] = make_site_dir(tmp_path_factory, example_name, None)
+
+    workers = min(workers or get_prebuild_workers(), len(base_site_dirs))
+    if workers <= 1:
+        for example_name, site_dir in base_site_dirs.items():
+            build_example_site_into(example_name, None, site_dir, cache_dir)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(build_example_site_into, example_name, None, site_dir, cache_dir)
+                for example_name, site_dir in base_site_dirs.items()
+            ]
+            for future in futures:
+                future.result()
+
+    _BUILT_SITES.update({(example_name, None): site_dir for example_name, site_dir in base_site_dirs.items()})
+    return {example_build: build_example_site(tmp_path_factory, *example_build, cache_dir) for example_build in example_builds}
+
+
+def get_prebuild_workers() -> int:
+    """Return the prebuild worker count from TERMINAL_PREBUILD_WORKERS, or the CPU count."""
+    workers = os.environ.get(PREBUILD_WORKERS_ENV)
+    if workers:
+        return max(int(workers), 1)
+    return os.cpu_count() or 1
+
+
+def get_build_cache_dir(config) -> Optional[Path]:
+    """Return the persistent example site cache dir inside pytest's cache, or None when the cache plugin is disabled."""
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return None
+    return Path(cache.mkdir(BUILD_CACHE_NAME))
+
+
+def get_cached_example_site(example_name: str, palette_name: Optional[str], cache_dir: Path) -> Path:
+    """Return a cached build of the example site, building it first if needed.
+
+    Builds are keyed by get_build_cache_key.  A file lock on the cache entry makes concurrent
+    pytest processes wait for a single build instead of repeating it.  Publishing a new build
+    removes the older builds of the same example and palette.  Treat the returned directory as
+    read-only.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    key = get_build_cache_key(example_name, palette_name)
+    cached_site = cache_dir / key
+    if (cached_site / BUILD_COMPLETE_MARKER).exists():
+        return cached_site
+
+    with file_lock(cache_dir / f"{key}.lock"):
+        if not (cached_site / BUILD_COMPLETE_MARKER).exists():
+            staging_dir = cache_dir / f"{key}.partial"
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            shutil.rmtree(cached_site, ignore_errors=True)
+            build(load_example_config(example_name, staging_dir, palette_name))
+            (staging_dir / BUILD_COMPLETE_MARKER).touch()
+            staging_dir.rename(cached_site)
+            remove_stale_cached_builds(example_name, palette_name, cache_dir, key)
+    return cached_site
+
 
-    tests_dir = Path(__file__).parent
-    example_dir = tests_dir / "examples" / example_name
+def remove_stale_cached_builds(example_name: str, palette_name: Optional[str], cache_dir: Path, current_key: str) -> None:
+    """Remove cached builds (and their lock and staging files) of the example and palette other than current_key."""
+    prefix = get_build_cache_key_prefix(example_name, palette_name)
+    stale_entry_pattern = re.compile(re.escape(prefix) + r"[0-9a-f]{16}(\.lock|\.partial)?")
+    for entry in Path(cache_dir).iterdir():
+        if not stale_entry_pattern.fullmatch(entry.name) or entry.name.startswith(current_key):
+            continue
+        if entry.is_dir():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+
+
+def is_cached_example_site(example_name: str, palette_name: Optional[str], cache_dir: Path) -> bool:
+    """Return True when cache_dir holds a complete build of the example site."""
+    return (Path(cache_dir) / get_build_cache_key(example_name, palette_name) / BUILD_COMPLETE_MARKER).exists()
+
+
+def get_build_cache_key(example_name: str, palette_name: Optional[str]) -> str:
+    """Return a hash of everything which affects the example site build output.
+
+    The key covers the example's docs and mkdocs.yml, the terminal/ theme tree, the base test
+    config, the palette name and the installed MkDocs version.
+    """
+    digest = hashlib.sha256()
+    for part in (BUILD_CACHE_VERSION, mkdocs.__version__, example_name, palette_name or ""):
+        digest.update(part.encode("utf-8") + b"\0")
+    digest.update(hash_tree(EXAMPLES_DIR / example_name).encode("utf-8"))
+    digest.update(hash_tree(THEME_DIR).encode("utf-8"))
+    digest.update(hash_tree(BASE_CONFIG_FILE).encode("utf-8"))
+    return get_build_cache_key_prefix(example_name, palette_name) + digest.hexdigest()[:16]
+
+
+def get_build_cache_key_prefix(example_name: str, palette_name: Optional[str]) -> str:
+    """Return the part of the cache key which does not change when the build inputs change."""
+    return f"{example_name}-{palette_name or 'theme-default'}-"
+
+
+@lru_cache(maxsize=None)
+def hash_tree(path: Path) -> str:
+    """Return a sha256 of the relative paths and contents of every file under path (or of path itself)."""
+    digest = hashlib.sha256()
+    files = [path] if path.is_file() else sorted(file for file in path.rglob("*") if file.is_file())
+    for file in files:
+        relative_path = file.relative_to(path).as_posix() if file != path else file.name
+        if any(pattern in relative_path for pattern in IGNORED_CACHE_KEY_PATTERNS):
+            continue
+        digest.update(relative_path.encode("utf-8") + b"\0")
+        digest.update(file.read_bytes() + b"\0")
+    return digest.hexdigest()
+
+
+@contextmanager
+def file_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on lock_path.  Blocks until the lock is available."""
+    with open(lock_path, "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:  # pragma: no cover - Windows
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def derive_palette_site(base_site: Path, site_dir: Path, palette_name: str) -> Path:
+    """Copy a built site into site_dir and point every page at another palette.
+
+    The palette stylesheet link (and the comment above it) is the only output which differs
+    between builds of a site with different palettes, so this produces the same site as a full
+    build with theme.palette set to palette_name, without converting any Markdown again.
+    """
+    base_site = Path(base_site)
+    palette_uri = get_palette_uri(base_site, palette_name)
+    copy_site(base_site, site_dir)
+    for html_file in Path(site_dir).glob("**/*.html"):
+        html = html_file.read_text(encoding="utf-8")
+        derived_html = rewrite_palette_links(html, palette_name, palette_uri)
+        if derived_html != html:
+            html_file.write_text(derived_html, encoding="utf-8")
+    return Path(site_dir)
+
+
+def get_palette_uri(site_dir: Path, palette_name: str) -> str:
+    """Return the site relative URI of a palette stylesheet, following the fingerprint manifest when present."""
+    palette_uri = f"css/palettes/{palette_name}.css"
+    manifest_path = Path(site_dir) / DEFAULT_MANIFEST_FILE_NAME
+    if manifest_path.exists():
+        palette_uri = json.loads(manifest_path.read_text(encoding="utf-8")).get(palette_uri, palette_uri)
+    if not (Path(site_dir) / palette_uri).exists():
+        raise ValueError(f"Palette '{palette_name}' not found in {site_dir}")
+    return palette_uri
+
+
+def rewrite_palette_links(html: str, palette_name: str, palette_uri: str) -> str:
+    """Replace the palette stylesheet link of a rendered page.  Relative URL prefixes are preserved."""
+    html = PALETTE_LINK_PATTERN.sub(lambda match: match.group(1) + palette_uri + match.group(2), html)
+    return PALETTE_COMMENT_PATTERN.sub(f"<!-- {palette_name} color palette -->", html)
+
+
+def copy_site(source_dir: Path, site_dir: Path) -> Path:
+    """Copy a cached build into site_dir, which must not exist yet (copytree's dirs_exist_ok needs Python 3.8)."""
+    shutil.copytree(source_dir, site_dir, ignore=shutil.ignore_patterns(BUILD_COMPLETE_MARKER))
+    return Path(site_dir)
+
+
+def load_example_config(
+    example_name: str,
+    site_dir: Path,
+    palette_name: Optional[str] = None,
+):
+    """Load the MkDocs config for an example site, building into site_dir."""
+    example_dir = EXAMPLES_DIR / example_name
     docs_dir = example_dir / "docs"
-    theme_dir = tests_dir.parent / "terminal"
+    theme_dir = THEME_DIR
 
     if not docs_dir.exists():
         raise ValueError(f"Example site not found at {docs_dir}")
@@ -66,7 +340,7 @@ def _build_example_site(
 
     config_kwargs = dict(
         docs_dir=str(docs_dir.resolve()),
-        site_dir=str(tmp_dir.resolve()),
+        site_dir=str(Path(site_dir).resolve()),
         site_name=site_name,
         theme=theme_config,
     )
@@ -75,6 +349,4 @@ def _build_example_site(
     if markdown_extensions is not None:
         config_kwargs["markdown_extensions"] = markdown_extensions
 
-    config = load_config(**config_kwargs)
-    build(config)
-    return tmp_dir
+    return load_config(**config_kwargs)
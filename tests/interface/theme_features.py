@@ -25,3 +25,7 @@ SHOW_INDEX_SECTIONS = "navigation.side.indexes"
 HIDE_SEARCH_BUTTON = "navigation.top.search_button.hide"
 HIDE_SIDE_TOC = "navigation.side.toc.hide"
 HIDE_LINK_UNDERLINE = "style.links.underline.hide"
+DEBUG_RENDER_TIMING = "debug.render_timing"
+ADAPTIVE_LOADING = "loading.adaptive"
+NAVIGATION_PREFETCH = "navigation.prefetch"
+NAVIGATION_INSTANT = "navigation.instant"
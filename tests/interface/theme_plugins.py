@@ -2,4 +2,12 @@ REVISION = "git-revision-date"
 SEARCH = "search"
 MD_TO_HTML_IMPLICIT = "md-to-html"
 MD_TO_HTML_EXPLICIT = "terminal/md-to-html"
+PALETTE_COMPILER = "terminal/palette-compiler"
+FINGERPRINT = "terminal/fingerprint"
+PRECOMPRESS = "terminal/precompress"
+MINIFY_HTML = "terminal/minify-html"
+LINK_CHECKER = "terminal/link-checker"
+RENDER_TIMING = "terminal/render-timing"
+SIZE_BUDGET = "terminal/size-budget"
+SERVICE_WORKER = "terminal/service-worker"
 DEFAULT_MARKUP_FILTER_NAME = "markup"
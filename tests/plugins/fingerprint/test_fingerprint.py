@@ -0,0 +1,90 @@
+from pathlib import Path
+from mkdocs.commands.build import build
+from terminal.plugins.fingerprint.plugin import make_fingerprinted_uri, DEFAULT_MANIFEST_FILE_NAME
+from tests.integration_helper import load_config
+from tests.interface import theme_plugins
+import hashlib
+import json
+import pytest
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+THEME_DIR = PROJECT_ROOT / "terminal"
+
+
+@pytest.fixture
+def built_site(tmp_path):
+    config = load_config(
+        docs_dir=str(PROJECT_ROOT / "tests" / "examples" / "minimal" / "docs"),
+        site_dir=str(tmp_path),
+        theme={"name": None, "custom_dir": str(THEME_DIR)},
+        plugins=[theme_plugins.SEARCH, theme_plugins.FINGERPRINT],
+    )
+    build(config)
+    return tmp_path
+
+
+@pytest.fixture
+def manifest(built_site):
+    return json.loads((built_site / DEFAULT_MANIFEST_FILE_NAME).read_text(encoding="utf-8"))
+
+
+class TestFingerprint():
+
+    def test_that_hash_is_inserted_before_extension(self):
+        content = b"body { color: #000; }"
+        expected_hash = hashlib.sha256(content).hexdigest()[:8]
+        assert make_fingerprinted_uri("css/terminal.css", content) == "css/terminal.%s.css" % expected_hash
+
+    def test_that_hash_length_is_configurable(self):
+        fingerprinted_uri = make_fingerprinted_uri("js/mkdocs/base.js", b"", hash_length=12)
+        assert len(fingerprinted_uri) == len("js/mkdocs/base.js") + 13
+
+    def test_that_hash_changes_with_content(self):
+        assert make_fingerprinted_uri("a.css", b"a") != make_fingerprinted_uri("a.css", b"b")
+
+    @pytest.mark.parametrize("asset_path", [
+        "css/terminal.css",
+        "css/palettes/default.css",
+        "css/fontawesome/css/solid.min.css",
+        "css/search/bootstrap-modal.css",
+        "js/mkdocs/base.js",
+        "js/jquery/jquery-1.10.1.min.js",
+    ])
+    def test_that_theme_assets_are_renamed(self, asset_path, built_site, manifest):
+        fingerprinted_path = manifest[asset_path]
+        assert fingerprinted_path != asset_path
+        assert (built_site / fingerprinted_path).exists()
+        assert not (built_site / asset_path).exists()
+
+    def test_that_rendered_pages_reference_fingerprinted_assets(self, built_site, manifest):
+        html = (built_site / "index.html").read_text(encoding="utf-8")
+        for asset_path in ["css/terminal.css", "css/palettes/default.css", "css/search/bootstrap-modal.css", "js/mkdocs/base.js"]:
+            assert "\"%s\"" % manifest[asset_path] in html
+            assert "\"%s\"" % asset_path not in html
+
+    def test_that_docs_files_keep_their_names(self, tmp_path):
+        docs_dir = tmp_path / "docs"
+        (docs_dir / "img" / "picsum").mkdir(parents=True)
+        (docs_dir / "img" / "picsum" / "tile.jpeg").write_bytes(b"tile")
+        (docs_dir / "css").mkdir()
+        (docs_dir / "css" / "extra.css").write_text("body {}", encoding="utf-8")
+        (docs_dir / "index.md").write_text(
+            "---\ntiles:\n  - caption: tile\n    img_src: img/picsum/tile.jpeg\n---\n\n# Tiles\n", encoding="utf-8"
+        )
+        site_dir = tmp_path / "site"
+        config = load_config(
+            docs_dir=str(docs_dir),
+            site_dir=str(site_dir),
+            theme={"name": None, "custom_dir": str(THEME_DIR)},
+            plugins=[theme_plugins.SEARCH, theme_plugins.FINGERPRINT],
+        )
+        build(config)
+        manifest = json.loads((site_dir / DEFAULT_MANIFEST_FILE_NAME).read_text(encoding="utf-8"))
+        assert "img/picsum/tile.jpeg" not in manifest
+        assert "css/extra.css" not in manifest
+        assert (site_dir / "img" / "picsum" / "tile.jpeg").exists()
+        assert 'src="img/picsum/tile.jpeg"' in (site_dir / "index.html").read_text(encoding="utf-8")
+        assert "css/terminal.css" in manifest
+
+    def test_that_webfonts_keep_stable_names(self, built_site, manifest):
+        assert "css/fontawesome/webfonts/fa-solid-900.woff2" not in manifest
+        assert (built_site / "css" / "fontawesome" / "webfonts" / "fa-solid-900.woff2").exists()
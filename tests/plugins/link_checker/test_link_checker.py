@@ -0,0 +1,174 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+from mkdocs.commands.build import build
+from terminal.plugins.link_checker.checker import LinkCache, LinkChecker, LinkResult, extract_external_urls, extract_tile_urls
+from tests.integration_helper import load_config
+from tests.interface import theme_plugins
+import json
+import logging
+import pytest
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+THEME_DIR = PROJECT_ROOT / "terminal"
+# external links rendered by the theme footer
+FOOTER_LINK_PATTERNS = ["http://www.mkdocs.org*", "https://github.com/ntno/*"]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self.server.requests.append((self.command, self.path))
+        self.server.client_ports.add(self.client_address[1])
+        if self.path == "/redirect":
+            self.respond(301, {"Location": "/ok"})
+        elif self.path == "/no-head":
+            self.respond(405)
+        elif self.path == "/missing":
+            self.respond(404)
+        else:
+            self.respond(200)
+
+    def do_GET(self):
+        self.server.requests.append((self.command, self.path))
+        self.respond(200)
+
+    def respond(self, status, headers=None):
+        # close the keep-alive connection without announcing it, like a server with a short idle timeout
+        self.close_connection = self.server.drop_connections
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        return
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.requests = []
+    server.client_ports = set()
+    server.drop_connections = False
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def url_for(server, path):
+    return "http://127.0.0.1:%d%s" % (server.server_address[1], path)
+
+
+class TestExtractUrls():
+
+    def test_that_only_external_urls_are_collected(self):
+        html = '<a href="https://example.com/a#top">a</a><a href="../local/">b</a><img src="http://example.com/i.png"><a href="mailto:x@example.com">c</a>'
+        assert extract_external_urls(html) == ["https://example.com/a", "http://example.com/i.png"]
+
+    def test_that_tile_urls_are_collected(self):
+        meta = {"tiles": [{"link_href": "https://example.com/", "img_src": "../img/local.png"}, {"img_src": "https://example.com/i.png"}]}
+        assert extract_tile_urls(meta) == ["https://example.com/", "https://example.com/i.png"]
+
+
+class TestLinkChecker():
+
+    def test_that_statuses_are_reported(self, stub_server):
+        results = LinkChecker(requests_per_second=0).check([url_for(stub_server, "/ok"), url_for(stub_server, "/missing")])
+        assert [(result.status, result.ok) for result in results] == [(404, False), (200, True)]
+
+    def test_that_redirects_are_followed(self, stub_server):
+        result, = LinkChecker(requests_per_second=0).check([url_for(stub_server, "/redirect")])
+        assert result.ok
+        assert ("HEAD", "/ok") in stub_server.requests
+
+    def test_that_rejected_head_is_retried_with_get(self, stub_server):
+        result, = LinkChecker(requests_per_second=0).check([url_for(stub_server, "/no-head")])
+        assert result.ok
+        assert ("GET", "/no-head") in stub_server.requests
+
+    def test_that_connections_are_pooled_per_host(self, stub_server):
+        urls = [url_for(stub_server, "/page-%d" % index) for index in range(20)]
+        checker = LinkChecker(max_connections_per_host=2, requests_per_second=0)
+        results = checker.check(urls)
+        assert all(result.ok for result in results)
+        assert len(stub_server.client_ports) <= 2
+
+    def test_that_request_on_closed_connection_is_retried(self, stub_server):
+        stub_server.drop_connections = True
+        urls = [url_for(stub_server, "/page-%d" % index) for index in range(3)]
+        results = LinkChecker(max_connections_per_host=1, requests_per_second=0).check(urls)
+        assert all(result.ok for result in results)
+        assert len(stub_server.client_ports) == 3
+
+    def test_that_unreachable_host_is_reported(self):
+        result, = LinkChecker(timeout=1, requests_per_second=0).check(["http://127.0.0.1:9/"])
+        assert not result.ok
+        assert result.error
+
+    def test_that_cached_results_skip_requests(self, stub_server, tmp_path):
+        url = url_for(stub_server, "/ok")
+        cache = LinkCache(tmp_path / "links.json")
+        LinkChecker(cache=cache, requests_per_second=0).check([url])
+        cache.save()
+        LinkChecker(cache=LinkCache(tmp_path / "links.json").load(), requests_per_second=0).check([url])
+        assert len(stub_server.requests) == 1
+
+    def test_that_expired_results_are_ignored(self):
+        cache = LinkCache(None, ttl=60)
+        cache.put(LinkResult(url="https://example.com/", status=200, error=None, checked_at=0))
+        assert cache.get("https://example.com/", now=61) is None
+        assert cache.get("https://example.com/", now=59) is not None
+
+    def test_that_failures_expire_sooner(self):
+        cache = LinkCache(None, ttl=60, failure_ttl=10)
+        cache.put(LinkResult(url="https://example.com/ok", status=200, error=None, checked_at=0))
+        cache.put(LinkResult(url="https://example.com/missing", status=404, error=None, checked_at=0))
+        assert cache.get("https://example.com/ok", now=30) is not None
+        assert cache.get("https://example.com/missing", now=30) is None
+        assert cache.get("https://example.com/missing", now=9) is not None
+
+
+class TestLinkCheckerPlugin():
+
+    def build_site(self, tmp_path, stub_server, **plugin_config):
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "index.md").write_text(
+            "---\ntiles:\n  - caption: stub\n    link_href: %s\n---\n\n[ok](%s) [missing](%s)\n" % (
+                url_for(stub_server, "/tile"), url_for(stub_server, "/ok"), url_for(stub_server, "/missing")),
+            encoding="utf-8"
+        )
+        plugin_config.setdefault("cache_file", str(tmp_path / "links.json"))
+        plugin_config.setdefault("requests_per_second", 0)
+        plugin_config["exclude"] = plugin_config.get("exclude", []) + FOOTER_LINK_PATTERNS
+        config = load_config(
+            docs_dir=str(docs_dir),
+            site_dir=str(tmp_path / "site"),
+            theme={"name": None, "custom_dir": str(THEME_DIR)},
+            plugins=[{theme_plugins.LINK_CHECKER: plugin_config}],
+        )
+        build(config)
+
+    def test_that_broken_links_are_reported(self, tmp_path, stub_server, caplog):
+        with caplog.at_level(logging.INFO, logger="mkdocs.terminal.link_checker"):
+            self.build_site(tmp_path, stub_server)
+        warnings = [record.getMessage() for record in caplog.records if record.levelno == logging.WARNING]
+        assert len(warnings) == 1
+        assert url_for(stub_server, "/missing") in warnings[0]
+        assert "index.md" in warnings[0]
+        checked_paths = {path for _, path in stub_server.requests}
+        assert {"/ok", "/missing", "/tile"} <= checked_paths
+        cached = json.loads((tmp_path / "links.json").read_text(encoding="utf-8"))
+        assert cached[url_for(stub_server, "/ok")]["status"] == 200
+
+    def test_that_excluded_links_are_not_checked(self, tmp_path, stub_server):
+        self.build_site(tmp_path, stub_server, exclude=["*/missing"])
+        assert "/missing" not in {path for _, path in stub_server.requests}
+
+    def test_that_disabled_plugin_makes_no_requests(self, tmp_path, stub_server):
+        self.build_site(tmp_path, stub_server, enabled=False)
+        assert stub_server.requests == []
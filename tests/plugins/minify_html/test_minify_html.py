@@ -0,0 +1,74 @@
+from pathlib import Path
+from bs4 import BeautifulSoup
+from mkdocs.commands.build import build
+from terminal.plugins.minify_html.minifier import minify_html
+from tests.integration_helper import load_config
+from tests.interface import theme_plugins
+import pytest
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+THEME_DIR = PROJECT_ROOT / "terminal"
+
+
+def build_site(site_dir, plugins):
+    config = load_config(
+        docs_dir=str(PROJECT_ROOT / "tests" / "examples" / "subpages" / "docs"),
+        site_dir=str(site_dir),
+        theme={"name": None, "custom_dir": str(THEME_DIR), "static_templates": ["404.html"]},
+        plugins=plugins,
+    )
+    build(config)
+    return site_dir
+
+
+def get_text(html):
+    return " ".join(BeautifulSoup(html, "html.parser").get_text(" ").split())
+
+
+class TestMinifyHtml():
+
+    def test_that_whitespace_between_block_elements_is_removed(self):
+        html = "<div>\n    <ul>\n        <li>one</li>\n        <li>two</li>\n    </ul>\n</div>\n"
+        assert minify_html(html) == "<div><ul><li>one</li><li>two</li></ul></div>"
+
+    def test_that_whitespace_between_inline_elements_is_collapsed(self):
+        html = "<p><a href=\"#\">one</a>   \n   <a href=\"#\">two</a></p>"
+        assert minify_html(html) == "<p><a href=\"#\">one</a>\n<a href=\"#\">two</a></p>"
+
+    def test_that_text_whitespace_is_collapsed(self):
+        assert minify_html("<p>some     spaced\t text</p>") == "<p>some spaced text</p>"
+
+    @pytest.mark.parametrize("fragment", [
+        pytest.param("<pre><code>line 1\n    line   2\n<span class=\"k\">x</span>  y</code></pre>", id="pre_code"),
+        pytest.param("<p>inline <code>a   b</code></p>", id="inline_code"),
+        pytest.param("<textarea>\n  keep\n\n  this\n</textarea>", id="textarea"),
+        pytest.param("<script>if (a < b && c > d) { x = \"<div>   </div>\"; }</script>", id="script"),
+        pytest.param("<style>\n  a > b {  color: red; }\n</style>", id="style"),
+        pytest.param("<pre>outer <pre>  nested  </pre>  still outer  </pre>", id="nested_pre"),
+    ])
+    def test_that_preserved_content_is_unchanged(self, fragment):
+        assert minify_html(fragment) == fragment
+
+    def test_that_comments_are_removed(self):
+        assert minify_html("<div><!-- note --></div>") == "<div></div>"
+        assert minify_html("<div><!-- note --></div>", remove_comments=False) == "<div><!-- note --></div>"
+
+    def test_that_conditional_comments_are_kept(self):
+        html = "<head><!--[if lt IE 9]><script src=\"x.js\"></script><![endif]--></head>"
+        assert minify_html(html) == html
+
+    def test_that_attributes_containing_angle_brackets_are_kept(self):
+        html = "<div title=\"a > b\"  data-x='<c>'>\n  text\n</div>"
+        assert minify_html(html) == "<div title=\"a > b\"  data-x='<c>'>\ntext\n</div>"
+
+
+class TestMinifyHtmlPlugin():
+
+    def test_that_built_pages_are_smaller_with_same_text(self, tmp_path):
+        original_site = build_site(tmp_path / "original", [])
+        minified_site = build_site(tmp_path / "minified", [theme_plugins.MINIFY_HTML])
+        for original_page in original_site.glob("**/*.html"):
+            minified_page = minified_site / original_page.relative_to(original_site)
+            original_html = original_page.read_text(encoding="utf-8")
+            minified_html = minified_page.read_text(encoding="utf-8")
+            assert len(minified_html) < len(original_html), original_page.name
+            assert get_text(minified_html) == get_text(original_html), original_page.name
@@ -0,0 +1,110 @@
+from pathlib import Path
+from mkdocs.commands.build import build
+from terminal.plugins.palette_compiler.compiler import compile_palette, parse_root_variables, find_variable_references
+from tests.integration_helper import load_config
+from tests.interface import theme_plugins
+import logging
+import pytest
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+THEME_DIR = PROJECT_ROOT / "terminal"
+THEME_CSS = """
+:root {
+    --font-color: #151515;
+    --background-color: #fff;
+    --global-space: 10px;
+}
+body {
+    color: var(--font-color);
+    background-color: var(--background-color);
+    padding: calc(var(--global-space) * 2);
+}
+"""
+
+
+class TestPaletteCompiler():
+
+    def test_that_later_root_declarations_win(self):
+        variables = parse_root_variables(":root { --a: 1px; --b: 2px; } :root { --a: 3px; }")
+        assert variables == {"--b": "2px", "--a": "3px"}
+
+    def test_that_var_references_are_found_inside_expressions_and_fallbacks(self):
+        references = find_variable_references(["a { margin: calc(var(--x) * 2); color: var(--y, var(--z)); }"])
+        assert references == {"--x", "--y", "--z"}
+
+    def test_that_var_chains_are_resolved(self):
+        palette = ":root { --cream: #ffffcc; --alias: var(--cream); --background-color: var(--alias); }"
+        compiled = compile_palette("test", palette, [THEME_CSS])
+        assert compiled.variables["--background-color"] == "#ffffcc"
+        assert "var(" not in compiled.css
+
+    def test_that_unused_variables_are_dropped(self):
+        palette = ":root { --cream: #ffffcc; --background-color: var(--cream); }"
+        compiled = compile_palette("test", palette, [THEME_CSS])
+        assert "--cream" in compiled.dropped
+        assert "--cream" not in compiled.css
+        assert "--background-color: #ffffcc;" in compiled.css
+
+    def test_that_unused_variables_can_be_kept(self):
+        palette = ":root { --cream: #ffffcc; --background-color: var(--cream); }"
+        compiled = compile_palette("test", palette, [THEME_CSS], keep=["--cream"])
+        assert "--cream: #ffffcc;" in compiled.css
+
+    def test_that_redundant_overrides_are_dropped(self):
+        palette = ":root { --global-space: 10px; --font-color: #222; }"
+        compiled = compile_palette("test", palette, [THEME_CSS])
+        assert list(compiled.variables.keys()) == ["--font-color"]
+        assert "--global-space" in compiled.dropped
+
+    def test_that_references_to_theme_variables_are_left_in_place(self):
+        palette = ":root { --font-color: var(--background-color); }"
+        compiled = compile_palette("test", palette, [THEME_CSS])
+        assert compiled.variables["--font-color"] == "var(--background-color)"
+        assert compiled.undefined == []
+
+    def test_that_undefined_references_are_reported(self):
+        palette = ":root { --font-color: var(--does-not-exist); }"
+        compiled = compile_palette("test", palette, [THEME_CSS])
+        assert compiled.undefined == ["--does-not-exist"]
+
+    def test_that_fallback_is_used_for_undefined_references(self):
+        palette = ":root { --font-color: var(--does-not-exist, #333); }"
+        compiled = compile_palette("test", palette, [THEME_CSS])
+        assert compiled.variables["--font-color"] == "#333"
+        assert compiled.undefined == []
+
+    def test_that_license_comments_and_other_rules_are_preserved(self):
+        palette = "/*! license */\n/* note */\n:root { --font-color: #222; }\nbody { margin: 0; }"
+        compiled = compile_palette("test", palette, [THEME_CSS])
+        assert compiled.css.startswith("/*! license */")
+        assert "/* note */" not in compiled.css
+        assert "body { margin: 0; }" in compiled.css
+
+    def test_that_theme_palettes_compile_without_undefined_references(self):
+        css_dir = THEME_DIR / "css"
+        theme_css_texts = [p.read_text(encoding="utf-8") for p in css_dir.glob("**/*.css") if "palettes" not in p.parts]
+        for palette_path in sorted((css_dir / "palettes").glob("*.css")):
+            palette_css = palette_path.read_text(encoding="utf-8")
+            compiled = compile_palette(palette_path.stem, palette_css, theme_css_texts)
+            assert compiled.undefined == [], palette_path.name
+            assert len(compiled.css) <= len(palette_css) + 1, palette_path.name
+
+
+class TestPaletteCompilerPlugin():
+
+    @pytest.fixture
+    def built_site(self, tmp_path, caplog):
+        config = load_config(
+            docs_dir=str(PROJECT_ROOT / "tests" / "examples" / "minimal" / "docs"),
+            site_dir=str(tmp_path),
+            theme={"name": None, "custom_dir": str(THEME_DIR), "palette": "gruvbox_dark"},
+            plugins=[theme_plugins.PALETTE_COMPILER],
+        )
+        with caplog.at_level(logging.WARNING, logger="mkdocs.terminal.palette_compiler"):
+            build(config)
+        return tmp_path
+
+    def test_that_built_palettes_are_flattened(self, built_site, caplog):
+        compiled_css = (built_site / "css" / "palettes" / "gruvbox_dark.css").read_text(encoding="utf-8")
+        assert "--gb-dm-" not in compiled_css
+        assert "--background-color: #282828;" in compiled_css
+        assert not caplog.records
@@ -0,0 +1,120 @@
+from pathlib import Path
+from mkdocs.commands.build import build
+from terminal.plugins.precompress.compressor import precompress_file, prune_cache, compress, get_content_hash, GZIP, BROTLI
+from tests.integration_helper import load_config
+from tests.interface import theme_plugins
+import gzip
+import logging
+import pytest
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+THEME_DIR = PROJECT_ROOT / "terminal"
+CONTENT = b"<html><body>" + b"terminal " * 100 + b"</body></html>"
+
+
+@pytest.fixture
+def page(tmp_path):
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    page = site_dir / "index.html"
+    page.write_bytes(CONTENT)
+    return page
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    return cache_dir
+
+
+def build_site(site_dir, cache_dir):
+    config = load_config(
+        docs_dir=str(PROJECT_ROOT / "tests" / "examples" / "minimal" / "docs"),
+        site_dir=str(site_dir),
+        theme={"name": None, "custom_dir": str(THEME_DIR)},
+        plugins=[{theme_plugins.PRECOMPRESS: {"formats": [GZIP], "cache_dir": str(cache_dir), "workers": 2}}],
+    )
+    build(config)
+
+
+class TestPrecompressFile():
+
+    def test_that_gzip_sibling_is_written(self, page, cache_dir):
+        _, content_hash, compressed_count = precompress_file(page, [GZIP], cache_dir)
+        assert compressed_count == 1
+        assert content_hash == get_content_hash(CONTENT)
+        assert gzip.decompress(Path(str(page) + ".gz").read_bytes()) == CONTENT
+
+    def test_that_cached_output_is_reused(self, page, cache_dir):
+        precompress_file(page, [GZIP], cache_dir)
+        Path(str(page) + ".gz").unlink()
+        _, _, compressed_count = precompress_file(page, [GZIP], cache_dir)
+        assert compressed_count == 0
+        assert gzip.decompress(Path(str(page) + ".gz").read_bytes()) == CONTENT
+
+    def test_that_unchanged_file_is_skipped(self, page, cache_dir):
+        _, content_hash, _ = precompress_file(page, [GZIP], cache_dir)
+        sibling = Path(str(page) + ".gz")
+        sibling.write_bytes(b"untouched")
+        precompress_file(page, [GZIP], cache_dir, previous_hash=content_hash)
+        assert sibling.read_bytes() == b"untouched"
+
+    def test_that_changed_file_is_recompressed(self, page, cache_dir):
+        _, content_hash, _ = precompress_file(page, [GZIP], cache_dir)
+        page.write_bytes(CONTENT + b"<!-- changed -->")
+        _, new_content_hash, compressed_count = precompress_file(page, [GZIP], cache_dir, previous_hash=content_hash)
+        assert new_content_hash != content_hash
+        assert compressed_count == 1
+        assert gzip.decompress(Path(str(page) + ".gz").read_bytes()).endswith(b"<!-- changed -->")
+
+    def test_that_brotli_sibling_is_written(self, page, cache_dir):
+        brotli = pytest.importorskip("brotli")
+        precompress_file(page, [BROTLI], cache_dir)
+        assert brotli.decompress(Path(str(page) + ".br").read_bytes()) == CONTENT
+
+    def test_that_gzip_output_is_stable(self):
+        assert compress(CONTENT, GZIP) == compress(CONTENT, GZIP)
+        assert gzip.decompress(compress(CONTENT, GZIP)) == CONTENT
+
+    def test_that_unreferenced_cache_entries_are_pruned(self, page, cache_dir):
+        _, content_hash, _ = precompress_file(page, [GZIP], cache_dir)
+        stale_entry = cache_dir / (get_content_hash(b"stale") + ".gz")
+        stale_entry.write_bytes(b"stale")
+        in_progress_entry = cache_dir / (get_content_hash(b"new") + ".gz.0123.tmp")
+        in_progress_entry.write_bytes(b"new")
+        index = cache_dir / "index.json"
+        index.write_text("{}")
+        assert prune_cache(cache_dir, [content_hash], keep=["index.json"]) == 1
+        assert not stale_entry.exists()
+        assert (cache_dir / (content_hash + ".gz")).exists()
+        assert in_progress_entry.exists()
+        assert index.exists()
+
+
+class TestPrecompressPlugin():
+
+    def test_that_pages_and_assets_are_precompressed(self, tmp_path, cache_dir):
+        site_dir = tmp_path / "site"
+        build_site(site_dir, cache_dir)
+        for relative_path in ["index.html", "css/terminal.css", "js/mkdocs/base.js"]:
+            original = (site_dir / relative_path).read_bytes()
+            assert gzip.decompress((site_dir / (relative_path + ".gz")).read_bytes()) == original
+        assert not list(site_dir.rglob("*.gz.gz"))
+
+    def test_that_rebuild_reuses_cache(self, tmp_path, cache_dir, caplog):
+        site_dir = tmp_path / "site"
+        build_site(site_dir, cache_dir)
+        cached_entries = sorted(p.name for p in cache_dir.iterdir())
+        with caplog.at_level(logging.INFO, logger="mkdocs.terminal.precompress"):
+            build_site(site_dir, cache_dir)
+        assert sorted(p.name for p in cache_dir.iterdir()) == cached_entries
+        assert "(0 new compressions)" in caplog.text
+
+    def test_that_rebuild_prunes_stale_cache_entries(self, tmp_path, cache_dir):
+        site_dir = tmp_path / "site"
+        build_site(site_dir, cache_dir)
+        stale_entry = cache_dir / (get_content_hash(b"removed page") + ".gz")
+        stale_entry.write_bytes(b"removed page")
+        build_site(site_dir, cache_dir)
+        assert not stale_entry.exists()
+        assert (cache_dir / "index.json").exists()
@@ -0,0 +1,81 @@
+from pathlib import Path
+from mkdocs.commands.build import build
+from terminal.plugins.render_timing.plugin import RENDER_TIMING_ENV_VAR
+from terminal.plugins.render_timing.timer import RenderTimer, instrument_environment, TILE_GRID_LABEL
+from jinja2 import DictLoader, Environment
+from tests.integration_helper import load_config
+from tests.interface import theme_features, theme_plugins
+import json
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+THEME_DIR = PROJECT_ROOT / "terminal"
+TILE_PAGE = """---
+tiles:
+  - caption: first tile
+    link_href: https://example.com/
+---
+
+{{ tile_grid(page.meta) }}
+"""
+
+
+def build_site(tmp_path, features):
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    (docs_dir / "index.md").write_text(TILE_PAGE, encoding="utf-8")
+    (docs_dir / "about.md").write_text("# About\n", encoding="utf-8")
+    report_file = tmp_path / "render-timing.json"
+    config = load_config(
+        docs_dir=str(docs_dir),
+        site_dir=str(tmp_path / "site"),
+        theme={"name": None, "custom_dir": str(THEME_DIR), "features": features},
+        plugins=[
+            {"macros": {"modules": ["mkdocs-terminal:terminal.pluglets.tile_grid.main"]}},
+            {theme_plugins.RENDER_TIMING: {"report_file": str(report_file)}},
+        ],
+    )
+    build(config)
+    return report_file
+
+
+class TestRenderTimer():
+
+    def test_that_included_templates_are_timed(self):
+        env = Environment(loader=DictLoader({"page.html": "<p>{% include 'part.html' %}</p>", "part.html": "part"}))
+        timer = RenderTimer()
+        instrument_environment(env, timer)
+        timer.current_page = "index.md"
+        assert env.get_template("page.html").render() == "<p>part</p>"
+        report = timer.get_report()
+        assert report["templates"]["part.html"]["calls"] == 1
+        assert set(report["pages"]["index.md"]) == {"page.html", "part.html"}
+
+    def test_that_templates_are_only_wrapped_once(self):
+        env = Environment(loader=DictLoader({"part.html": "part"}))
+        timer = RenderTimer()
+        instrument_environment(env, timer)
+        instrument_environment(env, timer)
+        env.get_template("part.html").render()
+        assert timer.calls["part.html"] == 1
+
+
+class TestRenderTimingPlugin():
+
+    def test_that_report_covers_partials_and_tile_grid(self, tmp_path):
+        report = json.loads(build_site(tmp_path, [theme_features.DEBUG_RENDER_TIMING]).read_text(encoding="utf-8"))
+        templates = report["templates"]
+        assert "partials/side-nav/side-nav.html" in templates
+        assert "partials/top-nav/top.html" in templates
+        assert "partials/page-content/content.html" in templates
+        assert templates[TILE_GRID_LABEL]["calls"] == 1
+        assert TILE_GRID_LABEL in report["pages"]["index.md"]
+        assert TILE_GRID_LABEL not in report["pages"]["about.md"]
+        assert "partials/footer.html" in report["pages"]["about.md"]
+        assert "sitemap.xml" in report["pages"]
+
+    def test_that_environment_variable_enables_timing(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(RENDER_TIMING_ENV_VAR, "1")
+        assert build_site(tmp_path, []).exists()
+
+    def test_that_timing_is_off_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(RENDER_TIMING_ENV_VAR, raising=False)
+        assert not build_site(tmp_path, []).exists()
@@ -0,0 +1,114 @@
+from pathlib import Path
+from mkdocs.commands.build import build
+from terminal.plugins.fingerprint.plugin import DEFAULT_MANIFEST_FILE_NAME
+from terminal.plugins.service_worker.plugin import DEFAULT_FILE_NAME
+from terminal.plugins.service_worker.worker import build_manifest, find_precache_paths, get_version, inject_registration
+from tests.integration_helper import load_config
+from tests.interface import theme_plugins
+import json
+import re
+import shutil
+import pytest
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+THEME_DIR = PROJECT_ROOT / "terminal"
+EXAMPLE_DOCS_DIR = PROJECT_ROOT / "tests" / "examples" / "subpages" / "docs"
+
+
+def build_site(docs_dir, site_dir, plugins=None, command=None):
+    config = load_config(
+        docs_dir=str(docs_dir),
+        site_dir=str(site_dir),
+        theme={"name": None, "custom_dir": str(THEME_DIR)},
+        plugins=plugins or [theme_plugins.SEARCH, theme_plugins.SERVICE_WORKER],
+    )
+    if command:
+        config.plugins.on_startup(command=command, dirty=False)
+    build(config)
+    return Path(site_dir)
+
+
+def get_precache_urls(service_worker):
+    return json.loads(re.search(r"var PRECACHE_URLS = (\[.*?\]);", service_worker, re.DOTALL).group(1))
+
+
+def get_service_worker_version(service_worker):
+    return re.search(r'var VERSION = "(\w+)";', service_worker).group(1)
+
+
+@pytest.fixture
+def docs_dir(tmp_path):
+    docs_dir = tmp_path / "docs"
+    shutil.copytree(EXAMPLE_DOCS_DIR, docs_dir)
+    return docs_dir
+
+
+@pytest.fixture
+def built_site(docs_dir, tmp_path):
+    return build_site(docs_dir, tmp_path / "site")
+
+
+class TestServiceWorker():
+
+    def test_that_service_worker_is_written(self, built_site):
+        service_worker = (built_site / DEFAULT_FILE_NAME).read_text(encoding="utf-8")
+        assert "staleWhileRevalidate" in service_worker
+        precache_urls = get_precache_urls(service_worker)
+        for path in ["css/terminal.css", "css/palettes/default.css", "js/mkdocs/base.js", "css/fontawesome/webfonts/fa-solid-900.woff2", "search/search_index.json"]:
+            assert path in precache_urls
+        assert all((built_site / url).is_file() for url in precache_urls)
+        assert not any(url.endswith(".html") for url in precache_urls)
+
+    def test_that_pages_register_service_worker(self, built_site):
+        index_html = (built_site / "index.html").read_text(encoding="utf-8")
+        nested_pages = [path for path in built_site.glob("*/*/index.html")]
+        assert 'navigator.serviceWorker.register("sw.js")' in index_html
+        assert nested_pages
+        assert 'navigator.serviceWorker.register("../../sw.js")' in nested_pages[0].read_text(encoding="utf-8")
+        assert index_html.index("serviceWorker") < index_html.index("</body>")
+
+    def test_that_nothing_is_added_when_serving(self, docs_dir, tmp_path):
+        site_dir = build_site(docs_dir, tmp_path / "served", command="serve")
+        assert not (site_dir / DEFAULT_FILE_NAME).exists()
+        assert "serviceWorker" not in (site_dir / "index.html").read_text(encoding="utf-8")
+
+    def test_that_service_worker_is_added_by_build_command(self, docs_dir, tmp_path):
+        site_dir = build_site(docs_dir, tmp_path / "built", command="build")
+        assert (site_dir / DEFAULT_FILE_NAME).exists()
+        assert "serviceWorker" in (site_dir / "index.html").read_text(encoding="utf-8")
+
+    def test_that_fingerprinted_assets_are_precached(self, docs_dir, tmp_path):
+        site_dir = build_site(docs_dir, tmp_path / "site", [theme_plugins.SEARCH, theme_plugins.FINGERPRINT, theme_plugins.SERVICE_WORKER])
+        manifest = json.loads((site_dir / DEFAULT_MANIFEST_FILE_NAME).read_text(encoding="utf-8"))
+        precache_urls = get_precache_urls((site_dir / DEFAULT_FILE_NAME).read_text(encoding="utf-8"))
+        assert manifest["css/terminal.css"] in precache_urls
+        assert "css/terminal.css" not in precache_urls
+
+    def test_that_version_only_changes_with_content(self, docs_dir, built_site, tmp_path):
+        version = get_service_worker_version((built_site / DEFAULT_FILE_NAME).read_text(encoding="utf-8"))
+        rebuilt_site = build_site(docs_dir, tmp_path / "rebuilt")
+        assert get_service_worker_version((rebuilt_site / DEFAULT_FILE_NAME).read_text(encoding="utf-8")) == version
+
+        index_md = docs_dir / "index.md"
+        index_md.write_text(index_md.read_text(encoding="utf-8") + "\n\nNew paragraph.\n", encoding="utf-8")
+        changed_site = build_site(docs_dir, tmp_path / "changed")
+        assert get_service_worker_version((changed_site / DEFAULT_FILE_NAME).read_text(encoding="utf-8")) != version
+
+
+class TestServiceWorkerHelpers():
+
+    def test_that_precache_paths_match_patterns(self, tmp_path):
+        for path in ["css/a.css", "css/palettes/b.css", "img/c.png", "sw.js"]:
+            (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / path).write_text(path, encoding="utf-8")
+        assert find_precache_paths(tmp_path, ["css/*.css", "*.js"], exclude=["sw.js"]) == ["css/a.css", "css/palettes/b.css"]
+
+    def test_that_version_depends_on_manifest(self, tmp_path):
+        (tmp_path / "a.css").write_text("a", encoding="utf-8")
+        version = get_version(build_manifest(tmp_path, ["a.css"]))
+        assert version == get_version(build_manifest(tmp_path, ["a.css"]))
+        (tmp_path / "a.css").write_text("b", encoding="utf-8")
+        assert version != get_version(build_manifest(tmp_path, ["a.css"]))
+
+    def test_that_registration_is_appended_without_body(self):
+        assert inject_registration("<p>x</p>", "<script></script>") == "<p>x</p><script></script>"
+        assert inject_registration("<body></body>", "<script></script>") == "<body><script></script></body>"
@@ -0,0 +1,92 @@
+from pathlib import Path
+from mkdocs.commands.build import build
+from mkdocs.exceptions import Abort
+from terminal.plugins.size_budget.report import (
+    PageSize, SizeReport, check_budgets, find_asset_references, measure_regions, resolve_asset_path
+)
+from tests.integration_helper import load_config
+from tests.interface import theme_plugins
+import json
+import logging
+import pytest
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+THEME_DIR = PROJECT_ROOT / "terminal"
+PAGE = (
+    '<html><head><link href="../css/a.css" rel="stylesheet"><script src="../js/b.js" defer></script></head>'
+    '<body><div class="container"><div class="terminal-nav">top</div></div>'
+    '<aside id="terminal-mkdocs-side-panel"><nav><ul><li>one<li>two</ul></nav></aside>'
+    '<main id="terminal-mkdocs-main-content"><p>para<p>ça</main>'
+    '<footer>foot</footer></body></html>'
+)
+
+
+def build_site(tmp_path, **plugin_config):
+    config = load_config(
+        docs_dir=str(PROJECT_ROOT / "tests" / "examples" / "subpages" / "docs"),
+        site_dir=str(tmp_path / "site"),
+        theme={"name": None, "custom_dir": str(THEME_DIR)},
+        plugins=["search", {theme_plugins.SIZE_BUDGET: plugin_config}],
+    )
+    build(config)
+
+
+class TestSizeReport():
+
+    def test_that_regions_are_measured_in_bytes(self):
+        total, regions = measure_regions(PAGE)
+        assert total == len(PAGE.encode("utf-8"))
+        assert regions["top_nav"] == len('<div class="terminal-nav">top</div>')
+        assert regions["footer"] == len("<footer>foot</footer>")
+        assert regions["content"] == len('<main id="terminal-mkdocs-main-content"><p>para<p>ça</main>'.encode("utf-8"))
+        assert sum(regions.values()) == total
+
+    def test_that_regions_after_unusual_line_breaks_are_measured(self):
+        # HTMLParser only counts "\n" as a line break
+        page = PAGE.replace("<body>", "<body>\r\f\u2028\n\r\n").replace("<footer>", "\u2028\n<footer>")
+        _, regions = measure_regions(page)
+        assert regions["footer"] == len("<footer>foot</footer>")
+        assert regions["content"] == len('<main id="terminal-mkdocs-main-content"><p>para<p>ça</main>'.encode("utf-8"))
+
+    def test_that_missing_region_is_zero(self):
+        _, regions = measure_regions("<html><body><main id='terminal-mkdocs-main-content'></main></body></html>")
+        assert regions["side_nav"] == 0
+
+    def test_that_stylesheets_and_scripts_are_found(self):
+        assert find_asset_references(PAGE) == [("stylesheet", "../css/a.css"), ("script", "../js/b.js")]
+
+    def test_that_asset_paths_are_resolved_from_page(self):
+        assert resolve_asset_path("about/index.html", "../css/a.css?v=1") == "css/a.css"
+        assert resolve_asset_path("index.html", "/js/b.js") == "js/b.js"
+        assert resolve_asset_path("index.html", "https://cdn.example.com/a.css") is None
+
+    def test_that_budget_violations_are_reported(self):
+        report = SizeReport(pages=[PageSize("index.html", 500, {"side_nav": 300})], assets={"css/a.css": 90, "js/b.js": 10})
+        violations = check_budgets(report, page_budget=400, region_budgets={"side_nav": 300}, asset_budgets={"css/*.css": 50}, total_asset_budget=99)
+        assert len(violations) == 3
+
+
+class TestSizeBudgetPlugin():
+
+    def test_that_report_is_written(self, tmp_path):
+        report_file = tmp_path / "size-report.json"
+        build_site(tmp_path, report_file=str(report_file))
+        report = json.loads(report_file.read_text(encoding="utf-8"))
+        index = report["pages"]["index.html"]
+        assert index["regions"]["side_nav"] > 0
+        assert index["regions"]["content"] > 0
+        assert "css/terminal.css" in report["assets"]
+        assert "js/mkdocs/base.js" in report["assets"]
+        assert "search/main.js" in report["assets"]
+
+    def test_that_exceeded_budget_fails_build(self, tmp_path):
+        with pytest.raises(Abort):
+            build_site(tmp_path, region_budgets={"side_nav": 10})
+
+    def test_that_invalid_budget_fails_build(self, tmp_path):
+        with pytest.raises(Abort):
+            build_site(tmp_path, region_budgets={"side_nav": "10kb"})
+
+    def test_that_exceeded_budget_can_only_warn(self, tmp_path, caplog):
+        with caplog.at_level(logging.WARNING, logger="mkdocs.terminal.size_budget"):
+            build_site(tmp_path, region_budgets={"side_nav": 20}, fail_on_exceed=False)
+        assert any("size budget exceeded" in record.getMessage() for record in caplog.records)
@@ -0,0 +1,257 @@
+"""Generate large MkDocs projects which use the Terminal theme.
+
+The generated sites are used to measure the side nav, tile grid and search
+code paths at a realistic scale.  Generate a project from the command line with::
+
+    python -m tests.synthetic_site /tmp/large-site --pages 1000 --nav-depth 4 --tiles 6
+
+and build it with ``mkdocs build -f /tmp/large-site/mkdocs.yml``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+from tests.integration_helper import load_config
+
+THEME_DIR = Path(__file__).resolve().parent.parent / "terminal"
+TILE_GRID_MODULE = "mkdocs-terminal:terminal.pluglets.tile_grid.main"
+TILE_IMAGE_PATH = "img/tile.svg"
+TILE_IMAGE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="200" height="200">'
+    '<rect width="200" height="200" fill="#888"/></svg>\n'
+)
+TILES_AFTER_CONTENT = "after"
+TILES_BEFORE_CONTENT = "first"
+TILES_INLINE = "inline"
+TILE_PLACEMENTS = [TILES_AFTER_CONTENT, TILES_BEFORE_CONTENT, TILES_INLINE]
+SECTION_INDEXES_FEATURE = "navigation.side.indexes"
+
+
+@dataclass
+class SyntheticSiteOptions:
+    """Shape of a generated site.
+
+    page_count is the number of regular pages, including the home page.  When
+    section_indexes is set an index page is written for every section as well.
+    """
+
+    page_count: int = 100
+    nav_depth: int = 3
+    section_indexes: bool = True
+    tiles_per_page: int = 0
+    tile_placement: str = TILES_AFTER_CONTENT
+    palette: Optional[str] = None
+    search: bool = True
+    features: List[str] = field(default_factory=list)
+    site_name: str = "Synthetic Site"
+
+
+@dataclass
+class SyntheticSite:
+    project_dir: Path
+    docs_dir: Path
+    config_file: Path
+    nav: list
+    page_count: int
+    options: SyntheticSiteOptions
+
+
+def get_branching_factor(page_count: int, nav_depth: int) -> int:
+    """Return the number of children per section so that page_count pages fill nav_depth levels."""
+    return max(2, math.ceil(page_count ** (1 / max(nav_depth, 1))))
+
+
+def get_page_paths(options: SyntheticSiteOptions) -> List[Tuple[str, ...]]:
+    """Return the section path of every leaf page, numbered in nav order."""
+    branching = get_branching_factor(options.page_count, options.nav_depth)
+    paths = []
+    for page_number in range(1, options.page_count):
+        digits = []
+        remainder = page_number
+        for _ in range(options.nav_depth):
+            digits.append(remainder % branching)
+            remainder //= branching
+        digits.reverse()
+        paths.append(tuple(f"section-{digit}" for digit in digits[:-1]))
+    return paths
+
+
+def get_section_title(section_path: Tuple[str, ...]) -> str:
+    return " ".join(section_path[-1].split("-")).title()
+
+
+def render_tiles(options: SyntheticSiteOptions, page_number: int, image_src: str) -> List[Dict[str, str]]:
+    tiles = []
+    for tile_number in range(options.tiles_per_page):
+        tile = {
+            "caption": f"Tile {page_number}.{tile_number}",
+            "link_href": f"https://example.com/{page_number}/{tile_number}",
+            "alt_text": f"tile {tile_number} of page {page_number}",
+        }
+        if tile_number % 2 == 0:
+            tile["img_src"] = image_src
+        tiles.append(tile)
+    return tiles
+
+
+def render_page(title: str, page_number: int, options: SyntheticSiteOptions, depth: int) -> str:
+    """Return the markdown source for a generated page whose URL is depth directories below the site root."""
+    front_matter: Dict[str, object] = {}
+    body = [
+        f"# {title}",
+        "",
+        "## Overview",
+        "",
+        f"Generated page {page_number} with **bold**, *emphasis* and `inline code`.",
+        "",
+        "## Details",
+        "",
+        "- first item",
+        "- second item",
+        "",
+        "```python",
+        f"print({page_number})",
+        "```",
+        "",
+    ]
+    if options.tiles_per_page:
+        image_src = "../" * depth + TILE_IMAGE_PATH
+        front_matter["tiles"] = render_tiles(options, page_number, image_src)
+        if options.tile_placement == TILES_BEFORE_CONTENT:
+            front_matter["show_tiles_first"] = True
+        elif options.tile_placement == TILES_INLINE:
+            front_matter["show_tiles_inline"] = True
+            body += ["{{ tile_grid(page.meta) }}", ""]
+    if not front_matter:
+        return "\n".join(body)
+    return "---\n" + yaml.safe_dump(front_matter, sort_keys=False) + "---\n\n" + "\n".join(body)
+
+
+def write_page(docs_dir: Path, relative_path: Path, content: str):
+    path = docs_dir / relative_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def write_docs(docs_dir: Path, options: SyntheticSiteOptions) -> Tuple[list, int]:
+    """Write the markdown pages for options and return the nav and the number of pages written."""
+    nav: list = [{"Home": "index.md"}]
+    write_page(docs_dir, Path("index.md"), render_page("Home", 0, options, 0))
+    page_count = 1
+    sections: Dict[Tuple[str, ...], list] = {(): nav}
+    for page_number, section_path in enumerate(get_page_paths(options), start=1):
+        for depth in range(1, len(section_path) + 1):
+            current_section = section_path[:depth]
+            if current_section in sections:
+                continue
+            children: list = []
+            if options.section_indexes:
+                index_path = Path(*current_section, "index.md")
+                title = get_section_title(current_section)
+                write_page(docs_dir, index_path, render_page(title, page_number, options, depth))
+                children.append(index_path.as_posix())
+                page_count += 1
+            sections[current_section[:-1]].append({get_section_title(current_section): children})
+            sections[current_section] = children
+        relative_path = Path(*section_path, f"page-{page_number}.md")
+        write_page(docs_dir, relative_path, render_page(f"Page {page_number}", page_number, options, len(section_path) + 1))
+        sections[section_path].append({f"Page {page_number}": relative_path.as_posix()})
+        page_count += 1
+    if options.tiles_per_page:
+        write_page(docs_dir, Path(TILE_IMAGE_PATH), TILE_IMAGE)
+    return nav, page_count
+
+
+def get_theme_config(options: SyntheticSiteOptions) -> dict:
+    features = list(options.features)
+    if options.section_indexes and SECTION_INDEXES_FEATURE not in features:
+        features.append(SECTION_INDEXES_FEATURE)
+    theme: Dict[str, object] = {"name": "terminal", "features": features}
+    if options.palette is not None:
+        theme["palette"] = options.palette
+    return theme
+
+
+def get_plugins_config(options: SyntheticSiteOptions) -> list:
+    plugins: list = []
+    if options.search:
+        plugins.append("search")
+    if options.tiles_per_page and options.tile_placement == TILES_INLINE:
+        plugins.append({"macros": {"modules": [TILE_GRID_MODULE]}})
+    return plugins
+
+
+def generate_site(project_dir: Path, options: Optional[SyntheticSiteOptions] = None) -> SyntheticSite:
+    """Write a MkDocs project (mkdocs.yml and docs/) for options into project_dir."""
+    options = options or SyntheticSiteOptions()
+    if options.tile_placement not in TILE_PLACEMENTS:
+        raise ValueError(f"tile_placement must be one of {TILE_PLACEMENTS}, got '{options.tile_placement}'")
+    project_dir = Path(project_dir)
+    docs_dir = project_dir / "docs"
+    nav, page_count = write_docs(docs_dir, options)
+    config_file = project_dir / "mkdocs.yml"
+    config_data = {
+        "site_name": options.site_name,
+        "nav": nav,
+        "theme": get_theme_config(options),
+        "plugins": get_plugins_config(options),
+        "markdown_extensions": ["meta", "toc"],
+    }
+    config_file.write_text(yaml.safe_dump(config_data, sort_keys=False), encoding="utf-8")
+    return SyntheticSite(project_dir, docs_dir, config_file, nav, page_count, options)
+
+
+def load_site_config(site: SyntheticSite, site_dir: Path):
+    """Load the MkDocs config for a generated site using the theme from this checkout."""
+    theme = get_theme_config(site.options)
+    theme["name"] = None
+    theme["custom_dir"] = str(THEME_DIR)
+    return load_config(
+        config_file_path=str(site.config_file),
+        docs_dir=str(site.docs_dir),
+        site_dir=str(site_dir),
+        site_name=site.options.site_name,
+        nav=site.nav,
+        theme=theme,
+        plugins=get_plugins_config(site.options),
+        markdown_extensions=["meta", "toc"],
+    )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a large MkDocs project which uses the Terminal theme.")
+    parser.add_argument("project_dir", type=Path)
+    parser.add_argument("--pages", type=int, default=SyntheticSiteOptions.page_count)
+    parser.add_argument("--nav-depth", type=int, default=SyntheticSiteOptions.nav_depth)
+    parser.add_argument("--no-section-indexes", action="store_true")
+    parser.add_argument("--tiles", type=int, default=0, help="tiles per page")
+    parser.add_argument("--tile-placement", choices=TILE_PLACEMENTS, default=TILES_AFTER_CONTENT)
+    parser.add_argument("--palette")
+    parser.add_argument("--no-search", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    options = SyntheticSiteOptions(
+        page_count=args.pages,
+        nav_depth=args.nav_depth,
+        section_indexes=not args.no_section_indexes,
+        tiles_per_page=args.tiles,
+        tile_placement=args.tile_placement,
+        palette=args.palette,
+        search=not args.no_search,
+    )
+    site = generate_site(args.project_dir, options)
+    print(f"wrote {site.page_count} pages to {site.docs_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+from pathlib import Path
+from bs4 import BeautifulSoup
+from mkdocs.commands.build import build
+from tests.integration_helper import load_config
+from tests.interface import theme_features, theme_plugins
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+THEME_DIR = PROJECT_ROOT / "terminal"
+
+
+TILE_PAGE = "---\ntiles:\n  - caption: tile\n    img_src: img/tile.png\n    alt_text: tile image\n---\n\n# Tiles\n"
+
+
+def build_index_page(tmp_path, features, docs_dir=None):
+    site_dir = tmp_path / "site"
+    config = load_config(
+        docs_dir=str(docs_dir or PROJECT_ROOT / "tests" / "examples" / "minimal" / "docs"),
+        site_dir=str(site_dir),
+        theme={"name": None, "custom_dir": str(THEME_DIR), "features": features},
+        plugins=[theme_plugins.SEARCH],
+    )
+    build(config)
+    return BeautifulSoup((site_dir / "index.html").read_text(encoding="utf-8"), "html.parser")
+
+
+class TestAdaptiveLoading():
+
+    def test_that_detection_runs_before_stylesheets(self, tmp_path):
+        head = build_index_page(tmp_path, [theme_features.ADAPTIVE_LOADING]).head
+        first_script = head.find("script")
+        first_stylesheet = head.find("link", rel="stylesheet")
+        assert "prefers-reduced-data" in first_script.string
+        assert "saveData" in first_script.string
+        assert first_script.sourceline < first_stylesheet.sourceline
+
+    def test_that_search_script_is_loaded_on_demand(self, tmp_path):
+        soup = build_index_page(tmp_path, [theme_features.ADAPTIVE_LOADING])
+        assert soup.find("script", src="search/main.js") is None
+        assert any("loadSearchScript(\"search/main.js\")" in (script.string or "") for script in soup.find_all("script"))
+
+    def test_that_icon_font_is_not_linked_directly(self, tmp_path):
+        soup = build_index_page(tmp_path, [theme_features.ADAPTIVE_LOADING])
+        icon_links = soup.select('link[href$="solid.min.css"]')
+        assert len(icon_links) == 1
+        assert icon_links[0].find_parent("noscript") is not None
+
+    def test_that_assets_load_normally_when_disabled(self, tmp_path):
+        soup = build_index_page(tmp_path, [])
+        assert soup.find("script", src="search/main.js") is not None
+        assert soup.select('link[href$="solid.min.css"]')[0].find_parent("noscript") is None
+        assert "terminal_adaptive" not in str(soup)
+
+    def test_that_tile_images_keep_lazy_src(self, tmp_path):
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "index.md").write_text(TILE_PAGE, encoding="utf-8")
+        soup = build_index_page(tmp_path, [theme_features.ADAPTIVE_LOADING], docs_dir=docs_dir)
+        image = soup.select_one(".terminal-mkdocs-tile img")
+        assert image["src"] == "img/tile.png"
+        assert image["loading"] == "lazy"
+        assert image.has_attr("data-terminal-optional")
+        assert image.find_parent("noscript") is None
@@ -0,0 +1,177 @@
+from multiprocessing import get_context
+from mkdocs.commands.build import build
+from pathlib import Path
+from tests import e2e_helper
+from tests.conftest import EXAMPLE_BUILD_MATRIX_KEY
+from tests.e2e_helper import (
+    BUILD_COMPLETE_MARKER, build_example_site, derive_palette_site, file_lock, get_build_cache_key,
+    get_cached_example_site, get_palette_uri, hash_tree, load_example_config, prebuild_example_sites,
+    rewrite_palette_links
+)
+from tests.interface.theme_features import DEFAULT_PALETTES
+import pytest
+import time
+
+
+@pytest.fixture
+def build_calls(monkeypatch):
+    calls = []
+    real_build = e2e_helper.build
+
+    def counting_build(config):
+        calls.append(Path(config["site_dir"]))
+        return real_build(config)
+
+    monkeypatch.setattr(e2e_helper, "build", counting_build)
+    monkeypatch.setattr(e2e_helper, "_BUILT_SITES", {})
+    return calls
+
+
+def hold_lock(lock_path, hold_seconds, log_path):
+    with file_lock(Path(lock_path)):
+        with open(log_path, "a") as log:
+            log.write("start %f\n" % time.time())
+        time.sleep(hold_seconds)
+        with open(log_path, "a") as log:
+            log.write("end %f\n" % time.time())
+
+
+class TestBuildCache:
+
+    def test_that_cache_key_depends_on_example_and_palette(self):
+        key = get_build_cache_key("minimal", "dark")
+        assert key == get_build_cache_key("minimal", "dark")
+        assert key.startswith("minimal-dark-")
+        assert key != get_build_cache_key("minimal", "default")
+        assert key != get_build_cache_key("search-enabled", "dark")
+        assert get_build_cache_key("minimal", None).startswith("minimal-theme-default-")
+
+    def test_that_tree_hash_tracks_content_and_paths(self, tmp_path):
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "index.md").write_text("# Home", encoding="utf-8")
+        (tmp_path / "__pycache__").mkdir()
+        original = hash_tree(tmp_path)
+        hash_tree.cache_clear()
+        (tmp_path / "__pycache__" / "x.pyc").write_bytes(b"ignored")
+        assert hash_tree(tmp_path) == original
+        hash_tree.cache_clear()
+        (tmp_path / "docs" / "index.md").write_text("# Changed", encoding="utf-8")
+        assert hash_tree(tmp_path) != original
+        hash_tree.cache_clear()
+
+    def test_that_cached_build_is_reused(self, tmp_path, build_calls):
+        cache_dir = tmp_path / "cache"
+        cached_site = get_cached_example_site("minimal", "dark", cache_dir)
+        assert (cached_site / BUILD_COMPLETE_MARKER).exists()
+        assert get_cached_example_site("minimal", "dark", cache_dir) == cached_site
+        assert len(build_calls) == 1
+        assert not list(cache_dir.glob("*.partial"))
+
+    def test_that_older_builds_are_removed(self, tmp_path, build_calls):
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        stale_entries = ["minimal-dark-0123456789abcdef", "minimal-dark-0123456789abcdef.lock", "minimal-dark-fedcba9876543210.partial"]
+        kept_entries = ["minimal-default-0123456789abcdef", "minimal-dark-theme-default-0123456789abcdef", "minimal-darker-0123456789abcdef"]
+        for name in stale_entries + kept_entries:
+            if name.endswith(".lock"):
+                (cache_dir / name).touch()
+            else:
+                (cache_dir / name).mkdir()
+        cached_site = get_cached_example_site("minimal", "dark", cache_dir)
+        remaining = sorted(entry.name for entry in cache_dir.iterdir())
+        assert remaining == sorted(kept_entries + [cached_site.name, cached_site.name + ".lock"])
+
+    def test_that_sites_are_copied_from_the_cache(self, tmp_path_factory, tmp_path, build_calls):
+        cache_dir = tmp_path / "cache"
+        first = build_example_site(tmp_path_factory, "minimal", "dark", cache_dir)
+        e2e_helper._BUILT_SITES.clear()
+        second = build_example_site(tmp_path_factory, "minimal", "dark", cache_dir)
+        assert first != second
+        assert len(build_calls) == 1
+        assert (second / "index.html").read_text(encoding="utf-8") == (first / "index.html").read_text(encoding="utf-8")
+        assert 'css/palettes/dark.css' in (second / "index.html").read_text(encoding="utf-8")
+        assert not (second / BUILD_COMPLETE_MARKER).exists()
+
+    def test_that_builds_without_cache_dir_are_not_cached(self, tmp_path_factory, build_calls):
+        site = build_example_site(tmp_path_factory, "minimal")
+        assert build_calls == [site.resolve()]
+
+    def test_that_file_lock_excludes_other_processes(self, tmp_path):
+        lock_path = tmp_path / "site.lock"
+        log_path = tmp_path / "log.txt"
+        context = get_context("spawn")
+        processes = [context.Process(target=hold_lock, args=(str(lock_path), 0.3, str(log_path))) for _ in range(2)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(30)
+            assert process.exitcode == 0
+        events = [line.split() for line in log_path.read_text().splitlines()]
+        assert [event for event, _ in events] == ["start", "end", "start", "end"]
+        assert float(events[2][1]) >= float(events[1][1])
+
+
+class TestPrebuild:
+
+    def test_that_prebuilt_sites_are_reused(self, tmp_path_factory, tmp_path, build_calls):
+        example_builds = [("minimal", "dark"), ("minimal", "gruvbox_dark"), ("minimal", "dark")]
+        sites = prebuild_example_sites(tmp_path_factory, example_builds, tmp_path / "cache", workers=2)
+        assert list(sites) == [("minimal", "dark"), ("minimal", "gruvbox_dark")]
+        for (_, palette_name), site in sites.items():
+            assert f"css/palettes/{palette_name}.css" in (site / "index.html").read_text(encoding="utf-8")
+        assert build_example_site(tmp_path_factory, "minimal", "dark", tmp_path / "cache") == sites[("minimal", "dark")]
+
+    def test_that_cached_sites_are_not_rebuilt(self, tmp_path_factory, tmp_path, build_calls):
+        cache_dir = tmp_path / "cache"
+        get_cached_example_site("minimal", "dark", cache_dir)
+        get_cached_example_site("minimal", None, cache_dir)
+        sites = prebuild_example_sites(tmp_path_factory, [("minimal", "dark"), ("search-enabled", None)], cache_dir, workers=1)
+        assert len(build_calls) == 3
+        assert (sites[("search-enabled", None)] / "index.html").exists()
+
+    def test_that_each_example_is_built_once(self, monkeypatch, tmp_path_factory, build_calls):
+        monkeypatch.setenv("TERMINAL_PREBUILD_WORKERS", "1")
+        sites = prebuild_example_sites(tmp_path_factory, [("minimal", palette) for palette in DEFAULT_PALETTES] + [("minimal", None)])
+        assert build_calls == [sites[("minimal", None)].resolve()]
+        assert len(set(sites.values())) == len(DEFAULT_PALETTES) + 1
+
+    @pytest.mark.parametrize("built_example_site_with_palette", [("minimal", "dark")], indirect=True)
+    def test_that_collected_builds_are_recorded(self, request, built_example_site_with_palette, example_site_builds):
+        assert ("minimal", "dark") in request.config.stash[EXAMPLE_BUILD_MATRIX_KEY]
+        assert example_site_builds[("minimal", "dark")] == built_example_site_with_palette
+
+
+class TestPaletteVariants:
+
+    @pytest.mark.parametrize("example_name", ["minimal", "pymdown-pygments", "search-enabled", "subpages"])
+    @pytest.mark.parametrize("palette_name", ["dark", "gruvbox_dark"])
+    def test_that_derived_site_matches_full_build(self, tmp_path, example_name, palette_name):
+        build(load_example_config(example_name, tmp_path / "base"))
+        build(load_example_config(example_name, tmp_path / "full", palette_name))
+        derived_site = derive_palette_site(tmp_path / "base", tmp_path / "derived", palette_name)
+        full_files = get_site_files(tmp_path / "full")
+        assert full_files == get_site_files(derived_site)
+        for relative_path in full_files:
+            assert (derived_site / relative_path).read_bytes() == (tmp_path / "full" / relative_path).read_bytes(), relative_path
+
+    def test_that_relative_and_fingerprinted_links_are_rewritten(self):
+        html = '<!-- default color palette -->\n<link href="../../css/palettes/default.0123abcd.css" rel="stylesheet">'
+        assert rewrite_palette_links(html, "dark", "css/palettes/dark.89ef4567.css") == (
+            '<!-- dark color palette -->\n<link href="../../css/palettes/dark.89ef4567.css" rel="stylesheet">'
+        )
+
+    def test_that_fingerprint_manifest_is_used(self, tmp_path):
+        (tmp_path / "css" / "palettes").mkdir(parents=True)
+        (tmp_path / "css" / "palettes" / "dark.89ef4567.css").write_text("", encoding="utf-8")
+        (tmp_path / "assets-manifest.json").write_text('{"css/palettes/dark.css": "css/palettes/dark.89ef4567.css"}', encoding="utf-8")
+        assert get_palette_uri(tmp_path, "dark") == "css/palettes/dark.89ef4567.css"
+
+    def test_that_unknown_palettes_are_rejected(self, tmp_path_factory, tmp_path):
+        base_site = build_example_site(tmp_path_factory, "minimal")
+        with pytest.raises(ValueError, match="not_a_palette"):
+            derive_palette_site(base_site, tmp_path / "derived", "not_a_palette")
+
+
+def get_site_files(site_dir):
+    # sitemap.xml.gz embeds the build time
+    return sorted(path.relative_to(site_dir).as_posix() for path in site_dir.rglob("*") if path.is_file() and path.name != "sitemap.xml.gz")
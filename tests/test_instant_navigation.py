@@ -0,0 +1,113 @@
+from pathlib import Path
+from bs4 import BeautifulSoup
+from mkdocs.commands.build import build
+from tests.integration_helper import load_config
+from tests.interface import theme_features, theme_plugins
+import pytest
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+THEME_DIR = PROJECT_ROOT / "terminal"
+INSTANT_SCRIPT = "js/terminal/instant.js"
+SIDE_NAV_SELECTOR = "#terminal-mkdocs-side-panel > nav:first-child"
+TILE_PAGE = "---\ntiles:\n  - caption: tile\n    img_src: ../../img/tile.png\n    alt_text: tile image\n---\n\n# Tiles\n\n## First Section\n\n## Second Section\n"
+
+
+def build_site(tmp_path, features, plugins=None, docs_dir=None):
+    site_dir = tmp_path / "site"
+    config = load_config(
+        docs_dir=str(docs_dir or PROJECT_ROOT / "tests" / "examples" / "subpages" / "docs"),
+        site_dir=str(site_dir),
+        theme={"name": None, "custom_dir": str(THEME_DIR), "features": features},
+        plugins=plugins or [theme_plugins.SEARCH],
+    )
+    build(config)
+    return site_dir
+
+
+def load_pages(site_dir):
+    return {
+        path.relative_to(site_dir).as_posix(): BeautifulSoup(path.read_text(encoding="utf-8"), "html.parser")
+        for path in sorted(site_dir.glob("**/index.html"))
+    }
+
+
+def get_side_nav_items(page):
+    return page.select_one(SIDE_NAV_SELECTOR).select("a, span")
+
+
+def get_head_assets(page):
+    return [element.get("href") or element.get("src") for element in page.head.select('link[rel="stylesheet"][href], script[src]') if not element.find_parent("noscript")]
+
+
+class TestInstantNavigation():
+
+    def test_that_script_is_added_when_enabled(self, tmp_path):
+        site_dir = build_site(tmp_path, [theme_features.NAVIGATION_INSTANT])
+        page = load_pages(site_dir)["index.html"]
+        script = page.head.find("script", src=INSTANT_SCRIPT)
+        assert script is not None
+        assert script.has_attr("defer")
+        assert (site_dir / INSTANT_SCRIPT).exists()
+
+    def test_that_script_is_not_added_by_default(self, tmp_path):
+        page = load_pages(build_site(tmp_path, []))["index.html"]
+        assert page.find("script", src=INSTANT_SCRIPT) is None
+
+    def test_that_script_does_not_use_jquery(self):
+        script = (THEME_DIR / INSTANT_SCRIPT).read_text(encoding="utf-8")
+        assert "$(" not in script
+        assert "jQuery" not in script
+
+    @pytest.mark.parametrize("features", [
+        pytest.param([theme_features.NAVIGATION_INSTANT], id="default_side_nav"),
+        pytest.param([theme_features.NAVIGATION_INSTANT, theme_features.SHOW_INDEX_SECTIONS], id="section_indexes"),
+    ])
+    def test_that_side_nav_items_line_up_across_pages(self, tmp_path, features):
+        """instant.js only replaces the side nav items which differ, matching items by position"""
+        pages = load_pages(build_site(tmp_path, features))
+        item_counts = {path: len(get_side_nav_items(page)) for path, page in pages.items()}
+        assert len(set(item_counts.values())) == 1, item_counts
+        for page in pages.values():
+            active_items = [item for item in get_side_nav_items(page) if "--active" in " ".join(item.get("class", []))]
+            assert active_items
+
+    def test_that_swapped_regions_exist_on_every_page(self, tmp_path):
+        pages = load_pages(build_site(tmp_path, [theme_features.NAVIGATION_INSTANT, theme_features.FOOTER_PREV_NEXT]))
+        for path, page in pages.items():
+            assert page.find(id="terminal-mkdocs-main-content") is not None, path
+            assert page.select_one(SIDE_NAV_SELECTOR) is not None, path
+            assert page.find("footer") is not None, path
+            assert not page.find(id="terminal-mkdocs-main-content").find("script"), path
+
+    def test_that_pages_share_head_assets(self, tmp_path):
+        """instant.js falls back to a full page load when the next page needs an asset which is not loaded"""
+        site_dir = build_site(tmp_path, [theme_features.NAVIGATION_INSTANT])
+        resolved_assets = set()
+        for path, page in load_pages(site_dir).items():
+            page_dir = (site_dir / path).parent
+            resolved_assets.add(tuple((page_dir / asset).resolve() for asset in get_head_assets(page)))
+        assert len(resolved_assets) == 1
+
+    def test_that_adaptive_loading_tiles_work_on_swapped_pages(self, tmp_path):
+        """tile images and the side table of contents on a page at another directory depth than the first page"""
+        docs_dir = tmp_path / "docs"
+        (docs_dir / "guide" / "tiles").mkdir(parents=True)
+        (docs_dir / "index.md").write_text("# Home\n", encoding="utf-8")
+        (docs_dir / "guide" / "tiles" / "index.md").write_text(TILE_PAGE, encoding="utf-8")
+        features = [theme_features.ADAPTIVE_LOADING, theme_features.NAVIGATION_INSTANT]
+        pages = load_pages(build_site(tmp_path, features, docs_dir=docs_dir))
+        tile_page = pages["guide/tiles/index.html"]
+        image = tile_page.select_one("#terminal-mkdocs-main-content .terminal-mkdocs-tile img")
+        assert image["src"] == "../../img/tile.png"
+        assert image["loading"] == "lazy"
+        assert image.has_attr("data-terminal-optional")
+        assert tile_page.select_one("#terminal-mkdocs-side-panel a[href='#second-section']") is not None
+        adaptive_script = next(script.string for script in tile_page.head.find_all("script") if "terminal_adaptive" in (script.string or ""))
+        assert "terminal:page-loaded" in adaptive_script
+        assert tile_page.head.find("script", src="../../" + INSTANT_SCRIPT) is not None
+
+    def test_that_scripts_rerun_setup_after_a_swap(self):
+        base_script = (THEME_DIR / "js" / "mkdocs" / "base.js").read_text(encoding="utf-8")
+        assert "$(document).on('terminal:page-loaded'" in base_script
+        assert "scrollspy('refresh')" in base_script
+        instant_script = (THEME_DIR / INSTANT_SCRIPT).read_text(encoding="utf-8")
+        assert "getAssetUrls(document" not in instant_script
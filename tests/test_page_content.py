@@ -0,0 +1,43 @@
+from pathlib import Path
+from bs4 import BeautifulSoup
+import pytest
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+BASE_JS = PROJECT_ROOT / "terminal" / "js" / "mkdocs" / "base.js"
+TABLE_CLASSES = ["table", "table-striped", "table-hover"]
+MARKDOWN_TABLE = "<table>\n<thead>\n<tr>\n<th>Name</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td>value</td>\n</tr>\n</tbody>\n</table>"
+
+
+@pytest.fixture
+def content_partial(env_with_terminal_loader):
+    return env_with_terminal_loader.get_template("partials/page-content/content.html")
+
+
+def render_content(content_partial, content):
+    return BeautifulSoup(content_partial.render({"page": {"content": content}}), "html.parser")
+
+
+class TestPageContent():
+
+    def test_that_tables_are_styled_at_build_time(self, content_partial):
+        soup = render_content(content_partial, MARKDOWN_TABLE + "\n<p>text</p>\n" + MARKDOWN_TABLE)
+        tables = soup.find_all("table")
+        assert len(tables) == 2
+        assert all(table["class"] == TABLE_CLASSES for table in tables)
+
+    def test_that_tables_with_attributes_are_unchanged(self, content_partial):
+        soup = render_content(content_partial, '<table class="highlighttable"><tr><td>1</td></tr></table>')
+        assert soup.find("table")["class"] == ["highlighttable"]
+
+    def test_that_escaped_tables_in_code_are_unchanged(self, content_partial):
+        soup = render_content(content_partial, "<pre><code>&lt;table&gt;</code></pre>")
+        assert soup.find("code").string == "<table>"
+
+    def test_that_base_js_only_styles_unstyled_tables(self):
+        base_js = BASE_JS.read_text(encoding="utf-8")
+        assert "$('table').addClass" not in base_js
+        assert "$('table:not(.table)').addClass" in base_js
+
+    def test_that_base_js_does_not_measure_layout_on_resize_events(self):
+        base_js = BASE_JS.read_text(encoding="utf-8")
+        assert "ResizeObserver" in base_js
+        assert "$(window).on('resize', applyTopPadding)" not in base_js
@@ -0,0 +1,61 @@
+from pathlib import Path
+from bs4 import BeautifulSoup
+from mkdocs.commands.build import build
+from tests.integration_helper import load_config
+from tests.interface import theme_features, theme_plugins
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+THEME_DIR = PROJECT_ROOT / "terminal"
+PREFETCH_SCRIPT = "js/terminal/prefetch.js"
+
+
+def build_site(tmp_path, features, plugins=None):
+    site_dir = tmp_path / "site"
+    config = load_config(
+        docs_dir=str(PROJECT_ROOT / "tests" / "examples" / "subpages" / "docs"),
+        site_dir=str(site_dir),
+        theme={"name": None, "custom_dir": str(THEME_DIR), "features": features},
+        plugins=plugins or [theme_plugins.SEARCH],
+    )
+    build(config)
+    return site_dir
+
+
+def load_page(site_dir, path="index.html"):
+    return BeautifulSoup((site_dir / path).read_text(encoding="utf-8"), "html.parser")
+
+
+class TestPrefetch():
+
+    def test_that_script_is_added_when_enabled(self, tmp_path):
+        site_dir = build_site(tmp_path, [theme_features.NAVIGATION_PREFETCH])
+        script = load_page(site_dir).head.find("script", src=PREFETCH_SCRIPT)
+        assert script is not None
+        assert script.has_attr("defer")
+        assert (site_dir / PREFETCH_SCRIPT).exists()
+
+    def test_that_script_uses_page_relative_url(self, tmp_path):
+        site_dir = build_site(tmp_path, [theme_features.NAVIGATION_PREFETCH])
+        nested_page = next(site_dir.glob("*/*/index.html"))
+        assert load_page(site_dir, nested_page.relative_to(site_dir)).find("script", src="../../" + PREFETCH_SCRIPT) is not None
+
+    def test_that_script_is_not_added_by_default(self, tmp_path):
+        site_dir = build_site(tmp_path, [])
+        assert load_page(site_dir).find("script", src=PREFETCH_SCRIPT) is None
+
+    def test_that_script_is_fingerprinted(self, tmp_path):
+        site_dir = build_site(tmp_path, [theme_features.NAVIGATION_PREFETCH], [theme_plugins.SEARCH, theme_plugins.FINGERPRINT])
+        script = load_page(site_dir).head.find("script", src=lambda src: src and src.startswith("js/terminal/prefetch."))
+        assert script["src"] != PREFETCH_SCRIPT
+        assert (site_dir / script["src"]).exists()
+
+    def test_that_script_does_not_use_jquery(self):
+        script = (THEME_DIR / PREFETCH_SCRIPT).read_text(encoding="utf-8")
+        assert "$(" not in script
+        assert "jQuery" not in script
+
+    def test_that_selectors_match_theme_navigation(self, tmp_path):
+        site_dir = build_site(tmp_path, [theme_features.NAVIGATION_PREFETCH, theme_features.FOOTER_PREV_NEXT])
+        soup = load_page(site_dir)
+        assert soup.select("#terminal-mkdocs-side-panel nav a[href]")
+        assert soup.select(".terminal-menu a.menu-item[href]")
+        assert soup.select("#terminal-mkdocs-footer-prev-next a[href]")
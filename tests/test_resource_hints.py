@@ -0,0 +1,79 @@
+from pathlib import Path
+from bs4 import BeautifulSoup
+from mkdocs.commands.build import build
+from tests.integration_helper import load_config
+from tests.interface import theme_features, theme_plugins
+import pytest
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+THEME_DIR = PROJECT_ROOT / "terminal"
+HIGHLIGHTJS_CDN = "https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.11.0"
+
+
+def build_index_page(tmp_path, features=None, plugins=None, **config_options):
+    site_dir = tmp_path / "site"
+    config = load_config(
+        docs_dir=str(PROJECT_ROOT / "tests" / "examples" / "minimal" / "docs"),
+        site_dir=str(site_dir),
+        theme={"name": None, "custom_dir": str(THEME_DIR), "features": features or []},
+        plugins=plugins or [theme_plugins.SEARCH],
+        **config_options
+    )
+    build(config)
+    return BeautifulSoup((site_dir / "index.html").read_text(encoding="utf-8"), "html.parser")
+
+
+@pytest.fixture
+def resource_hints_partial(env_with_terminal_loader):
+    return env_with_terminal_loader.get_template("partials/resource-hints.html")
+
+
+class TestResourceHints():
+
+    def test_that_critical_assets_are_preloaded_before_stylesheets(self, tmp_path):
+        head = build_index_page(tmp_path).head
+        style_preload = head.find("link", rel="preload", attrs={"as": "style"})
+        font_preload = head.find("link", rel="preload", attrs={"as": "font"})
+        assert style_preload["href"] == "css/terminal.css"
+        assert font_preload["href"] == "css/fontawesome/webfonts/fa-solid-900.woff2"
+        assert font_preload["type"] == "font/woff2"
+        assert font_preload.has_attr("crossorigin")
+        assert font_preload.sourceline < head.find("link", rel="stylesheet").sourceline
+
+    def test_that_preloaded_stylesheet_is_linked(self, tmp_path):
+        head = build_index_page(tmp_path).head
+        style_preload = head.find("link", rel="preload", attrs={"as": "style"})
+        assert head.find("link", rel="stylesheet", href=style_preload["href"]) is not None
+
+    def test_that_font_preload_matches_icon_stylesheet(self):
+        solid_css = (THEME_DIR / "css" / "fontawesome" / "css" / "solid.min.css").read_text(encoding="utf-8")
+        assert "url(../webfonts/fa-solid-900.woff2)" in solid_css
+
+    def test_that_font_is_not_preloaded_with_adaptive_loading(self, tmp_path):
+        head = build_index_page(tmp_path, [theme_features.ADAPTIVE_LOADING]).head
+        assert head.find("link", rel="preload", attrs={"as": "font"}) is None
+        assert head.find("link", rel="preload", attrs={"as": "style"}) is not None
+
+    def test_that_fingerprinted_assets_are_preloaded(self, tmp_path):
+        head = build_index_page(tmp_path, plugins=[theme_plugins.SEARCH, theme_plugins.FINGERPRINT]).head
+        style_preload = head.find("link", rel="preload", attrs={"as": "style"})
+        assert style_preload["href"] != "css/terminal.css"
+        assert head.find("link", rel="stylesheet", href=style_preload["href"]) is not None
+
+    def test_that_extra_asset_hosts_are_preconnected(self, tmp_path):
+        head = build_index_page(
+            tmp_path,
+            extra_css=[HIGHLIGHTJS_CDN + "/styles/a11y-light.min.css", "css/local.css"],
+            extra_javascript=[
+                HIGHLIGHTJS_CDN + "/highlight.min.js",
+                "https://unpkg.com/highlightjs-cobol/dist/cobol.min.js",
+                "//example.com/script.js",
+                "add_hljs_highlight.js",
+            ],
+        ).head
+        preconnects = [link["href"] for link in head.find_all("link", rel="preconnect")]
+        assert preconnects == ["https://cdnjs.cloudflare.com", "https://unpkg.com", "//example.com"]
+
+    def test_that_no_preconnect_without_external_assets(self, resource_hints_partial):
+        rendered = resource_hints_partial.render({"config": {"theme": {"features": []}, "extra_css": ["css/local.css"]}})
+        assert "preconnect" not in rendered
+        assert 'rel="preload"' in rendered
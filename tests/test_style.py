@@ -63,6 +63,19 @@ class TestStyles():
         assert "#mkdocs-terminal-site-name.terminal-prompt::after" in rendered_styles
         assert_valid_html(rendered_styles)
 
+    def test_that_icon_font_is_loaded_by_script_when_adaptive_loading_is_enabled(self, styles_partial, enabled_context):
+        enabled_context["config"]["theme"]["features"] = [theme_features.ADAPTIVE_LOADING]
+        rendered_styles = styles_partial.render(enabled_context)
+        expected_css_path = MOCK_URL_PATH_PREFIX + "css/fontawesome/css/solid.min.css"
+        assert "terminal_adaptive.loadStylesheet(\"" + expected_css_path + "\")" in rendered_styles
+        assert "<noscript>" in rendered_styles
+        assert ".terminal-lite #mkdocs-terminal-site-name.terminal-prompt::after" in rendered_styles
+
+    def test_that_icon_font_is_linked_when_adaptive_loading_is_disabled(self, styles_partial, enabled_context):
+        rendered_styles = styles_partial.render(enabled_context)
+        assert "terminal_adaptive" not in rendered_styles
+        assert "<noscript>" not in rendered_styles
+
     def test_that_override_css_added_when_link_underline_is_hidden(self, styles_partial, enabled_context):
         enabled_context["config"]["theme"]["features"] = [theme_features.HIDE_LINK_UNDERLINE]
         context_data = enabled_context
@@ -0,0 +1,49 @@
+from bs4 import BeautifulSoup
+from mkdocs.commands.build import build
+from tests.synthetic_site import (
+    SyntheticSiteOptions, TILES_INLINE, generate_site, get_page_paths, load_site_config
+)
+import pytest
+import yaml
+
+
+def get_nav_depth(nav):
+    depths = [1 + get_nav_depth(list(item.values())[0]) for item in nav if isinstance(item, dict) and isinstance(list(item.values())[0], list)]
+    return max(depths, default=0)
+
+
+class TestSyntheticSite:
+
+    def test_that_leaf_pages_are_nested_to_nav_depth(self):
+        paths = get_page_paths(SyntheticSiteOptions(page_count=100, nav_depth=4))
+        assert len(paths) == 99
+        assert {len(path) for path in paths} == {3}
+
+    def test_that_project_is_written(self, tmp_path):
+        site = generate_site(tmp_path, SyntheticSiteOptions(page_count=30, nav_depth=3, palette="dark"))
+        config_data = yaml.safe_load(site.config_file.read_text(encoding="utf-8"))
+        assert config_data["theme"]["palette"] == "dark"
+        assert "navigation.side.indexes" in config_data["theme"]["features"]
+        assert get_nav_depth(site.nav) == 2
+        assert len(list(site.docs_dir.rglob("*.md"))) == site.page_count
+
+    def test_that_section_indexes_can_be_disabled(self, tmp_path):
+        site = generate_site(tmp_path, SyntheticSiteOptions(page_count=30, nav_depth=3, section_indexes=False))
+        assert site.page_count == 30
+        assert not list(site.docs_dir.glob("section-*/index.md"))
+
+    def test_that_invalid_tile_placement_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            generate_site(tmp_path, SyntheticSiteOptions(tiles_per_page=1, tile_placement="sideways"))
+
+    @pytest.mark.parametrize("tile_placement", ["after", "first", TILES_INLINE])
+    def test_that_generated_site_builds_with_tiles(self, tmp_path, tile_placement):
+        options = SyntheticSiteOptions(page_count=12, nav_depth=2, tiles_per_page=3, tile_placement=tile_placement)
+        site = generate_site(tmp_path / "project", options)
+        site_dir = tmp_path / "site"
+        build(load_site_config(site, site_dir))
+        soup = BeautifulSoup((site_dir / "section-0" / "page-1" / "index.html").read_text(encoding="utf-8"), "html.parser")
+        tiles = soup.select(".terminal-mkdocs-tile")
+        assert len(tiles) == 3
+        image = soup.select_one(".terminal-mkdocs-tile img")
+        assert (site_dir / "section-0" / "page-1" / image["src"]).resolve() == (site_dir / "img" / "tile.svg").resolve()
@@ -38,3 +38,10 @@ class TestTileImage():
             image_macro.module.make_image(all_integer_tile)
         except Exception as ex:
             pytest.fail(f"Got exception during render: {ex}")
+
+    def test_that_adaptive_image_keeps_lazy_src(self, image_macro, minimal_image_tile):
+        rendered_image = image_macro.module.make_image(minimal_image_tile, "true")
+        assert "src=\"" + defaults.GITHUB_IMG_SRC + "\"" in rendered_image
+        assert "loading=\"lazy\"" in rendered_image
+        assert "data-terminal-optional" in rendered_image
+        assert "data-terminal-src" not in rendered_image